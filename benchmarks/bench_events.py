@@ -0,0 +1,61 @@
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Run from project root: python benchmarks/bench_events.py [N]
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "backend"))
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "generators"))
+
+from events import EVENT_TYPES  # noqa: E402
+import sim_engine  # noqa: E402
+
+GENERATORS = {
+    "finance": sim_engine.generate_finance,
+    "healthcare": sim_engine.generate_health,
+    "dev": sim_engine.generate_dev,
+}
+
+
+def measure(build):
+    # Timed pass without tracing (tracemalloc skews throughput), then a traced pass
+    t0 = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    held = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held, elapsed, current
+
+
+def run(n: int):
+    print(f"Event record benchmark: {n:,} events per domain\n")
+    print(f"{'domain':<12}{'repr':<8}{'parse/s':>14}{'bytes/event':>14}{'dump/s':>14}")
+    for domain, gen in GENERATORS.items():
+        lines = [json.dumps(gen(force_critical=(i % 50 == 0), is_chaos=True)) for i in range(n)]
+        cls = EVENT_TYPES[domain]
+
+        dicts, t_dict, m_dict = measure(lambda: [json.loads(l) for l in lines])
+        recs, t_rec, m_rec = measure(lambda: [cls.from_json(l) for l in lines])
+
+        # Lossless round trip against the wire format
+        for d, r in zip(dicts, recs):
+            assert r.to_dict() == d, (d, r.to_dict())
+
+        t0 = time.perf_counter()
+        for d in dicts:
+            json.dumps(d)
+        dump_dict = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for r in recs:
+            r.to_json()
+        dump_rec = time.perf_counter() - t0
+
+        print(f"{domain:<12}{'dict':<8}{n / t_dict:>14,.0f}{m_dict / n:>14,.1f}{n / dump_dict:>14,.0f}")
+        print(f"{'':<12}{'slots':<8}{n / t_rec:>14,.0f}{m_rec / n:>14,.1f}{n / dump_rec:>14,.0f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,70 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Run from project root: python benchmarks/bench_feed_mux.py [feeds ...]
+# Cost of one poll cycle of the multiplexed feed reader as the number of feed files
+# grows (default: 3, 30, 300 and 1000), with a single feed receiving a line per cycle:
+#   inotify   only the changed file is touched, so the cost stays flat
+#   stat      fallback without inotify: one stat() per followed feed per cycle
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "backend"))
+
+import feeds  # noqa: E402
+from domains import DOMAINS, domain_for_feed  # noqa: E402
+
+CYCLES = 2000
+LINE = b'{"timestamp": "2026-01-01T00:00:00", "type": "syslog", "service": "S", "level": "INFO", "message": "ok"}\n'
+
+
+def setup(work: str, n: int):
+    names = [d.feed_stem for d in DOMAINS.values()]
+    paths = []
+    for i in range(n):
+        path = os.path.join(work, f"{names[i % len(names)]}-{i:04d}.jsonl")
+        open(path, "wb").close()
+        paths.append(path)
+    return paths
+
+
+def bench(work: str, paths, use_inotify: bool):
+    mux = feeds.FeedMux(resolve=domain_for_feed)
+    if use_inotify and mux.fileno() is None:
+        return None  # inotify unavailable on this platform
+    if not use_inotify:
+        mux.close()  # No descriptor: stat() fallback
+    mux.follow(work)
+    mux.poll()
+    hot = paths[0]
+    lines = 0
+    t0 = time.perf_counter()
+    with open(hot, "ab", buffering=0) as f:
+        for _ in range(CYCLES):
+            f.write(LINE)
+            for _, _, new in mux.poll():
+                lines += len(new)
+    elapsed = time.perf_counter() - t0
+    mux.close()
+    assert lines == CYCLES, lines
+    return elapsed / CYCLES
+
+
+def run(sizes):
+    print(f"Feed multiplexer benchmark: {CYCLES:,} poll cycles, one active feed\n")
+    print(f"{'feeds':>6} {'inotify':>12} {'stat':>12}")
+    for n in sizes:
+        work = tempfile.mkdtemp(prefix="synaptix-feeds-")
+        paths = setup(work, n)
+        results = []
+        for use_inotify in (True, False):
+            results.append(bench(work, paths, use_inotify))
+            for path in paths:
+                open(path, "wb").close()
+        cells = [f"{r * 1e6:>9.1f} us" if r is not None else f"{'n/a':>12}" for r in results]
+        print(f"{n:>6,} {cells[0]} {cells[1]}")
+        shutil.rmtree(work)
+
+
+if __name__ == "__main__":
+    run([int(a) for a in sys.argv[1:]] or [3, 30, 300, 1000])
@@ -0,0 +1,77 @@
+import heapq
+import os
+import sys
+import time
+
+# Run from project root: python benchmarks/bench_fleet.py [patients]
+# 1) Scheduler cost per event: heapq (one push/pop per event) vs the timer wheel
+#    (whole arrays of entities per tick), same population and rates.
+# 2) End-to-end fleet throughput in unthrottled virtual-clock mode (schedule +
+#    state machines + batch generation + NDJSON encoding, no disk writes).
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "generators"))
+
+import numpy as np  # noqa: E402
+import sim_engine  # noqa: E402
+
+
+def bench_heap(rates, horizon, rng):
+    # Intervals are pre-drawn so only the scheduling itself is timed
+    mean = (1.0 / rates).tolist()
+    draws = rng.standard_exponential(int(rates.sum() * horizon * 1.2)).tolist()
+    heap = [(t, i) for i, t in enumerate(rng.exponential(1.0 / rates).tolist())]
+    heapq.heapify(heap)
+    events = 0
+    t0 = time.perf_counter()
+    while heap[0][0] < horizon:
+        t, i = heap[0]
+        heapq.heapreplace(heap, (t + draws[events] * mean[i], i))
+        events += 1
+    return events, time.perf_counter() - t0
+
+
+def bench_wheel(rates, horizon, rng, tick=0.01):
+    n = rates.size
+    wheel = sim_engine.TimerWheel(n, tick)
+    next_at = rng.exponential(1.0 / rates)
+    wheel.schedule(np.arange(n), next_at)
+    events = 0
+    t0 = time.perf_counter()
+    for _ in range(int(horizon / tick)):
+        ids = wheel.expire()
+        if ids.size:
+            next_at[ids] += rng.exponential(1.0 / rates[ids])
+            wheel.schedule(ids, next_at[ids])
+            events += ids.size
+    return events, time.perf_counter() - t0
+
+
+def bench_fleet(patients, symbols, services, horizon=30.0, tick=0.01, frame=0.1):
+    fleet = sim_engine.build_fleet(patients, symbols, services, crisis_every=600.0, tick=tick, seed=1)
+    start_us = np.datetime64("2026-01-01T00:00:00", "us")
+    events = nbytes = 0
+    t0 = time.perf_counter()
+    for _ in range(int(horizon / frame)):
+        for batch in sim_engine.step_fleet(fleet, round(frame / tick), start_us).values():
+            events += batch["timestamp"].size
+            nbytes += len(sim_engine.encode_ndjson(batch))
+    return events, nbytes, time.perf_counter() - t0
+
+
+def run(patients: int):
+    rng = np.random.default_rng(0)
+    rates = rng.lognormal(np.log(0.2), 0.5, patients)
+    horizon = 20.0
+    print(f"Fleet scheduler benchmark: {patients:,} entities, {horizon:.0f} virtual seconds\n")
+    for name, fn in (("heapq", bench_heap), ("timer wheel", bench_wheel)):
+        events, elapsed = fn(rates, horizon, np.random.default_rng(1))
+        print(f"{name:<12} {events:>10,} events  {events / elapsed:>12,.0f} events/s  {elapsed / events * 1e9:>7.0f} ns/event")
+
+    symbols, services = patients // 10, patients // 50
+    events, nbytes, elapsed = bench_fleet(patients, symbols, services)
+    print(f"\nfull fleet ({symbols:,} symbols, {patients:,} patients, {services:,} services), 30 virtual s:")
+    print(f"  {events:,} events in {elapsed:.2f} s = {events / elapsed:,.0f} events/s "
+          f"({nbytes / elapsed / 1e6:.0f} MB/s NDJSON), {events / 30 / (events / elapsed):.2f} s wall per virtual s")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
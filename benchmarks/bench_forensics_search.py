@@ -0,0 +1,89 @@
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Run from project root: python benchmarks/bench_forensics_search.py [N]
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "backend"))
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "generators"))
+
+import numpy as np  # noqa: E402
+from forensics import ForensicIndex  # noqa: E402
+import sim_engine  # noqa: E402
+
+
+def synth_decision(rng: random.Random, ts: datetime):
+    # agent_stream.jsonl records in the shape the engines write
+    domain = rng.choice(["finance", "healthcare", "dev"])
+    if domain == "finance":
+        sym, news, _ = rng.choice(sim_engine.FINANCE_CRISES)
+        event, action = f"Symbol: {sym} | Price: {rng.uniform(100, 1500):.2f} | News: {news}", f"ACTION: HALT {sym}"
+    elif domain == "healthcare":
+        code, note, _, _ = rng.choice(sim_engine.MEDICAL_EMERGENCIES)
+        event, action = f"Patient: P-{rng.randint(100, 999)} | Status: CRITICAL | Notes: {note}", f"ACTION: TREAT {code}"
+    else:
+        svc, msg = rng.choice(sim_engine.TECH_DISASTERS)
+        event, action = f"Service: {svc} | Level: FATAL | Msg: {msg}", f"ACTION: ROLLBACK {svc}"
+    return {"timestamp": ts.isoformat(), "domain": domain, "source_event": event, "ai_response": action}
+
+
+def timed(index, n_queries, **kwargs):
+    times = []
+    for _ in range(n_queries):
+        t0 = time.perf_counter()
+        page = index.search(**kwargs)
+        times.append(time.perf_counter() - t0)
+    times = np.array(times) * 1000
+    return page, np.percentile(times, 50), np.percentile(times, 99)
+
+
+def run(n: int, n_queries=200):
+    rng = random.Random(7)
+    work = tempfile.mkdtemp(prefix="synaptix-forensics-")
+    stream = os.path.join(work, "agent_stream.jsonl")
+    start = datetime.now() - timedelta(days=30)
+    step = timedelta(days=30) / n
+    with open(stream, "w", encoding="utf-8") as f:
+        for i in range(n):
+            f.write(json.dumps(synth_decision(rng, start + step * i)) + "\n")
+
+    index = ForensicIndex(os.path.join(work, "forensics.db"))
+    t0 = time.perf_counter()
+    while index.ingest(stream):
+        pass
+    ingest_s = time.perf_counter() - t0
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    week = (datetime.now() - timedelta(days=7)).isoformat()
+    cases = [
+        ("recent decisions", {}),
+        ("'sepsis' all time", {"q": "sepsis"}),
+        ("'sepsis' last week", {"q": "sepsis", "domain": "healthcare", "since": week}),
+        ("prefix 'halt*'", {"q": "halt*", "domain": "finance"}),
+        ("entity P-500", {"entity": "P-500"}),
+    ]
+    print(f"Forensic search benchmark: {n:,} decisions, {n_queries} queries per case\n")
+    print(f"ingest              {n / ingest_s:>12,.0f} decisions/s ({ingest_s:.2f} s)")
+    print(f"db size             {os.path.getsize(index.db_path) / 1e6:>12.1f} MB   peak RSS {rss_mb:.0f} MB\n")
+    for label, kwargs in cases:
+        page, p50, p99 = timed(index, n_queries, limit=50, **kwargs)
+        print(f"{label:<20} p50 {p50:>7.2f} ms   p99 {p99:>7.2f} ms   ({len(page['results'])} hits on page 1)")
+
+    # Walk deep pages with the cursor: cost should not grow with page depth
+    cursor, pages = None, 0
+    t0 = time.perf_counter()
+    while pages < 100:
+        page = index.search(q="sepsis", limit=50, cursor=cursor)
+        pages += 1
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    print(f"{'cursor walk':<20} {(time.perf_counter() - t0) * 1000 / pages:>11.2f} ms/page over {pages} pages")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
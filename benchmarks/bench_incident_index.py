@@ -0,0 +1,138 @@
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+# Run from project root: python benchmarks/bench_incident_index.py [N] [--real]
+# Decisions are split 80/20: the index holds the first part, the held-out part is
+# queried, and a recalled answer counts as correct when it matches the held-out
+# decision's own label. Without --real, decisions are synthesised: each crisis
+# scenario has one canonical action, with 10% replaced by a paraphrase (LLM
+# variability), on contexts with per-entity noise. With --real, the decisions in
+# data/agent_stream.jsonl are used as-is.
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "backend"))
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "generators"))
+
+import numpy as np  # noqa: E402
+from incidents import IncidentIndex  # noqa: E402
+from pw_engine import AGENT_OUTPUT, RECALL_THRESHOLD  # noqa: E402
+from responses import SKIP_RESPONSES, LEARNABLE_SOURCES  # noqa: E402
+import sim_engine  # noqa: E402
+
+
+def synth_decisions(n, rng: random.Random):
+    scenarios = (
+        [("finance", lambda s=s, news=news: f"Symbol: {s} | Price: {rng.uniform(100, 1500):.2f} | News: {news}", f"ACTION: Halt {s}")
+         for s, news, _ in sim_engine.FINANCE_CRISES]
+        + [("healthcare", lambda note=note: f"Patient: P-{rng.randint(100, 99999)} | Status: CRITICAL | Notes: {note}", f"ACTION: Treat {c}")
+           for c, note, _, _ in sim_engine.MEDICAL_EMERGENCIES]
+        + [("dev", lambda svc=svc, msg=msg: f"Service: {svc}-{rng.randint(1, 500)} | Level: FATAL | Msg: {msg}", f"ACTION: Remediate {svc}")
+           for svc, msg in sim_engine.TECH_DISASTERS]
+    )
+    out = []
+    for _ in range(n):
+        domain, context, action = rng.choice(scenarios)
+        if rng.random() < 0.1:
+            action = f"{action} (variant {rng.randint(1, 3)})"
+        out.append((domain, context(), action))
+    return out
+
+
+def real_decisions():
+    import json
+    out = []
+    with open(AGENT_OUTPUT, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            response = rec.get("ai_response") or ""
+            if rec.get("answered_by", LEARNABLE_SOURCES[0]) not in LEARNABLE_SOURCES:
+                continue
+            if rec.get("source_event") and response and not response.startswith(SKIP_RESPONSES):
+                out.append((rec.get("domain", ""), rec["source_event"], response))
+    return out
+
+
+def latency(index, queries, k=5):
+    times = []
+    results = []
+    for domain, ctx, _ in queries:
+        t0 = time.perf_counter()
+        results.append(index.search(ctx, domain=domain, k=k))
+        times.append(time.perf_counter() - t0)
+    times = np.array(times) * 1e6
+    return results, np.percentile(times, 50), np.percentile(times, 99)
+
+
+def run(n: int, real: bool, n_queries=1000):
+    decisions = real_decisions() if real else synth_decisions(n, random.Random(3))
+    order = np.random.default_rng(0).permutation(len(decisions))
+    cut = int(len(decisions) * 0.8)
+    indexed = [decisions[i] for i in order[:cut]]
+    held_out = [decisions[i] for i in order[cut:]]
+    queries = held_out[:n_queries]
+
+    work = tempfile.mkdtemp(prefix="synaptix-index-")
+    flat = IncidentIndex(os.path.join(work, "flat"))
+    ivf = IncidentIndex(os.path.join(work, "ivf"), mode="ivf", nprobe=8)
+
+    t0 = time.perf_counter()
+    for domain, ctx, resp in indexed:
+        flat.add(domain, ctx, resp)
+    add_rate = len(indexed) / (time.perf_counter() - t0)
+    half = len(indexed) // 2
+    for domain, ctx, resp in indexed[:half]:
+        ivf.add(domain, ctx, resp)
+    ivf.train()
+    t0 = time.perf_counter()
+    for domain, ctx, resp in indexed[half:]:
+        ivf.add(domain, ctx, resp)
+    ivf_add_rate = (len(indexed) - half) / (time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    ivf.train()
+    train_s = time.perf_counter() - t0
+
+    exact, f50, f99 = latency(flat, queries)
+    approx, i50, i99 = latency(ivf, queries)
+
+    # Searches keep being served from the old clusters while a retrain runs
+    retrain = threading.Thread(target=ivf.train)
+    retrain.start()
+    during = []
+    while retrain.is_alive():
+        domain, ctx, _ = queries[len(during) % len(queries)]
+        t0 = time.perf_counter()
+        ivf.search(ctx, domain=domain)
+        during.append(time.perf_counter() - t0)
+    retrain.join()
+    during = np.array(during or [0.0]) * 1e6
+
+    recall = np.mean([
+        len({m["source_event"] for _, m in a} & {m["source_event"] for _, m in e}) / max(1, len(e))
+        for a, e in zip(approx, exact)
+    ])
+
+    print(f"Incident index benchmark: {len(indexed):,} indexed / {len(queries):,} held-out decisions, "
+          f"dim={flat.dim} ({'real' if real else 'synthetic'} data)\n")
+    print(f"add throughput      {add_rate:>12,.0f} /s   (ivf, trained: {ivf_add_rate:,.0f} /s)")
+    print(f"ivf train           {train_s * 1000:>12.1f} ms ({len(ivf.ivf[0])} lists, nprobe={ivf.nprobe}, background)")
+    print(f"flat top-5 latency  p50 {f50:>8.0f} us   p99 {f99:>8.0f} us")
+    print(f"ivf  top-5 latency  p50 {i50:>8.0f} us   p99 {i99:>8.0f} us   "
+          f"(during retrain: p50 {np.percentile(during, 50):.0f} us, p99 {np.percentile(during, 99):.0f} us)")
+    print(f"ivf recall@5 vs flat {recall:>11.3f}")
+    print(f"\n{'threshold':>10}{'answered':>10}{'accuracy':>10}   (agreement with the held-out decision; rest goes to the LLM)")
+    for threshold in sorted({0.9, RECALL_THRESHOLD}):
+        answered = [(hits[0][1]["ai_response"], label) for (_, _, label), hits in zip(queries, exact)
+                    if hits and hits[0][0] >= threshold]
+        acc = sum(p == l for p, l in answered) / max(1, len(answered))
+        mark = "  <- runtime (SYNAPTIX_RECALL_THRESHOLD)" if threshold == RECALL_THRESHOLD else ""
+        print(f"{threshold:>10.2f}{len(answered) / len(queries):>10.1%}{acc:>10.1%}{mark}")
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    run(int(args[0]) if args else 25_000, "--real" in sys.argv)
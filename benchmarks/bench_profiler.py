@@ -0,0 +1,71 @@
+import json
+import os
+import sys
+import threading
+import time
+
+# Run from project root: python benchmarks/bench_profiler.py [events]
+# Overhead of the profiling surface on a parse + filter workload like the mock engine's:
+#   baseline          no profiler
+#   sampler @ N Hz    profile() running in a background thread for the whole run
+#   stage() per call  one stage timer around every event (worst case; the engines
+#                     time whole batches)
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "backend"))
+
+import profiler  # noqa: E402
+from domains import DOMAINS  # noqa: E402
+
+
+def make_lines(n: int):
+    return [json.dumps({"timestamp": f"2026-01-01T00:00:{i % 60:02d}", "type": "vitals", "patient_id": f"P-{i % 500}",
+                        "bpm": 60 + i % 90, "spo2": 90 + i % 10, "status": "CRITICAL" if i % 20 == 0 else "NORMAL",
+                        "notes": "routine check"}) for i in range(n)]
+
+
+def workload(lines, per_event_stage=False):
+    d = DOMAINS["healthcare"]
+    alerts = 0
+    for line in lines:
+        if per_event_stage:
+            with profiler.stage("parse"):
+                data = json.loads(line)
+        else:
+            data = json.loads(line)
+        if d.critical(data):
+            d.context(data)
+            alerts += 1
+    return alerts
+
+
+def timed(lines, **kw):
+    best = float("inf")
+    for _ in range(5):
+        t0 = time.perf_counter()
+        workload(lines, **kw)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(n: int):
+    lines = make_lines(n)
+    print(f"Profiler overhead benchmark: {n:,} events (parse + filter + format)\n")
+    workload(lines)  # Warm-up
+    base = timed(lines)
+    print(f"{'baseline':<22} {base * 1000:>9.1f} ms")
+    for hz in (100, 200, 1000):
+        # Each run gets its own short profile so the sampler is active throughout
+        result = {}
+        sampler = threading.Thread(target=lambda: result.update(profiler.profile(base * 6 + 0.5, interval=1.0 / hz)))
+        sampler.start()
+        time.sleep(0.02)
+        elapsed = timed(lines)
+        sampler.join()
+        print(f"{'sampler @ ' + str(hz) + ' Hz':<22} {elapsed * 1000:>9.1f} ms  {(elapsed / base - 1) * 100:>+6.1f}%  "
+              f"({result['samples']:,} samples, {len(result['stacks'])} stacks)")
+    elapsed = timed(lines, per_event_stage=True)
+    print(f"{'stage() per event':<22} {elapsed * 1000:>9.1f} ms  {(elapsed / base - 1) * 100:>+6.1f}%  "
+          f"({(elapsed - base) / n * 1e9:.0f} ns per stage)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,106 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Run from project root: python benchmarks/bench_recovery.py [events per feed ...]
+# Engine restart cost vs history size (default: 10k, 50k and 200k events per feed):
+#   cold replay       no saved state: every feed is re-read from byte 0 and every
+#                     historical critical event goes back to the LLM
+#   snapshot restore  saved offsets + decision memo: only the lines after the last
+#                     checkpoint are re-read, and those are answered from the memo
+# Runs the mock engine's recovery path (offsets + memo); Pathway's own snapshots use
+# the same memo for the events it re-reads after its last snapshot.
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "backend"))
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "generators"))
+
+import numpy as np  # noqa: E402
+import pw_engine  # noqa: E402
+import sim_engine  # noqa: E402
+from domains import DOMAINS, domain_for_feed  # noqa: E402
+from feeds import FeedMux  # noqa: E402
+
+FEEDS = {"finance": "finance", "healthcare": "healthcare", "dev": "developer"}  # domain -> generator
+UNCHECKPOINTED = 0.01  # Fraction of history written after the last checkpoint
+LLM_SECONDS = 1.0      # Assumed remote LLM latency, for the projected replay cost
+llm_calls = 0
+
+
+def stub_llm(context: str, domain: str):
+    global llm_calls
+    llm_calls += 1
+    return f"ACTION: contain ({context.split('|')[0].strip()})", "llm"
+
+
+def setup(work: str, n: int):
+    # Feeds with a checkpoint at (1 - UNCHECKPOINTED) of their lines
+    data_dir = os.path.join(work, "data", "live_feed")
+    os.makedirs(data_dir)
+    pw_engine.DATA_DIR = data_dir
+    pw_engine.AGENT_OUTPUT = os.path.join(work, "data", "agent_stream.jsonl")
+    pw_engine.STATE_DIR = os.path.join(work, "data", "engine_state")
+    pw_engine.MOCK_OFFSETS = os.path.join(pw_engine.STATE_DIR, "mock_offsets.json")
+    pw_engine.DECISION_MEMO = os.path.join(pw_engine.STATE_DIR, "decision_memo.db")
+    rng = np.random.default_rng(5)
+    checkpoint = {}
+    for domain, generator in FEEDS.items():
+        path = os.path.join(data_dir, DOMAINS[domain].feed)
+        head = int(n * (1 - UNCHECKPOINTED))
+        with open(path, "wb") as f:
+            for size in (head, n - head):
+                f.write(sim_engine.encode_ndjson(
+                    sim_engine.BATCH_GENERATORS[generator](size, is_chaos=True, crisis_rate=0.02, rng=rng)))
+                checkpoint.setdefault(path, (os.fstat(f.fileno()).st_ino, f.tell()))
+    return data_dir, checkpoint
+
+
+def restart():
+    # A fresh process: nothing cached in memory
+    if pw_engine._decision_memo:
+        pw_engine._decision_memo.close()
+    pw_engine._decision_memo = None
+
+
+def drain(data_dir, start):
+    mux = FeedMux(resolve=domain_for_feed, start=start)
+    mux.follow(data_dir)
+    while pw_engine.poll_feeds(mux, verbose=False):
+        pass
+    mux.close()
+
+
+def run(sizes):
+    global llm_calls
+    pw_engine.decide = stub_llm
+    print("Engine recovery benchmark (mock engine offsets + decision memo)\n")
+    print(f"{'events/feed':>12} {'mode':<17} {'time':>9} {'LLM calls':>10} {'+ LLM @ 1 s':>12}")
+    for n in sizes:
+        work = tempfile.mkdtemp(prefix="synaptix-recovery-")
+        data_dir, checkpoint = setup(work, n)
+
+        # Cold replay: no state, everything from the start
+        restart()
+        llm_calls = 0
+        t0 = time.perf_counter()
+        drain(data_dir, lambda path, size: 0)
+        cold = time.perf_counter() - t0
+        cold_calls = llm_calls
+
+        # Crash after the checkpoint: offsets point before the last UNCHECKPOINTED lines
+        pw_engine.save_mock_offsets(checkpoint)
+        restart()
+        llm_calls = 0
+        t0 = time.perf_counter()
+        drain(data_dir, pw_engine.mock_start(pw_engine.load_mock_offsets()))
+        restore = time.perf_counter() - t0
+
+        print(f"{n:>12,} {'cold replay':<17} {cold:>8.2f}s {cold_calls:>10,} {cold + cold_calls * LLM_SECONDS:>11,.0f}s")
+        print(f"{'':>12} {'snapshot restore':<17} {restore:>8.2f}s {llm_calls:>10,} "
+              f"{restore + llm_calls * LLM_SECONDS:>11,.2f}s")
+        restart()
+        shutil.rmtree(work)
+
+
+if __name__ == "__main__":
+    run([int(a) for a in sys.argv[1:]] or [10_000, 50_000, 200_000])
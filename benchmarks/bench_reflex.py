@@ -0,0 +1,71 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Run from project root: python benchmarks/bench_reflex.py [N] [--real]
+# Without --real, decisions are synthesised: each crisis scenario has one canonical
+# action, with 10% of decisions replaced by a paraphrase (LLM variability).
+# With --real, data/agent_stream.jsonl and the audit CSVs are used as-is.
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "backend"))
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "generators"))
+
+import numpy as np  # noqa: E402
+import reflex  # noqa: E402
+import sim_engine  # noqa: E402
+
+
+def synth_decisions(n, rng: random.Random):
+    scenarios = (
+        [("finance", f"Symbol: {s} | Price: {{p}} | News: {news}", f"ACTION: Halt {s}") for s, news, _ in sim_engine.FINANCE_CRISES]
+        + [("healthcare", f"Patient: {{e}} | Status: CRITICAL | Notes: {note}", f"ACTION: Treat {c}") for c, note, _, _ in sim_engine.MEDICAL_EMERGENCIES]
+        + [("dev", f"Service: {svc} | Level: FATAL | Msg: {msg}", f"ACTION: Remediate {svc}") for svc, msg in sim_engine.TECH_DISASTERS]
+    )
+    out = []
+    for _ in range(n):
+        domain, template, action = rng.choice(scenarios)
+        context = template.format(p=f"{rng.uniform(1, 1500):.2f}", e=f"P-{rng.randint(100, 999)}")
+        if rng.random() < 0.1:
+            action = f"{action} {rng.choice(('Now', 'Immediately', 'At Once'))}"
+        out.append((reflex.model_text(domain, context), reflex.normalise_action(action)))
+    return out
+
+
+def run(n: int, real: bool):
+    examples = reflex.load_examples() if real else synth_decisions(n, random.Random(5))
+    rng = np.random.default_rng(0)
+    order = rng.permutation(len(examples))
+    cut = int(len(examples) * 0.8)
+    train_set = [examples[i] for i in order[:cut]]
+    test_set = [examples[i] for i in order[cut:]]
+
+    t0 = time.perf_counter()
+    model = reflex.train(train_set)
+    train_s = time.perf_counter() - t0
+
+    # Round-trip through a published artifact, as the engines load it
+    path = reflex.publish(model, tempfile.mkdtemp(prefix="synaptix-reflex-"))
+    model = reflex.ReflexModel.load(path)
+
+    preds, times = [], []
+    for text, _ in test_set:
+        t0 = time.perf_counter()
+        preds.append(model.predict(text))
+        times.append(time.perf_counter() - t0)
+    times = np.array(times) * 1e6
+
+    print(f"Reflex classifier benchmark: {len(train_set):,} train / {len(test_set):,} held-out decisions, "
+          f"{len(model.classes)} actions ({'real' if real else 'synthetic'} data)\n")
+    print(f"training            {train_s:>10.2f} s")
+    print(f"latency             p50 {np.percentile(times, 50):>6.0f} us   p99 {np.percentile(times, 99):>6.0f} us")
+    print(f"\n{'threshold':>10}{'answered':>10}{'accuracy':>10}   (agreement with the LLM decision; rest escalates)")
+    for threshold in (0.0, 0.5, 0.7, 0.9, 0.95):
+        answered = [(p, l) for (p, c), (_, l) in zip(preds, test_set) if c >= threshold]
+        acc = sum(p == l for p, l in answered) / max(1, len(answered))
+        print(f"{threshold:>10.2f}{len(answered) / len(test_set):>10.1%}{acc:>10.1%}")
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    run(int(args[0]) if args else 5_000, "--real" in sys.argv)
@@ -0,0 +1,54 @@
+import json
+import os
+import sys
+import time
+
+# Run from project root: python benchmarks/bench_sim_batch.py [N]
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "generators"))
+
+import numpy as np  # noqa: E402
+import sim_engine  # noqa: E402
+
+SCALAR = {
+    "finance": sim_engine.generate_finance,
+    "healthcare": sim_engine.generate_health,
+    "developer": sim_engine.generate_dev,
+}
+
+
+def check(batch, buf):
+    # Encoded rows must parse back to exactly the columnar values, with no padding
+    assert b" ," not in buf and b":  " not in buf
+    rows = [json.loads(l) for l in buf.decode("utf-8").splitlines()]
+    for name, col in batch.items():
+        if name in ("timestamp", "type"):
+            continue
+        assert [r[name] for r in rows] == col.tolist(), name
+
+
+def run(n: int):
+    rng = np.random.default_rng(7)
+    print(f"Batch generator benchmark: {n:,} events per domain (chaos, 1% crisis rate)\n")
+    print(f"{'domain':<12}{'scalar ev/s':>14}{'columnar ev/s':>16}{'ndjson ev/s':>14}{'MB/s':>10}{'bytes/ev':>10}")
+    for domain, gen_batch in sim_engine.BATCH_GENERATORS.items():
+        gen = SCALAR[domain]
+        m = min(n, 50_000)
+        t0 = time.perf_counter()
+        for _ in range(m):
+            json.dumps(gen(force_critical=False, is_chaos=True))
+        scalar = m / (time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        batch = gen_batch(n, is_chaos=True, crisis_rate=0.01, rng=rng)
+        columnar = n / (time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        buf = sim_engine.encode_ndjson(gen_batch(n, is_chaos=True, crisis_rate=0.01, rng=rng))
+        elapsed = time.perf_counter() - t0
+
+        check(batch, sim_engine.encode_ndjson(batch))
+        print(f"{domain:<12}{scalar:>14,.0f}{columnar:>16,.0f}{n / elapsed:>14,.0f}{len(buf) / elapsed / 1e6:>10,.1f}{len(buf) / n:>10,.1f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,124 @@
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+# Run from project root: python benchmarks/bench_startup.py [history MB ...]
+# Measures cold start of each process in start.sh against a synthetic history of
+# the given size per feed (default: 0, 16 and 64 MB).
+REPO = os.getcwd()
+sys.path.insert(0, os.path.join(REPO, "src", "generators"))
+
+import numpy as np  # noqa: E402
+import sim_engine  # noqa: E402
+
+FEEDS = {"finance": "finance.jsonl", "healthcare": "healthcare.jsonl", "developer": "developer.jsonl"}
+ENV = dict(os.environ, PYTHONUNBUFFERED="1")
+
+
+def make_workdir(history_mb: int) -> str:
+    work = tempfile.mkdtemp(prefix="synaptix-startup-")
+    os.symlink(os.path.join(REPO, "src"), os.path.join(work, "src"))
+    feed_dir = os.path.join(work, "data", "live_feed")
+    os.makedirs(feed_dir)
+    rng = np.random.default_rng(1)
+    for domain, name in FEEDS.items():
+        with open(os.path.join(feed_dir, name), "wb") as f:
+            written = 0
+            while written < history_mb * 1024 * 1024:
+                buf = sim_engine.encode_ndjson(
+                    sim_engine.BATCH_GENERATORS[domain](50_000, is_chaos=True, crisis_rate=0.01, rng=rng))
+                f.write(buf)
+                written += len(buf)
+    open(os.path.join(work, "data", "agent_stream.jsonl"), "w").close()
+    return work
+
+
+def wait_for_line(proc, marker: str, timeout=60.0) -> float:
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < timeout:
+        line = proc.stdout.readline()
+        if not line:
+            break
+        if marker in line:
+            return time.perf_counter() - t0
+    return float("nan")
+
+
+def time_import(work: str, path: str, module: str) -> float:
+    code = f"import sys; sys.path.insert(0, {path!r}); import {module}"
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=work, env=ENV, check=True, capture_output=True)
+    return time.perf_counter() - t0
+
+
+def time_engine(work: str) -> float:
+    t0 = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "src/backend/pw_engine.py"], cwd=work, env=ENV,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    try:
+        wait_for_line(proc, "Monitoring live streams")
+        return time.perf_counter() - t0
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def time_api(work: str):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    t0 = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "src/backend/main.py"], cwd=work, env=dict(ENV, PORT=str(port)),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    results = {}
+    try:
+        while len(results) < 2 and time.perf_counter() - t0 < 120:
+            for path in ("/health", "/ready"):
+                if path in results:
+                    continue
+                try:
+                    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=1) as r:
+                        if r.status == 200:
+                            results[path] = time.perf_counter() - t0
+                except (urllib.error.URLError, ConnectionError, OSError):
+                    pass
+            time.sleep(0.01)
+        return results.get("/health", float("nan")), results.get("/ready", float("nan"))
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def time_sim(work: str) -> float:
+    t0 = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "src/generators/sim_engine.py"], cwd=work, env=ENV,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    try:
+        wait_for_line(proc, "SYSTEM RESET")
+        return time.perf_counter() - t0
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def run(sizes):
+    print(f"{'history/feed':>12}{'engine import':>15}{'engine up':>11}{'api import':>12}"
+          f"{'api /health':>13}{'api /ready':>12}{'sim up':>9}")
+    for mb in sizes:
+        work = make_workdir(mb)
+        engine_import = time_import(work, "src/backend", "pw_engine")
+        engine_up = time_engine(work)
+        api_import = time_import(work, "src/backend", "main")
+        health, ready = time_api(work)
+        sim_up = time_sim(work)  # last: the simulator truncates the feeds
+        print(f"{mb:>10}MB{engine_import:>14.3f}s{engine_up:>10.3f}s{api_import:>11.3f}s"
+              f"{health:>12.3f}s{ready:>11.3f}s{sim_up:>8.3f}s")
+
+
+if __name__ == "__main__":
+    run([int(a) for a in sys.argv[1:]] or [0, 16, 64])
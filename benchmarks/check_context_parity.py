@@ -0,0 +1,48 @@
+import os
+import sys
+
+# Run from project root: python benchmarks/check_context_parity.py   (needs pathway)
+# Both engines must produce the same LLM context for the same event: it keys the
+# decision memo, the incident index and forensic matches. Evaluates every built-in
+# domain's Pathway expressions (critical_expr / context_expr) on real Pathway and
+# compares them with the Python predicate / formatter the mock engine runs, over the
+# domain's scenarios plus awkward float values (ints, exponents, repeating decimals).
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "backend"))
+
+import pathway as pw  # noqa: E402
+from domains import DOMAINS  # noqa: E402
+
+ODD_FLOATS = (0, 0.0, 12000, 12000.0, 450.2, 1e-05, 1.5e16, 1 / 3, -99.99, 123456789.125)
+
+
+def samples(domain):
+    payloads = list(domain.scenarios) + [domain.recovery]
+    floats = [f for f, typ in domain.schema.items() if typ is float]
+    for value in ODD_FLOATS:
+        for f in floats:
+            payloads.append({**payloads[0], f: value})
+    return [domain.event_payload(p, f"2026-01-01T00:00:{i:02d}") for i, p in enumerate(payloads)]
+
+
+def check(domain):
+    if domain.context_expr is None:
+        return 0
+    payloads = samples(domain)
+    fields = list(domain.schema)
+    rows = [tuple(typ(p[f]) for f, typ in domain.schema.items()) for p in payloads]
+    table = pw.debug.table_from_rows(pw.schema_from_types(**domain.schema), rows)
+    crit = domain.critical_expr(pw.this) if domain.critical_expr is not None else True
+    out = table.select(pw.this.timestamp, critical=crit, context=domain.context_expr(pw.this))
+    got = {r.timestamp: (r.critical, r.context) for r in pw.debug.table_to_pandas(out).itertuples()}
+    failures = 0
+    for p in payloads:
+        want = (domain.critical(p), domain.context(p))
+        if got[p["timestamp"]] != want:
+            failures += 1
+            print(f"  MISMATCH {domain.name}: pathway {got[p['timestamp']]!r} != python {want!r}")
+    print(f"{domain.name:<12}{len(payloads):>4} events  {'ok' if not failures else f'{failures} mismatches'}")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if sum(check(d) for d in DOMAINS.values()) else 0)
@@ -0,0 +1,417 @@
+import argparse
+import asyncio
+import csv
+import importlib.util
+import json
+import os
+import random
+import shutil
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.request import urlopen
+
+# Run from project root: python benchmarks/soak.py [--duration 14400] [--clients 20] ...
+# Long-running soak test of the whole stack, in a scratch directory:
+#   - a stub OpenAI-compatible LLM (in this process, fixed latency) behind the real
+#     shared LLM client, via OPENROUTER_BASE_URL
+#   - sim_engine (fleet mode), pw_engine and main.py as real processes on a real port
+#   - one observer WebSocket client (throughput) plus --clients churning clients, some
+#     of which vanish without a close frame
+# Every --sample-every seconds it records RSS and open FDs per process (/proc), loop
+# lag p99 over the window (/debug/loop), throughput, live WebSockets and disk usage.
+# After --warmup it fails (exit 1) when a trend crosses a threshold: RSS slope, FD
+# growth, loop lag, throughput decay, WebSockets the server keeps after clients left,
+# or a process exiting. At the end it prints the tracemalloc growth of each process
+# (/debug/memory, SIGUSR2 dumps). Linux only (/proc). Samples go to soak_samples.csv
+# in the work dir.
+sys.path.insert(0, os.path.join(os.getcwd(), "src", "backend"))
+
+import websockets  # noqa: E402
+from loopmon import BUCKETS_MS  # noqa: E402
+
+ROOT = os.getcwd()
+ABORT_SHARE = 0.2  # Churning clients that drop the TCP connection instead of closing
+
+
+# --- STUB LLM ---
+class StubLLM(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like the real endpoint
+    latency = 0.05
+    calls = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            incident = json.loads(body)["messages"][-1]["content"]
+        except (ValueError, KeyError, IndexError):
+            incident = ""
+        time.sleep(self.latency)
+        with StubLLM.lock:
+            StubLLM.calls += 1
+        reply = json.dumps({
+            "id": f"stub-{StubLLM.calls}", "object": "chat.completion", "created": int(time.time()),
+            "model": "stub", "choices": [{"index": 0, "finish_reason": "stop", "message": {
+                "role": "assistant", "content": f"ACTION: Contain ({incident.split('|')[0][-40:].strip()})"}}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub_llm(latency: float) -> int:
+    StubLLM.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubLLM)
+    server.daemon_threads = True
+    server.handle_error = lambda request, address: None  # Engines drop keep-alive sockets on exit
+    threading.Thread(target=server.serve_forever, name="stub-llm", daemon=True).start()
+    return server.server_address[1]
+
+
+# --- PROCESSES ---
+def setup_workdir() -> str:
+    work = tempfile.mkdtemp(prefix="synaptix-soak-")
+    os.symlink(os.path.join(ROOT, "src"), os.path.join(work, "src"))
+    os.makedirs(os.path.join(work, "data", "live_feed"))
+    return work
+
+
+def launch(work: str, args, llm_port: int) -> dict:
+    env = {**os.environ,
+           "OPENROUTER_API_KEY": "sk-or-soak-stub",
+           "OPENROUTER_BASE_URL": f"http://127.0.0.1:{llm_port}/v1",
+           "PORT": str(args.port),
+           "SYNAPTIX_TRACEMALLOC": str(args.tracemalloc),
+           "SYNAPTIX_FEED_MAX_MB": str(args.feed_max_mb),
+           "PYTHONUNBUFFERED": "1"}
+    commands = {
+        "main": [sys.executable, "src/backend/main.py"],
+        "pw_engine": [sys.executable, "src/backend/pw_engine.py"],
+        "sim_engine": [sys.executable, "src/generators/sim_engine.py", "fleet",
+                       "--patients", str(args.patients), "--symbols", str(args.symbols),
+                       "--services", str(args.services), "--crisis-every", str(args.crisis_every)],
+    }
+    procs = {}
+    for name, cmd in commands.items():
+        log = open(os.path.join(work, f"{name}.log"), "wb")
+        procs[name] = subprocess.Popen(cmd, cwd=work, env=env, stdout=log, stderr=subprocess.STDOUT)
+        if name == "main":
+            wait_ready(args.port, procs[name])
+    return procs
+
+
+def wait_ready(port: int, proc, timeout=60.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"main.py exited during startup (code {proc.returncode})")
+        try:
+            with urlopen(f"http://127.0.0.1:{port}/health", timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit("main.py did not become healthy")
+
+
+def stop(procs: dict):
+    for proc in procs.values():
+        if proc.poll() is None:
+            proc.terminate()
+    for proc in procs.values():
+        try:
+            proc.wait(5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def proc_stats(pid: int):
+    # (RSS MB, open FDs) from /proc
+    rss = None
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                rss = int(line.split()[1]) / 1024
+                break
+    return rss, len(os.listdir(f"/proc/{pid}/fd"))
+
+
+def disk_mb(path: str) -> float:
+    total = 0
+    for dirpath, _, names in os.walk(path):
+        for name in names:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    return total / 1e6
+
+
+def get_json(port: int, path: str):
+    with urlopen(f"http://127.0.0.1:{port}{path}", timeout=30) as r:
+        return json.loads(r.read())
+
+
+def window_p99(prev: list, now: list) -> float:
+    # p99 of the loop-lag histogram difference between two samples (bucket upper bound)
+    diff = [b - a for a, b in zip(prev, now)]
+    total = sum(diff)
+    if not total:
+        return 0.0
+    seen = 0
+    for i, count in enumerate(diff):
+        seen += count
+        if seen >= 0.99 * total:
+            return BUCKETS_MS[i] if i < len(BUCKETS_MS) else float(BUCKETS_MS[-1] * 2)
+    return float(BUCKETS_MS[-1] * 2)
+
+
+# --- WEBSOCKET CLIENTS ---
+async def observer(url: str, counts: Counter, done: asyncio.Event):
+    # One long-lived client: counts what a dashboard would receive
+    while not done.is_set():
+        try:
+            async with websockets.connect(url, max_size=None) as ws:
+                async for message in ws:
+                    counts[json.loads(message).get("type")] += 1
+                    if done.is_set():
+                        return
+        except (OSError, websockets.WebSocketException):
+            counts["observer_reconnects"] += 1
+            await asyncio.sleep(1)
+
+
+async def churner(url: str, mean_life: float, stats: Counter, done: asyncio.Event):
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(random.uniform(0, mean_life))
+    while not done.is_set():
+        try:
+            ws = await websockets.connect(url, max_size=None)
+        except (OSError, websockets.WebSocketException):
+            stats["connect_errors"] += 1
+            await asyncio.sleep(1)
+            continue
+        stats["connects"] += 1
+        stats["open"] += 1
+        try:
+            deadline = loop.time() + random.expovariate(1 / mean_life)
+            while not done.is_set() and loop.time() < deadline:
+                try:
+                    await asyncio.wait_for(ws.recv(), max(0.01, deadline - loop.time()))
+                    stats["received"] += 1
+                except asyncio.TimeoutError:
+                    break
+            if random.random() < ABORT_SHARE:
+                ws.transport.abort()  # Vanish without a close frame
+                stats["aborted"] += 1
+            else:
+                await ws.close()
+        except websockets.WebSocketException:
+            stats["dropped"] += 1
+        finally:
+            stats["open"] -= 1
+
+
+# --- SAMPLING & VERDICT ---
+async def sample_loop(args, work, procs, counts, clients, done, rows, failures):
+    t0 = time.time()
+    prev_hist = None
+    prev = {"t": t0, "updates": 0, "decisions": 0, "llm": 0}
+    header = (f"{'t':>7} {'main MB':>8} {'pw MB':>7} {'sim MB':>7} {'fds m/p/s':>11} {'lag p99':>8} "
+              f"{'upd/s':>8} {'dec/s':>6} {'llm/s':>6} {'ws srv/cli':>11} {'disk MB':>8}")
+    print(header)
+    while not done.is_set():
+        await asyncio.sleep(args.sample_every)
+        now = time.time()
+        row = {"t": round(now - t0, 1)}
+        for name, proc in procs.items():
+            if proc.poll() is not None:
+                failures.append(f"{name} exited with code {proc.returncode} (see {work}/{name}.log)")
+                done.set()
+                return
+            row[f"{name}_rss_mb"], row[f"{name}_fds"] = proc_stats(proc.pid)
+        loop_stats = await asyncio.to_thread(get_json, args.port, "/debug/loop")
+        memory = await asyncio.to_thread(get_json, args.port, "/debug/memory?top=0")
+        hist = list(loop_stats["histogram"].values())
+        row["lag_p99_ms"] = window_p99(prev_hist, hist) if prev_hist else loop_stats["p99_ms"]
+        prev_hist = hist
+        dt = now - prev["t"]
+        row["updates_per_s"] = round((counts["data_update"] - prev["updates"]) / dt, 1)
+        row["decisions_per_s"] = round((counts["agent_response"] - prev["decisions"]) / dt, 2)
+        row["llm_calls_per_s"] = round((StubLLM.calls - prev["llm"]) / dt, 2)
+        prev = {"t": now, "updates": counts["data_update"], "decisions": counts["agent_response"], "llm": StubLLM.calls}
+        row["ws_server"] = memory["websockets"]
+        row["ws_clients"] = clients["open"] + 1
+        row["disk_mb"] = round(await asyncio.to_thread(disk_mb, os.path.join(work, "data")), 1)
+        rows.append(row)
+        print(f"{row['t']:>6.0f}s {row['main_rss_mb']:>8.1f} {row['pw_engine_rss_mb']:>7.1f} {row['sim_engine_rss_mb']:>7.1f} "
+              f"{row['main_fds']:>3}/{row['pw_engine_fds']:>3}/{row['sim_engine_fds']:>3} {row['lag_p99_ms']:>6}ms "
+              f"{row['updates_per_s']:>8,.0f} {row['decisions_per_s']:>6.1f} {row['llm_calls_per_s']:>6.1f} "
+              f"{row['ws_server']:>5}/{row['ws_clients']:<5} {row['disk_mb']:>8.1f}", flush=True)
+        if now - t0 >= args.duration:
+            done.set()
+
+
+def slope_per_hour(rows, key):
+    xs = [r["t"] for r in rows]
+    ys = [r[key] for r in rows]
+    mx, my = statistics.fmean(xs), statistics.fmean(ys)
+    var = sum((x - mx) ** 2 for x in xs)
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var * 3600 if var else 0.0
+
+
+def verdict(args, rows, failures):
+    steady = [r for r in rows if r["t"] >= args.warmup]
+    if len(steady) < 4:
+        print(f"\nOnly {len(steady)} samples after warm-up: too short to judge trends")
+        return
+    q = max(1, len(steady) // 4)
+    first, last = steady[:q], steady[-q:]
+    print("\nTrends after warm-up:")
+    for name in ("main", "pw_engine", "sim_engine"):
+        growth = slope_per_hour(steady, f"{name}_rss_mb")
+        fds = statistics.median(r[f"{name}_fds"] for r in last) - statistics.median(r[f"{name}_fds"] for r in first)
+        print(f"  {name:<11} RSS {growth:+8.1f} MB/h   FDs {fds:+.0f}")
+        if growth > args.max_rss_growth:
+            failures.append(f"{name} RSS grows {growth:.1f} MB/h (limit {args.max_rss_growth})")
+        if fds > args.max_fd_growth:
+            failures.append(f"{name} open FDs grew by {fds:.0f} (limit {args.max_fd_growth})")
+    lag = statistics.median(r["lag_p99_ms"] for r in last)
+    print(f"  loop lag p99 (last quarter, median of windows): {lag} ms")
+    if lag > args.max_lag_p99:
+        failures.append(f"loop lag p99 {lag} ms (limit {args.max_lag_p99})")
+    for key in ("updates_per_s", "decisions_per_s"):
+        before = statistics.fmean(r[key] for r in first)
+        after = statistics.fmean(r[key] for r in last)
+        ratio = after / before if before else 1.0
+        print(f"  {key}: {before:,.1f} -> {after:,.1f} ({ratio:.2f}x)")
+        if before and ratio < args.min_throughput:
+            failures.append(f"{key} fell to {ratio:.2f}x of the first window (limit {args.min_throughput})")
+    leaked = rows[-1]["ws_server"] - rows[-1]["ws_clients"]
+    print(f"  WebSockets held by the server beyond live clients: {leaked}")
+    if leaked > args.ws_slack:
+        failures.append(f"server holds {leaked} WebSockets with no client (limit {args.ws_slack})")
+
+
+def report_allocations(args, work, procs):
+    if not args.tracemalloc:
+        return
+    print("\nTop allocation growth since startup (tracemalloc):")
+    reports = {}
+    try:
+        reports["main"] = get_json(args.port, "/debug/memory?top=5")
+    except OSError:
+        pass
+    for name, proc in procs.items():
+        path = os.path.join(work, "data", "profiles", f"{name}-{proc.pid}.memory.json")
+        if name == "main" or proc.poll() is not None:
+            continue
+        before = os.path.getmtime(path) if os.path.exists(path) else 0
+        os.kill(proc.pid, signal.SIGUSR2)  # Write <name>-<pid>.memory.json
+        deadline = time.time() + 60
+        while time.time() < deadline and (os.path.getmtime(path) if os.path.exists(path) else 0) <= before:
+            time.sleep(0.5)
+        if os.path.exists(path):
+            with open(path) as f:
+                reports[name] = json.load(f)
+    for name, report in reports.items():
+        print(f"  {name}:")
+        for entry in ((report.get("tracemalloc") or {}).get("top_growth") or [])[:5]:
+            where = " <- ".join(os.path.relpath(w, ROOT) if w.startswith(ROOT) else w for w in entry["where"])
+            print(f"    {entry['growth_kb']:>+10,.1f} KiB  {entry['count_growth']:>+8,} blocks  {where}")
+
+
+async def soak(args, work, procs):
+    url = f"ws://127.0.0.1:{args.port}/ws"
+    counts, clients, rows, failures = Counter(), Counter(), [], []
+    done = asyncio.Event()
+    mean_life = args.clients / args.churn if args.churn else args.duration
+    tasks = [asyncio.create_task(observer(url, counts, done))]
+    tasks += [asyncio.create_task(churner(url, mean_life, clients, done)) for _ in range(args.clients)]
+    await sample_loop(args, work, procs, counts, clients, done, rows, failures)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    print(f"\nClients: {clients['connects']:,} connections ({clients['aborted']:,} aborted), "
+          f"{clients['connect_errors']:,} connect errors; stub LLM calls: {StubLLM.calls:,}")
+    return rows, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synaptix soak test")
+    parser.add_argument("--duration", type=float, default=3600, help="Seconds to run")
+    parser.add_argument("--warmup", type=float, default=120, help="Seconds excluded from trend checks")
+    parser.add_argument("--sample-every", type=float, default=30)
+    parser.add_argument("--clients", type=int, default=20, help="Churning WebSocket clients")
+    parser.add_argument("--churn", type=float, default=2, help="Client reconnects per second (all clients)")
+    parser.add_argument("--patients", type=int, default=500)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--services", type=int, default=25)
+    parser.add_argument("--crisis-every", type=float, default=600, help="Mean seconds between crises per entity")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Stub LLM response time (s)")
+    parser.add_argument("--tracemalloc", type=int, default=1, help="Frames per allocation traced (0 = off)")
+    parser.add_argument("--feed-max-mb", type=float, default=None,
+                        help="Feed rotation size (default: 64 with the mock engine, 0 with Pathway)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-rss-growth", type=float, default=50, help="MB per hour, per process")
+    parser.add_argument("--max-fd-growth", type=int, default=20)
+    parser.add_argument("--max-lag-p99", type=float, default=250, help="ms")
+    parser.add_argument("--min-throughput", type=float, default=0.5, help="Last / first window ratio")
+    parser.add_argument("--ws-slack", type=int, default=5, help="Server-side WebSockets allowed beyond clients")
+    parser.add_argument("--keep", action="store_true", help="Keep the work directory")
+    args = parser.parse_args()
+    if args.feed_max_mb is None:
+        # Only the gateway and the mock engine are verified against feed rotation
+        args.feed_max_mb = 0 if importlib.util.find_spec("pathway") else 64
+    if not os.path.isdir("/proc/self/fd"):
+        raise SystemExit("The soak test reads /proc and needs Linux")
+
+    if (os.cpu_count() or 1) < 4:
+        print(f"Warning: {os.cpu_count()} CPU(s). Five busy processes share them, so loop lag and "
+              f"throughput will measure CPU starvation rather than the stack\n")
+    work = setup_workdir()
+    llm_port = start_stub_llm(args.llm_latency)
+    print(f"Soak test: {args.duration:,.0f}s, {args.clients} churning clients, "
+          f"{args.symbols:,}/{args.patients:,}/{args.services:,} entities, stub LLM {args.llm_latency * 1000:.0f} ms")
+    print(f"Work dir: {work}\n")
+    procs = launch(work, args, llm_port)
+    try:
+        rows, failures = asyncio.run(soak(args, work, procs))
+        if rows:
+            with open(os.path.join(work, "soak_samples.csv"), "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+        if not failures:
+            verdict(args, rows, failures)
+        report_allocations(args, work, procs)
+    finally:
+        stop(procs)
+
+    if failures:
+        print("\nSOAK FAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        print(f"Logs and samples kept in {work}")
+        sys.exit(1)
+    print("\nSOAK PASSED")
+    if args.keep:
+        print(f"Logs and samples kept in {work}")
+    else:
+        shutil.rmtree(work)
+
+
+if __name__ == "__main__":
+    main()
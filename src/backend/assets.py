@@ -0,0 +1,152 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+
+# Brotli is optional: without it only gzip variants are built
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except (ImportError, ModuleNotFoundError):
+    BROTLI_AVAILABLE = False
+    brotli = None
+
+# --- STATIC ASSET PIPELINE ---
+# Every frontend file is read once at startup. Small files are held in memory with
+# precomputed gzip/brotli variants and a strong content ETag; CSS/JS also get a
+# content-hashed alias (app.<hash>.js) and the HTML pages are rewritten to point at
+# it, so those URLs can be cached forever while the pages themselves revalidate.
+
+MAX_INLINE_BYTES = 1024 * 1024
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+HASHED_TYPES = (".js", ".css")
+
+
+class Asset:
+    __slots__ = ("name", "media_type", "body", "variants", "etag", "hashed_name")
+
+    def __init__(self, name: str, body: bytes):
+        self.name = name
+        self.media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        self.body = body
+        digest = hashlib.sha256(body).hexdigest()
+        self.etag = f'"{digest[:32]}"'
+        self.hashed_name = None
+        if name.endswith(HASHED_TYPES):
+            stem, ext = os.path.splitext(name)
+            self.hashed_name = f"{stem}.{digest[:10]}{ext}"
+
+        # Encoding -> (body, etag); only kept when actually smaller
+        self.variants = {}
+        if BROTLI_AVAILABLE:
+            compressed = brotli.compress(body, quality=11)
+            if len(compressed) < len(body):
+                self.variants["br"] = (compressed, f'"{digest[:32]}-br"')
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(compressed) < len(body):
+            self.variants["gzip"] = (compressed, f'"{digest[:32]}-gz"')
+
+
+def _accepted_encodings(header: str) -> set:
+    accepted = set()
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q=") and q[2:].strip() in ("0", "0.0", "0.00", "0.000"):
+            continue
+        if token:
+            accepted.add(token.strip().lower())
+    return accepted
+
+
+def _etag_matches(header: str, asset: Asset) -> bool:
+    if header.strip() == "*":
+        return True
+    base = asset.etag[:-1]
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        # Any representation of the same content is still fresh
+        if tag == asset.etag or (tag.startswith(base) and tag.endswith('"')):
+            return True
+    return False
+
+
+class AssetStore:
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.assets = {}   # served name (plain or hashed) -> Asset
+        self.large = {}    # name -> path, streamed from disk
+        self.load()
+
+    def load(self):
+        assets, large = {}, {}
+        names = sorted(os.listdir(self.directory)) if os.path.isdir(self.directory) else []
+        # CSS/JS first so the HTML rewrite knows their hashed names
+        names.sort(key=lambda n: n.endswith(".html"))
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if not os.path.isfile(path):
+                continue
+            if os.path.getsize(path) > MAX_INLINE_BYTES:
+                large[name] = path
+                continue
+            with open(path, "rb") as f:
+                body = f.read()
+            if name.endswith(".html"):
+                body = self._rewrite_links(body, assets)
+            asset = Asset(name, body)
+            assets[name] = asset
+            if asset.hashed_name:
+                assets[asset.hashed_name] = asset
+        self.assets, self.large = assets, large
+
+    @staticmethod
+    def _rewrite_links(body: bytes, assets: dict) -> bytes:
+        def swap(match):
+            asset = assets.get(match.group(1).decode())
+            if asset is None or asset.hashed_name is None:
+                return match.group(0)
+            return b"/static/" + asset.hashed_name.encode()
+        return re.sub(rb"/static/([\w.-]+)(?:\?v=\w+)?", swap, body)
+
+    def url(self, name: str) -> str:
+        asset = self.assets.get(name)
+        return f"/static/{asset.hashed_name if asset and asset.hashed_name else name}"
+
+    def response(self, name: str, request: Request) -> Response:
+        asset = self.assets.get(name)
+        if asset is None:
+            if name in self.large:
+                return FileResponse(self.large[name])
+            return Response(status_code=404)
+
+        cache_control = IMMUTABLE if name == asset.hashed_name else REVALIDATE
+        headers = {"Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+
+        body, etag, content_encoding = asset.body, asset.etag, None
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        for encoding in ("br", "gzip"):
+            if encoding in accepted and encoding in asset.variants:
+                body, etag = asset.variants[encoding]
+                content_encoding = encoding
+                break
+        headers["ETag"] = etag
+
+        # A 304 carries the ETag of the variant a 200 would have served
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, asset):
+            return Response(status_code=304, headers=headers)
+
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+        if request.method == "HEAD":
+            headers["Content-Length"] = str(len(body))
+            return Response(status_code=200, headers=headers, media_type=asset.media_type)
+        return Response(content=body, headers=headers, media_type=asset.media_type)
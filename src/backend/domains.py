@@ -0,0 +1,180 @@
+import importlib
+import os
+
+from events import MarketTick, Vitals, SysLog
+
+# --- DOMAIN REGISTRY ---
+# Everything the simulator, the engines and the API need to know about a feed lives
+# in one Domain entry: where its events are written, their schema, which ones are
+# critical, how a critical event is phrased for the LLM and where its decisions are
+# audited. Adding a domain is one register() call (built-ins below, or a plugin
+# module listed in SYNAPTIX_DOMAIN_PLUGINS), not another reader loop.
+
+
+class Domain:
+    __slots__ = ("name", "feed", "event", "entity_key", "schema", "critical", "context",
+                 "audit_file", "audit_column", "aliases", "scenarios", "recovery",
+                 "critical_expr", "context_expr", "rate")
+
+    def __init__(self, name, feed, event, entity_key, schema, critical, context,
+                 audit_file, audit_column, aliases=(), scenarios=(), recovery=None,
+                 critical_expr=None, context_expr=None, rate=None):
+        self.name = name
+        self.feed = feed                  # File name under data/live_feed/
+        self.event = event                # events.Event subclass for the payloads
+        self.entity_key = entity_key      # Field identifying the entity (symbol, patient, ...)
+        self.schema = schema              # {field: type} read by the Pathway engine
+        self.critical = critical          # payload dict -> bool
+        self.context = context            # payload dict -> LLM context string
+        self.audit_file = audit_file      # CSV under data/live_feed/ with (timestamp, audit_column)
+        self.audit_column = audit_column
+        self.aliases = aliases            # Extra names accepted by the API
+        self.scenarios = scenarios        # Crisis payloads for /trigger-event
+        self.recovery = recovery          # Calm payload for /stabilize
+        # Same predicate / context as Pathway column expressions (this -> expression),
+        # so the real engine filters and formats natively. None: the engine falls back
+        # to running critical/context as a per-row Python UDF (fine for plugins).
+        self.critical_expr = critical_expr
+        self.context_expr = context_expr
+        # (name, event -> bool): the state views keep this rolling rate per entity
+        # over its recent events and add it to the entity's snapshot (None: no rate)
+        self.rate = rate
+
+    @property
+    def feed_stem(self):
+        return os.path.splitext(self.feed)[0]
+
+    def event_payload(self, fields: dict, timestamp: str) -> dict:
+        return {"timestamp": timestamp, "type": self.event.DEFAULT_TYPE, **fields}
+
+
+DOMAINS = {}
+
+
+def register(domain: Domain) -> Domain:
+    DOMAINS[domain.name] = domain
+    return domain
+
+
+def resolve(name: str):
+    # Domain by name or alias (case-insensitive), else None
+    name = (name or "").lower()
+    if name in DOMAINS:
+        return DOMAINS[name]
+    for domain in DOMAINS.values():
+        if name in domain.aliases:
+            return domain
+    return None
+
+
+def domain_for_feed(path: str):
+    # "finance.jsonl" or a shard like "finance-07.jsonl" -> "finance"
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for domain in DOMAINS.values():
+        base = domain.feed_stem
+        if stem == base or (stem.startswith(base) and stem[len(base)] in "-_."):
+            return domain.name
+    return None
+
+
+def load_plugins(modules=None):
+    # Each plugin module calls register() at import time
+    modules = modules if modules is not None else os.environ.get("SYNAPTIX_DOMAIN_PLUGINS", "")
+    for module in filter(None, (m.strip() for m in modules.split(","))):
+        importlib.import_module(module)
+
+
+def format_float(value) -> str:
+    # Floats in LLM contexts, identical in both engines: Pathway parses the field as
+    # float, so the mock formats float(value) too, and the Pathway expression calls
+    # this rather than its own to_string() ("1e-5" vs Python's "1e-05")
+    return str(float(value))
+
+
+def _str_apply(fn, *columns):
+    # str-typed Pathway column computed by fn (pathway imported only when a graph is built)
+    import pathway as pw
+    return pw.apply_with_type(fn, str, *columns)
+
+
+# --- BUILT-IN DOMAINS ---
+register(Domain(
+    name="finance",
+    feed="finance.jsonl",
+    event=MarketTick,
+    entity_key="symbol",
+    schema={"timestamp": str, "symbol": str, "price": float, "news": str, "sentiment": str},
+    critical=lambda p: p.get("news", "Regular Trading") != "Regular Trading",
+    context=lambda p: f"Symbol: {p.get('symbol', 'N/A')} | Price: {format_float(p.get('price', 0.0))} | News: {p.get('news')}",
+    critical_expr=lambda t: t.news != "Regular Trading",
+    context_expr=lambda t: "Symbol: " + t.symbol + " | Price: " + _str_apply(format_float, t.price) + " | News: " + t.news,
+    audit_file="audit_trades.csv",
+    audit_column="action",
+    aliases=("market", "markets"),
+    scenarios=tuple({**s, "sentiment": "bearish"} for s in (
+        {"symbol": "CRASH", "price": 0.00, "delta": -99.99, "news": "MARKET CRASH DETECTED"},
+        {"symbol": "BTC-DUMP", "price": 12000.00, "delta": -40.00, "news": "Flash Sale on Crypto"},
+        {"symbol": "YOLO-SHORT", "price": 4.20, "delta": -69.00, "news": "Hedge Fund Liquidation"},
+        {"symbol": "FLASH-CRASH", "price": 1400.00, "delta": -35.00, "news": "High Frequency Trading Loop Detected"},
+        {"symbol": "SEC-FREEZE", "price": 0.00, "delta": 0.00, "news": "Regulatory Trading Halt - Investigation Pending"},
+        {"symbol": "FX-COLLAPSE", "price": 0.85, "delta": -15.00, "news": "Currency Peg Broken - Hyperinflation Risk"},
+        {"symbol": "DARK-POOL", "price": 450.20, "delta": -12.00, "news": "Suspicious Dark Pool Activity Detected"},
+        {"symbol": "QUANTUM", "price": 0.00, "delta": -100.00, "news": "Encryption Keys Compromised by Quantum Actor"}
+    )),
+    recovery={"symbol": "RECOVERY", "price": 1000.0, "delta": 5.0, "news": "Market Stabilized", "sentiment": "bullish"}
+))
+
+register(Domain(
+    name="healthcare",
+    feed="healthcare.jsonl",
+    event=Vitals,
+    entity_key="patient_id",
+    schema={"timestamp": str, "patient_id": str, "bpm": int, "spo2": int, "status": str, "notes": str},
+    critical=lambda p: p.get("status", "NORMAL") == "CRITICAL",
+    context=lambda p: f"Patient: {p.get('patient_id', 'N/A')} | Status: {p.get('status')} | Notes: {p.get('notes', '')}",
+    critical_expr=lambda t: t.status == "CRITICAL",
+    context_expr=lambda t: "Patient: " + t.patient_id + " | Status: " + t.status + " | Notes: " + t.notes,
+    audit_file="audit_medical_logs.csv",
+    audit_column="decision",
+    aliases=("health", "medical"),
+    scenarios=(
+        {"patient_id": "EMERGENCY", "bpm": 0, "spo2": 60, "status": "CRITICAL", "notes": "CARDIAC ARREST - CODE BLUE"},
+        {"patient_id": "ICU-04", "bpm": 45, "spo2": 60, "status": "CRITICAL", "notes": "SPO2 FAILURE - HYPOXIA"},
+        {"patient_id": "TRAUMA-1", "bpm": 160, "spo2": 60, "status": "CRITICAL", "notes": "HEMORRHAGE ALERT"},
+        {"patient_id": "NEURO", "bpm": 140, "spo2": 60, "status": "CRITICAL", "notes": "Seizure Activity Detected - Status Epilepticus"},
+        {"patient_id": "ALLERGY", "bpm": 155, "spo2": 60, "status": "CRITICAL", "notes": "Anaphylaxis - Airway Compromised"},
+        {"patient_id": "SEPSIS", "bpm": 135, "spo2": 60, "status": "CRITICAL", "notes": "Septic Shock - BP Critical"},
+        {"patient_id": "DEVICE", "bpm": 30, "spo2": 60, "status": "CRITICAL", "notes": "Pacemaker Signal Loss - Lead Failure"},
+        {"patient_id": "ROBOT", "bpm": 90, "spo2": 60, "status": "CRITICAL", "notes": "Surgical Robot Latency > 500ms - Safety Stop"}
+    ),
+    recovery={"patient_id": "SYSTEM", "bpm": 72, "spo2": 99, "status": "NORMAL", "notes": "All Systems Normal"}
+))
+
+register(Domain(
+    name="dev",
+    feed="developer.jsonl",
+    event=SysLog,
+    entity_key="service",
+    schema={"timestamp": str, "service": str, "level": str, "message": str, "action_required": bool},
+    critical=lambda p: p.get("level", "INFO") in ("ERROR", "FATAL"),
+    context=lambda p: f"Service: {p.get('service', 'N/A')} | Level: {p.get('level')} | Msg: {p.get('message', '')}",
+    critical_expr=lambda t: (t.level == "ERROR") | (t.level == "FATAL"),
+    context_expr=lambda t: "Service: " + t.service + " | Level: " + t.level + " | Msg: " + t.message,
+    rate=("error_rate", lambda e: e.level in ("ERROR", "FATAL")),
+    audit_file="audit_ops_actions.csv",
+    audit_column="command",
+    aliases=("developer", "devops", "devtools", "ops"),
+    scenarios=(
+        {"service": "CORE-DB", "level": "FATAL", "message": "DATA CORRUPTION DETECTED - SYSTEM HALT", "action_required": True},
+        {"service": "WORKER-NODE-9", "level": "FATAL", "message": "MEMORY LEAK - OOM KILLER INVOKED", "action_required": True},
+        {"service": "AUTH-GATEWAY", "level": "FATAL", "message": "UNAUTHORIZED ROOT ACCESS ATTEMPT", "action_required": True},
+        {"service": "LOAD-BALANCER", "level": "FATAL", "message": "DDOS ATTACK - 1M RPS DETECTED", "action_required": True},
+        {"service": "FILE-SERVER", "level": "FATAL", "message": "RANSOMWARE SIGNATURE FOUND - ENCRYPTING", "action_required": True},
+        {"service": "GIT-WATCHDOG", "level": "FATAL", "message": "API KEY LEAKED IN PUBLIC REPO", "action_required": True},
+        {"service": "PAYMENT-ENGINE", "level": "FATAL", "message": "DEADLOCK DETECTED - TRANSACTION STUCK", "action_required": True},
+        {"service": "SERVERLESS-FUNC", "level": "FATAL", "message": "RECURSIVE LAMBDA BOMB - COST SPIKE", "action_required": True}
+    ),
+    recovery={"service": "SYSTEM", "level": "INFO", "message": "Manual Override: Stability Restored", "action_required": False}
+))
+
+load_plugins()
@@ -0,0 +1,45 @@
+import re
+import zlib
+
+import numpy as np
+
+# --- HASHED N-GRAM TEXT FEATURES ---
+# A local, dependency-free embedding: word unigrams/bigrams and character trigrams
+# are hashed (crc32, stable across processes) into a fixed-size signed vector and
+# L2-normalised, so a dot product is a cosine similarity.
+
+DIM = 256
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def features(text: str):
+    words = _TOKEN.findall(text.lower())
+    feats = list(words)
+    feats += [f"{a}_{b}" for a, b in zip(words, words[1:])]
+    for w in words:
+        padded = f"<{w}>"
+        feats += [padded[i:i + 3] for i in range(len(padded) - 2)]
+    return feats
+
+
+def hashed(text: str):
+    # (bucket, sign) per feature; the top hash bit picks the sign
+    hashes = np.fromiter((zlib.crc32(f.encode("utf-8")) for f in features(text)), dtype=np.uint32)
+    signs = np.where(hashes & 0x80000000, 1.0, -1.0)
+    return hashes, signs
+
+
+def embed(text: str, dim: int = DIM) -> np.ndarray:
+    hashes, signs = hashed(text)
+    vec = np.bincount(hashes % dim, weights=signs, minlength=dim).astype(np.float32)
+    norm = np.linalg.norm(vec)
+    if norm > 0:
+        vec /= norm
+    return vec
+
+
+def embed_many(texts, dim: int = DIM) -> np.ndarray:
+    out = np.empty((len(texts), dim), dtype=np.float32)
+    for i, text in enumerate(texts):
+        out[i] = embed(text, dim)
+    return out
@@ -0,0 +1,146 @@
+import json
+import sys
+from datetime import datetime, timedelta
+
+# --- COMPACT EVENT RECORDS ---
+# Typed, __slots__-based replacements for the per-event dicts that travel between
+# the simulator, the engine and the API. Enum-like string fields are interned, so
+# buffers and caches hold one shared string per distinct value instead of one copy
+# per event.
+#
+# The JSON wire format is unchanged: from_json(line).to_json() reproduces the same
+# object. The timestamp is kept as the original string (ts_ns derives the epoch
+# value from it), keys unknown to the record (e.g. "domain" or "is_manual") ride
+# along in `extra`, and fields missing from the input (including "timestamp" and
+# "type") stay missing. Loosely typed values (a numeric id, a missing timestamp)
+# are carried as-is rather than rejected, like the plain dicts they replace.
+#
+# This is a memory saving, not a speed-up: parsing into a record costs an extra
+# pass over the dict json.loads already built, so it runs at roughly half the rate
+# of plain dicts (see benchmarks/bench_events.py).
+
+_EPOCH = datetime(1970, 1, 1)
+_intern = sys.intern
+
+
+def _delta_ns(delta: timedelta) -> int:
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def iso_to_ns(ts: str) -> int:
+    # Nanoseconds on the local wall-clock scale: naive timestamps (what
+    # datetime.now().isoformat() emits everywhere in this repo) are taken as local
+    # time, and aware ones are converted to local time first, so feeds mixing both
+    # still order correctly (forensics.py sorts and filters on this value)
+    dt = datetime.fromisoformat(ts)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone().replace(tzinfo=None)
+    return _delta_ns(dt - _EPOCH)
+
+
+def ns_to_iso(ns: int) -> str:
+    return (_EPOCH + timedelta(microseconds=ns // 1_000)).isoformat()
+
+
+def now_ns() -> int:
+    return _delta_ns(datetime.now() - _EPOCH)
+
+
+class Event:
+    __slots__ = ("timestamp", "type", "extra", "absent")
+    FIELDS = ()
+    INTERNED = ()
+
+    @property
+    def ts_ns(self) -> int:
+        return iso_to_ns(self.timestamp)
+
+    def to_dict(self) -> dict:
+        out = {}
+        absent = self.absent
+        if absent is None or "timestamp" not in absent:
+            out["timestamp"] = self.timestamp
+        if absent is None or "type" not in absent:
+            out["type"] = self.type
+        for name in self.FIELDS:
+            if absent is None or name not in absent:
+                out[name] = getattr(self, name)
+        if self.extra:
+            out.update(self.extra)
+        return out
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        ev = cls.__new__(cls)
+        get = data.get
+        ev.timestamp = get("timestamp")
+        kind = get("type", cls.DEFAULT_TYPE)
+        ev.type = _intern(kind) if type(kind) is str else kind
+        for name in cls.FIELDS:
+            setattr(ev, name, get(name))
+        # Missing fields read as None (type: DEFAULT_TYPE) but to_dict leaves them out
+        if cls._FIELD_SET <= data.keys():
+            ev.absent = None
+        else:
+            ev.absent = frozenset(cls._FIELD_SET - data.keys())
+        for name in cls.INTERNED:
+            value = get(name)
+            if type(value) is str:  # Only strings intern; a numeric id is kept as sent
+                setattr(ev, name, _intern(value))
+        known = cls._KNOWN
+        if data.keys() <= known:
+            ev.extra = None
+        else:
+            ev.extra = {k: v for k, v in data.items() if k not in known}
+        return ev
+
+    @classmethod
+    def from_json(cls, line: str):
+        return cls.from_dict(json.loads(line))
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.FIELDS)
+        return f"{type(self).__name__}({self.timestamp}, {fields})"
+
+
+class MarketTick(Event):
+    __slots__ = ("symbol", "price", "delta", "news", "sentiment")
+    FIELDS = __slots__
+    INTERNED = ("symbol", "sentiment")
+    DEFAULT_TYPE = "market_tick"
+
+
+class Vitals(Event):
+    __slots__ = ("patient_id", "bpm", "spo2", "status", "notes")
+    FIELDS = __slots__
+    INTERNED = ("patient_id", "status")
+    DEFAULT_TYPE = "vitals"
+
+
+class SysLog(Event):
+    __slots__ = ("service", "level", "message", "action_required")
+    FIELDS = __slots__
+    INTERNED = ("service", "level")
+    DEFAULT_TYPE = "syslog"
+
+
+for _cls in (MarketTick, Vitals, SysLog):
+    _cls._KNOWN = frozenset(("timestamp", "type") + _cls.FIELDS)
+    _cls._FIELD_SET = frozenset(("timestamp", "type") + _cls.FIELDS)
+
+# Domain name (as used for feed files and WebSocket tags) -> record class
+EVENT_TYPES = {
+    "finance": MarketTick,
+    "healthcare": Vitals,
+    "dev": SysLog,
+}
+
+
+def parse_event(domain: str, line: str) -> Event:
+    return EVENT_TYPES[domain].from_json(line)
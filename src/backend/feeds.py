@@ -0,0 +1,294 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+# --- MULTIPLEXED FEED READER ---
+# One reader for any number of JSONL feeds, given as files or whole directories
+# (every *.jsonl inside, including files created later). On Linux a single inotify
+# descriptor watches the parent directories, so a poll only touches the files that
+# actually changed; elsewhere it falls back to one stat() per feed per poll. Only
+# complete lines are returned: a half-written last line waits for the next poll.
+# Feeds are tracked by inode: when the writer rotates one (renames it to
+# <feed>.1 and starts a new file), the rest of the old generation is read first.
+#
+#   mux = FeedMux(resolve=domain_for_feed)
+#   mux.follow("data/live_feed")
+#   while True:
+#       mux.wait(0.5)
+#       for domain, path, lines in mux.poll():
+#           ...
+
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_Q_OVERFLOW = 0x4000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+MAX_READ = 1 << 20   # Bytes per feed per poll, so one busy feed cannot starve the rest
+ROTATED_SUFFIX = ".1"  # Previous generation of a rotated feed (see sim_engine.rotate_feed)
+RESCAN_EVERY = 5.0   # Safety-net stat() scan interval when inotify is in use
+
+
+def _inotify():
+    # (libc, fd) or None where inotify is unavailable
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    return (libc, fd) if fd >= 0 else None
+
+
+def _skip_line(f):
+    # Move f past the end of the current line, reading at most MAX_READ at a time;
+    # False if the file ends first (the line is still being written)
+    while True:
+        chunk = f.read(MAX_READ)
+        nl = chunk.find(b"\n")
+        if nl >= 0:
+            f.seek(nl + 1 - len(chunk), os.SEEK_CUR)
+            return True
+        if len(chunk) < MAX_READ:
+            return False
+
+
+class Feed:
+    __slots__ = ("path", "domain", "inode", "offset", "target", "aligned")
+
+    def __init__(self, path, domain, inode, offset, target):
+        self.path = path
+        self.domain = domain
+        self.inode = inode            # Generation the offset belongs to (None: not created yet)
+        self.offset = offset
+        self.target = target          # Size when first followed (catch-up goal)
+        self.aligned = offset == 0    # False: offset may point mid-line
+
+
+class FeedMux:
+    def __init__(self, resolve=None, start=None, suffix=".jsonl"):
+        # resolve(path) -> domain for files found in directories followed without a
+        # fixed domain (None skips the file); start(path, size) -> initial offset for
+        # files that already exist when followed (default: their end), or an
+        # (inode, offset) pair from positions() to resume a checkpoint taken against a
+        # generation that has since been rotated. Files that appear later are always
+        # read from the beginning.
+        self.resolve = resolve
+        self.start = start or (lambda path, size: size)
+        self.suffix = suffix
+        self.feeds = {}        # path -> Feed
+        self.dirs = {}         # followed directory -> fixed domain or None
+        self.dirty = set()     # Paths that may have new data
+        self.watches = {}      # inotify wd -> directory
+        self.last_scan = 0.0
+        inotify = _inotify()
+        self.libc, self.fd = inotify if inotify else (None, None)
+
+    def fileno(self):
+        # inotify descriptor (readable when a followed file changed), or None
+        return self.fd
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    # --- following ---
+    def _watch(self, directory):
+        if self.fd is None or directory in self.watches.values():
+            return
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd >= 0:
+            self.watches[wd] = directory
+
+    def follow(self, path, domain=None):
+        # A feed file (domain required) or a directory of feeds
+        path = os.path.abspath(path)
+        if os.path.isdir(path):
+            self.dirs[path] = domain
+            self._watch(path)
+            for name in sorted(os.listdir(path)):
+                self._add(os.path.join(path, name), domain, existing=True)
+        else:
+            self._add(path, domain, existing=True, explicit=True)
+            self._watch(os.path.dirname(path))
+
+    def _add(self, path, domain, existing, explicit=False):
+        if path in self.feeds:
+            return
+        if not explicit:
+            if not path.endswith(self.suffix):
+                return
+            domain = domain or (self.resolve(path) if self.resolve else None)
+            if domain is None:
+                return
+        try:
+            st = os.stat(path)
+            inode, size = st.st_ino, st.st_size
+        except OSError:
+            inode, size = None, 0
+        offset = 0
+        if existing:
+            offset = self.start(path, size)
+            if isinstance(offset, (tuple, list)):
+                saved, offset = offset
+                if saved != inode:
+                    # Checkpoint of an older generation: _read finishes <feed>.1 first
+                    self.feeds[path] = Feed(path, domain, saved, offset, 0)
+                    self.dirty.add(path)
+                    return
+            offset = min(offset, size)
+        self.feeds[path] = Feed(path, domain, inode, offset, size)
+        self.dirty.add(path)
+
+    # --- change detection ---
+    def _drain(self):
+        # inotify events -> dirty paths (and newly created feeds)
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            i = 0
+            while i < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, i)
+                name = data[i + _EVENT.size:i + _EVENT.size + length].rstrip(b"\0")
+                i += _EVENT.size + length
+                if mask & IN_Q_OVERFLOW:
+                    self._scan()
+                    continue
+                directory = self.watches.get(wd)
+                if directory is None or not name:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name))
+                if path in self.feeds:
+                    self.dirty.add(path)
+                elif directory in self.dirs:
+                    self._add(path, self.dirs[directory], existing=False)
+
+    def _scan(self):
+        # stat() every feed (fallback, and periodic safety net under inotify)
+        self.last_scan = time.monotonic()
+        for directory, domain in self.dirs.items():
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            for name in names:
+                self._add(os.path.join(directory, name), domain, existing=False)
+        for path, feed in self.feeds.items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if st.st_size != feed.offset or st.st_ino != feed.inode:
+                self.dirty.add(path)
+
+    def wait(self, timeout):
+        # Block until a followed file may have changed, or `timeout` seconds
+        if self.dirty:
+            return
+        if self.fd is None:
+            time.sleep(timeout)
+        else:
+            select.select([self.fd], [], [], timeout)
+
+    # --- reading ---
+    def poll(self):
+        # Non-blocking: [(domain, path, lines)] for every feed with new complete lines
+        if self.fd is not None:
+            self._drain()
+        if self.fd is None or time.monotonic() - self.last_scan >= RESCAN_EVERY:
+            self._scan()
+        dirty, self.dirty = self.dirty, set()
+        out = []
+        for path in dirty:
+            feed = self.feeds[path]
+            lines = self._read(feed)
+            if lines:
+                out.append((feed.domain, path, lines))
+        return out
+
+    def _read(self, feed):
+        try:
+            inode = os.stat(feed.path).st_ino
+        except OSError:
+            inode = None  # Mid-rotation: renamed, new file not created yet
+        if feed.inode is None:
+            feed.inode = inode
+        if inode != feed.inode:
+            # Rotated: finish the old generation (now <feed>.1), then start the new file
+            lines = self._read_file(feed, feed.path + ROTATED_SUFFIX)
+            if lines or inode is None:
+                return lines
+            feed.inode = inode
+            feed.offset = feed.target = 0
+            feed.aligned = True
+        return self._read_file(feed, feed.path)
+
+    def _read_file(self, feed, path):
+        # New complete lines of `path`, provided it still is the generation feed.inode
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return []
+        with f:
+            st = os.fstat(f.fileno())
+            if st.st_ino != feed.inode:
+                if path == feed.path:
+                    self.dirty.add(feed.path)  # Rotated between stat and open: retry
+                return []
+            size = st.st_size
+            if size < feed.offset:
+                # File was truncated/cleared (e.g. simulation reset)
+                feed.offset = feed.target = 0
+                feed.aligned = True
+            if size == feed.offset:
+                return []
+            if not feed.aligned:
+                # Started mid-file (or inside a dropped line): skip to the first full line
+                f.seek(feed.offset - 1)
+                feed.aligned = f.read(1) == b"\n" or _skip_line(f)
+                feed.offset = f.tell()
+            else:
+                f.seek(feed.offset)
+            data = f.read(max(0, min(size - feed.offset, MAX_READ))) if feed.aligned else b""
+            while len(data) == MAX_READ and b"\n" not in data:
+                # A line longer than MAX_READ would stall the feed forever: drop it
+                print(f"[FEEDS] Dropping a line over {MAX_READ} bytes in {path} at byte {feed.offset}", flush=True)
+                feed.aligned = _skip_line(f)
+                feed.offset = f.tell()
+                data = f.read(max(0, min(size - feed.offset, MAX_READ))) if feed.aligned else b""
+        end = data.rfind(b"\n") + 1
+        if feed.offset + len(data) >= size:
+            # Reached the end: a trailing partial line does not count as backlog
+            feed.target = min(feed.target, feed.offset + end)
+        elif end:
+            self.dirty.add(feed.path)
+        if end == 0:
+            return []
+        feed.offset += end
+        if path != feed.path:
+            self.dirty.add(feed.path)  # The new generation is waiting
+        return data[:end].decode("utf-8", errors="replace").splitlines()
+
+    # --- progress ---
+    def caught_up(self):
+        # True once every feed has been read up to its size when it was followed
+        return all(feed.offset >= feed.target for feed in self.feeds.values())
+
+    def pending(self):
+        return bool(self.dirty)
+
+    def positions(self):
+        # {path: (inode, offset)}: a checkpoint that survives rotation (see start)
+        return {path: (feed.inode, feed.offset) for path, feed in self.feeds.items()}
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# --- ASYNC FILE LAYER ---
+# All disk I/O from the API runs on dedicated executors, never on the event loop.
+# Writes have their own single worker, so they stay ordered and a multi-MB tail or
+# snapshot read never delays a durable append; appends that arrive while a write is
+# in flight are group-committed (one write + one fsync for the whole batch).
+
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="synaptix-io")
+WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="synaptix-write")
+
+
+async def run_io(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(IO_EXECUTOR, fn, *args)
+
+
+async def run_write(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(WRITE_EXECUTOR, fn, *args)
+
+
+def _read_json(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _write_json(path, data):
+    # Write-then-rename so the simulator never reads a half-written config
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+async def read_json(path):
+    return await run_io(_read_json, path)
+
+
+async def write_json(path, data):
+    await run_write(_write_json, path, data)
+
+
+def _read_new_lines(path, offset, skip_partial=False):
+    # Returns (lines, new offset); offset resets to 0 when the file was truncated
+    if not os.path.exists(path):
+        return [], offset
+    if os.path.getsize(path) < offset:
+        offset = 0
+    with open(path, "r", encoding="utf-8") as f:
+        f.seek(offset)
+        if skip_partial and offset > 0:
+            f.readline()
+        lines = f.readlines()
+        return lines, f.tell()
+
+
+async def read_new_lines(path, offset, skip_partial=False):
+    return await run_io(_read_new_lines, path, offset, skip_partial)
+
+
+class AppendLog:
+    def __init__(self, path, fsync=False):
+        self.path = path
+        self.fsync = fsync
+        self.pending = []      # (data, future) waiting for the next commit
+        self.flushing = False
+        self.commits = 0       # Number of write (+fsync) batches performed
+
+    async def append(self, line: str):
+        # Resolves once `line` is on disk (and fsynced, if enabled)
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((line, future))
+        if not self.flushing:
+            self.flushing = True
+            asyncio.create_task(self._flush())
+        await future
+
+    def _write(self, data):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(data)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    async def _flush(self):
+        try:
+            while self.pending:
+                batch, self.pending = self.pending, []
+                try:
+                    await run_write(self._write, "".join(line for line, _ in batch))
+                    self.commits += 1
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():  # Caller may have been cancelled / timed out
+                            future.set_exception(e)
+                    continue
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+        finally:
+            self.flushing = False
@@ -0,0 +1,217 @@
+import json
+import os
+import re
+import sqlite3
+import time
+
+from events import iso_to_ns, now_ns
+
+# --- FORENSIC SEARCH INDEX ---
+# Every agent decision in agent_stream.jsonl is copied into a SQLite database with an
+# FTS5 full-text index over source_event / ai_response / entity / domain, so questions like
+# "all SEPSIS decisions last week" are an indexed query instead of a grep over the
+# raw streams. The index follows the stream by byte offset (stored in the database,
+# so restarts resume where they stopped) and ingests in bounded batches.
+#
+# The connection is not thread-safe: use one ForensicIndex per thread (main.py keeps
+# it on a dedicated single-thread executor).
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS decisions (
+    id INTEGER PRIMARY KEY,
+    ts_ns INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    entity TEXT NOT NULL,
+    source_event TEXT NOT NULL,
+    ai_response TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS time_blocks (block INTEGER PRIMARY KEY, min_ts INTEGER NOT NULL, max_ts INTEGER NOT NULL);
+CREATE VIRTUAL TABLE IF NOT EXISTS decisions_fts USING fts5(
+    source_event, ai_response, entity, domain, content='decisions', content_rowid='id', prefix='3'
+);
+CREATE TABLE IF NOT EXISTS ingest_state (source TEXT PRIMARY KEY, offset INTEGER NOT NULL);
+"""
+
+BATCH_LINES = 5000
+BLOCK_ROWS = 1024  # Rows per time_blocks entry (id // BLOCK_ROWS)
+MAX_PAGE = 200
+CACHE_KIB = 8 * 1024  # SQLite page cache cap, keeps memory bounded on huge histories
+
+_RELATIVE = re.compile(r"^(\d+)([smhd])$")
+_UNITS_NS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+_TERM = re.compile(r'[^\s"]+')
+
+
+def parse_time(value):
+    # ISO timestamp, or a relative age like "7d" / "24h" (meaning "that long ago")
+    if not value:
+        return None
+    match = _RELATIVE.match(value.strip())
+    if match:
+        return now_ns() - int(match.group(1)) * _UNITS_NS[match.group(2)] * 1_000_000_000
+    return iso_to_ns(value)
+
+
+def fts_query(text: str) -> str:
+    # User text -> FTS5 query: every term must match, "term*" is a prefix search
+    terms = []
+    for term in _TERM.findall(text):
+        prefix = term.endswith("*")
+        term = term.rstrip("*")
+        if term:
+            terms.append(f'"{term}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def entity_of(source_event: str) -> str:
+    # "Patient: P-101 | Status: ..." -> "P-101"
+    head = source_event.split("|", 1)[0]
+    return head.split(":", 1)[1].strip() if ":" in head else head.strip()
+
+
+class ForensicIndex:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(f"PRAGMA cache_size=-{CACHE_KIB}")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    # --- ingestion ---
+    def _offset(self, source):
+        row = self.db.execute("SELECT offset FROM ingest_state WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else 0
+
+    def ingest(self, agent_stream_path, max_lines=BATCH_LINES):
+        # Index up to max_lines new decisions; returns how many lines were consumed
+        if not os.path.exists(agent_stream_path):
+            return 0
+        offset = self._offset(agent_stream_path)
+        if os.path.getsize(agent_stream_path) < offset:
+            offset = 0  # Stream was reset; already-indexed decisions are kept
+        rows = []
+        consumed = 0
+        with open(agent_stream_path, "r", encoding="utf-8") as f:
+            f.seek(offset)
+            while consumed < max_lines:
+                line = f.readline()
+                if not line.endswith("\n"):
+                    break  # Partial line: pick it up next time
+                consumed += 1
+                offset = f.tell()
+                try:
+                    rec = json.loads(line)
+                    source_event = rec.get("source_event") or ""
+                    rows.append((iso_to_ns(rec["timestamp"]), rec["timestamp"], rec.get("domain", ""),
+                                 entity_of(source_event), source_event, rec.get("ai_response") or ""))
+                except (ValueError, KeyError, TypeError):
+                    continue
+        if not consumed:
+            return 0
+        blocks = {}
+        with self.db:
+            for row in rows:
+                cur = self.db.execute(
+                    "INSERT INTO decisions (ts_ns, timestamp, domain, entity, source_event, ai_response) "
+                    "VALUES (?, ?, ?, ?, ?, ?)", row)
+                self.db.execute(
+                    "INSERT INTO decisions_fts (rowid, source_event, ai_response, entity, domain) "
+                    "VALUES (?, ?, ?, ?, ?)", (cur.lastrowid, row[4], row[5], row[3], row[2]))
+                block = cur.lastrowid // BLOCK_ROWS
+                lo, hi = blocks.get(block, (row[0], row[0]))
+                blocks[block] = (min(lo, row[0]), max(hi, row[0]))
+            self.db.executemany(
+                "INSERT INTO time_blocks (block, min_ts, max_ts) VALUES (?, ?, ?) ON CONFLICT (block) DO UPDATE "
+                "SET min_ts = MIN(min_ts, excluded.min_ts), max_ts = MAX(max_ts, excluded.max_ts)",
+                [(block, lo, hi) for block, (lo, hi) in blocks.items()])
+            self.db.execute("INSERT OR REPLACE INTO ingest_state (source, offset) VALUES (?, ?)",
+                            (agent_stream_path, offset))
+        return consumed
+
+    # --- search ---
+    def _id_bounds(self, since_ns, until_ns):
+        # Decisions are appended in (roughly) time order, so a time window maps onto a
+        # rowid window. time_blocks keeps the timestamp range of every BLOCK_ROWS ids,
+        # which gives safe bounds even if the stream is slightly out of order; the
+        # exact ts_ns test still applies to the rows inside.
+        low = high = None
+        if since_ns is not None:
+            block = self.db.execute("SELECT MIN(block) FROM time_blocks WHERE max_ts >= ?", (since_ns,)).fetchone()[0]
+            low = block * BLOCK_ROWS if block is not None else -1
+        if until_ns is not None:
+            block = self.db.execute("SELECT MAX(block) FROM time_blocks WHERE min_ts < ?", (until_ns,)).fetchone()[0]
+            high = block * BLOCK_ROWS + BLOCK_ROWS - 1 if block is not None else -1
+        return low, high
+
+    def search(self, q="", domain=None, entity=None, since=None, until=None, limit=50, cursor=None):
+        # Newest first (stream order), keyset-paginated: pass back `next_cursor` for the
+        # next page. Text, domain and entity filters all resolve inside the FTS index,
+        # which walks its posting lists backwards and stops after `limit` hits.
+        t0 = time.perf_counter()
+        limit = max(1, min(int(limit), MAX_PAGE))
+        since_ns, until_ns = parse_time(since), parse_time(until)
+        low, high = self._id_bounds(since_ns, until_ns)
+        if cursor:
+            before = int(cursor)
+            high = before - 1 if high is None else min(high, before - 1)
+
+        match = fts_query(q or "")
+        if domain:
+            match += f' domain:"{domain.replace(chr(34), "")}"'
+        if entity:
+            match += f' entity:"{entity.replace(chr(34), "")}"'
+        match = match.strip()
+
+        if match:
+            sql = ("SELECT d.id, d.timestamp, d.domain, d.entity, d.source_event, d.ai_response "
+                   "FROM decisions_fts f JOIN decisions d ON d.id = f.rowid")
+            key = "f.rowid"
+            where, params = ["decisions_fts MATCH ?"], [match]
+        else:
+            sql = ("SELECT d.id, d.timestamp, d.domain, d.entity, d.source_event, d.ai_response "
+                   "FROM decisions d")
+            key = "d.id"
+            where, params = [], []
+        if low is not None:
+            where.append(f"{key} >= ?")
+            params.append(low)
+        if high is not None:
+            where.append(f"{key} <= ?")
+            params.append(high)
+        if domain:
+            where.append("d.domain = ?")
+            params.append(domain)
+        if entity:
+            where.append("d.entity = ?")
+            params.append(entity)
+        if since_ns is not None:
+            where.append("d.ts_ns >= ?")
+            params.append(since_ns)
+        if until_ns is not None:
+            where.append("d.ts_ns < ?")
+            params.append(until_ns)
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {key} DESC LIMIT ?"
+        params.append(limit + 1)
+
+        rows = self.db.execute(sql, params).fetchall()
+        page = rows[:limit]
+        results = [
+            {"timestamp": ts, "domain": dom, "entity": ent, "source_event": src, "ai_response": resp}
+            for _, ts, dom, ent, src, resp in page
+        ]
+        return {
+            "results": results,
+            "next_cursor": str(page[-1][0]) if len(rows) > limit else None,
+            "took_ms": round((time.perf_counter() - t0) * 1000, 3)
+        }
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
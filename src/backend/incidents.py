@@ -0,0 +1,309 @@
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+from embed import DIM, embed
+from responses import SKIP_RESPONSES, LEARNABLE_SOURCES
+
+# --- INCIDENT MEMORY (LOCAL VECTOR INDEX) ---
+# Past agent decisions (source_event -> ai_response pairs from agent_stream.jsonl)
+# embedded with hashed n-grams and kept in a memory-mapped float32 matrix on disk.
+# The index follows agent_stream.jsonl incrementally, so whichever engine wrote the
+# decision, the next similar incident can be answered from memory.
+#
+# Layout of the index directory:
+#   vectors.f32  raw (capacity x dim) float32 memmap, rows [0, count) are valid
+#   meta.jsonl   one {"timestamp", "domain", "source_event", "ai_response"} per row
+#   state.json   {"count", "dim", "capacity", "source_offset"}
+#
+# Search is brute force by default: one mat-vec over the queried domain's rows, kept
+# contiguous in memory per domain. mode="ivf" clusters the rows with k-means and only
+# scores the `nprobe` nearest clusters; (re)training runs in a background thread and
+# the new clusters are swapped in when ready, so searches never wait for it.
+#
+# Answers served by recall() are not indexed again when they come back through
+# agent_stream.jsonl: a recalled answer attached to a new incident would otherwise
+# become a neighbour of its own, reinforcing itself.
+
+INITIAL_CAPACITY = 1024
+
+
+class RowBuffer:
+    # Row ids + their vectors in one contiguous, geometrically grown buffer, so
+    # appending a row never copies the whole list
+    __slots__ = ("ids", "vectors", "size")
+
+    def __init__(self, dim, capacity=16):
+        self.ids = np.empty(capacity, dtype=np.int64)
+        self.vectors = np.empty((capacity, dim), dtype=np.float32)
+        self.size = 0
+
+    @classmethod
+    def of(cls, ids, vectors):
+        buf = cls(vectors.shape[1], max(16, len(ids)))
+        buf.ids[:len(ids)] = ids
+        buf.vectors[:len(ids)] = vectors
+        buf.size = len(ids)
+        return buf
+
+    def append(self, row, vec):
+        if self.size == len(self.ids):
+            capacity = 2 * len(self.ids)
+            ids = np.empty(capacity, dtype=np.int64)
+            ids[:self.size] = self.ids
+            vectors = np.empty((capacity, self.vectors.shape[1]), dtype=np.float32)
+            vectors[:self.size] = self.vectors
+            self.ids, self.vectors = ids, vectors
+        self.ids[self.size] = row
+        self.vectors[self.size] = vec
+        self.size += 1
+
+    def scores(self, q):
+        return self.ids[:self.size], self.vectors[:self.size] @ q
+
+
+class IncidentIndex:
+    def __init__(self, directory, dim=DIM, mode="flat", nprobe=4):
+        self.directory = directory
+        self.dim = dim
+        self.mode = mode
+        self.nprobe = nprobe
+        self.lock = threading.RLock()
+        self.count = 0
+        self.capacity = 0
+        self.source_offset = 0
+        self.vectors = None
+        self.meta = []
+        self.meta_file = None
+        self.domain_codes = {}
+        self.row_domains = np.zeros(0, dtype=np.int16)
+        self.partitions = {}     # Domain code -> RowBuffer (flat search)
+        self.recalled = set()    # (domain, source_event) answered by recall(), not to be re-indexed
+        # IVF state, swapped as one (centroids, [RowBuffer per cluster]) pair
+        self.ivf = None
+        self.trained_count = 0
+        self.training = False
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    # --- storage ---
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _load(self):
+        state = {}
+        if os.path.exists(self._path("state.json")):
+            with open(self._path("state.json")) as f:
+                state = json.load(f)
+        if state.get("dim", self.dim) != self.dim:
+            state = {}  # Embedding changed: rebuild from the source stream
+        self.count = state.get("count", 0)
+        self.source_offset = state.get("source_offset", 0)
+        self._open(max(state.get("capacity", 0), INITIAL_CAPACITY), reset=not state)
+
+        # Keep exactly `count` metadata rows (a crash may leave unsaved extras behind)
+        self.meta = []
+        meta_path = self._path("meta.jsonl")
+        if not state or not os.path.exists(meta_path):
+            open(meta_path, "w").close()
+        with open(meta_path, "r+", encoding="utf-8") as f:
+            while len(self.meta) < self.count:
+                line = f.readline()
+                if not line.endswith("\n"):
+                    break
+                self.meta.append(json.loads(line))
+            f.truncate(f.tell())
+        self.count = len(self.meta)
+        self.meta_file = open(meta_path, "a", encoding="utf-8")
+        self.row_domains = np.array([self._domain_code(m["domain"]) for m in self.meta], dtype=np.int16)
+        self._grow_domains(self.capacity)
+        for code in np.unique(self.row_domains[:self.count]):
+            ids = np.nonzero(self.row_domains[:self.count] == code)[0]
+            self.partitions[int(code)] = RowBuffer.of(ids, np.asarray(self.vectors[ids]))
+
+    def _open(self, capacity, reset=False):
+        path = self._path("vectors.f32")
+        mode = "w+" if reset or not os.path.exists(path) else "r+"
+        if mode == "r+" and os.path.getsize(path) < capacity * self.dim * 4:
+            with open(path, "r+b") as f:
+                f.truncate(capacity * self.dim * 4)
+        if self.vectors is not None:
+            self.vectors.flush()
+            self.vectors = None
+        self.vectors = np.memmap(path, dtype=np.float32, mode=mode, shape=(capacity, self.dim))
+        self.capacity = capacity
+
+    def _grow_domains(self, capacity):
+        grown = np.zeros(capacity, dtype=np.int16)
+        grown[:self.count] = self.row_domains[:self.count]
+        self.row_domains = grown
+
+    def _domain_code(self, domain):
+        return self.domain_codes.setdefault(domain, len(self.domain_codes))
+
+    def save(self):
+        with self.lock:
+            self.vectors.flush()
+            self.meta_file.flush()
+            tmp = self._path("state.json.tmp")
+            with open(tmp, "w") as f:
+                json.dump({"count": self.count, "dim": self.dim, "capacity": self.capacity,
+                           "source_offset": self.source_offset}, f)
+            os.replace(tmp, self._path("state.json"))
+
+    # --- ingestion ---
+    def add(self, domain, source_event, ai_response, timestamp=""):
+        if not source_event or not ai_response or ai_response.startswith(SKIP_RESPONSES):
+            return False
+        vec = embed(f"{domain} | {source_event}", self.dim)
+        with self.lock:
+            if self.count == self.capacity:
+                self._open(self.capacity * 2)
+                self._grow_domains(self.capacity)
+            row = self.count
+            code = self._domain_code(domain)
+            self.vectors[row] = vec
+            self.row_domains[row] = code
+            if code not in self.partitions:
+                self.partitions[code] = RowBuffer(self.dim)
+            self.partitions[code].append(row, vec)
+            record = {"timestamp": timestamp, "domain": domain,
+                      "source_event": source_event, "ai_response": ai_response}
+            self.meta.append(record)
+            self.meta_file.write(json.dumps(record) + "\n")
+            self.count += 1
+            if self.ivf is not None:
+                centroids, lists = self.ivf
+                lists[int(np.argmax(centroids @ vec))].append(row, vec)
+            return True
+
+    def ingest(self, agent_stream_path):
+        # Follow agent_stream.jsonl from the last indexed byte offset. Single
+        # writer; the lock is taken per row so searches are never stuck behind
+        # a long catch-up
+        if not os.path.exists(agent_stream_path):
+            return 0
+        if os.path.getsize(agent_stream_path) < self.source_offset:
+            self.source_offset = 0  # Stream was reset
+        added = 0
+        with open(agent_stream_path, "r", encoding="utf-8") as f:
+            f.seek(self.source_offset)
+            while True:
+                line = f.readline()
+                if not line.endswith("\n"):
+                    break  # Partial line: pick it up next time
+                self.source_offset = f.tell()
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if rec.get("answered_by", LEARNABLE_SOURCES[0]) not in LEARNABLE_SOURCES:
+                    continue  # Reflex / recalled / canned answers are not incidents to learn from
+                key = (rec.get("domain", ""), rec.get("source_event", ""))
+                with self.lock:
+                    if key in self.recalled:
+                        self.recalled.discard(key)  # Our own recalled answer coming back
+                        continue
+                added += self.add(rec.get("domain", ""), rec.get("source_event", ""),
+                                  rec.get("ai_response", ""), rec.get("timestamp", ""))
+        if added:
+            self.save()
+        return added
+
+    def follow(self, agent_stream_path, every=2.0):
+        # Background loop: index new decisions as they are appended
+        while True:
+            try:
+                self.ingest(agent_stream_path)
+            except Exception as e:
+                print(f"[INCIDENTS] Ingest failed: {e!r}", flush=True)
+            time.sleep(every)
+
+    # --- IVF ---
+    def train(self, nlist=None, iterations=10, seed=0):
+        # k-means over a snapshot of the rows, without holding the lock; rows added
+        # meanwhile are assigned to the new clusters when they are swapped in
+        with self.lock:
+            n = self.count
+            if n == 0:
+                return
+            data = np.array(self.vectors[:n])
+        nlist = nlist or max(1, int(np.sqrt(n)))
+        rng = np.random.default_rng(seed)
+        centroids = data[rng.choice(n, size=min(nlist, n), replace=False)].copy()
+        for _ in range(iterations):
+            assign = np.argmax(data @ centroids.T, axis=1)
+            for c in range(len(centroids)):
+                members = data[assign == c]
+                if len(members):
+                    mean = members.sum(axis=0)
+                    norm = np.linalg.norm(mean)
+                    centroids[c] = mean / norm if norm > 0 else centroids[c]
+        assign = np.argmax(data @ centroids.T, axis=1)
+        lists = [RowBuffer.of(ids, data[ids]) for ids in (np.nonzero(assign == c)[0] for c in range(len(centroids)))]
+        with self.lock:
+            for row in range(n, self.count):
+                vec = np.asarray(self.vectors[row])
+                lists[int(np.argmax(centroids @ vec))].append(row, vec)
+            self.ivf = (centroids, lists)
+            self.trained_count = n
+
+    def _train_background(self):
+        try:
+            self.train()
+        finally:
+            self.training = False
+
+    def _probe(self, q):
+        # (row ids, scores) for the rows in the nprobe clusters nearest to q, or None
+        # while the first clustering is still being built (caller searches flat)
+        if (self.ivf is None or self.count >= 2 * self.trained_count) and not self.training:
+            self.training = True
+            threading.Thread(target=self._train_background, name="ivf-train", daemon=True).start()
+        if self.ivf is None:
+            return None
+        centroids, lists = self.ivf
+        probe = np.argsort(centroids @ q)[::-1][:self.nprobe]
+        ids, scores = zip(*(lists[c].scores(q) for c in probe))
+        return np.concatenate(ids), np.concatenate(scores)
+
+    # --- search ---
+    def search(self, text, domain=None, k=5):
+        q = embed(text if domain is None else f"{domain} | {text}", self.dim)
+        with self.lock:
+            n = self.count
+            if n == 0:
+                return []
+            code = None
+            if domain is not None:
+                code = self.domain_codes.get(domain)
+                if code is None or code not in self.partitions:
+                    return []
+            probed = self._probe(q) if self.mode == "ivf" else None
+            if probed is not None:
+                ids, scores = probed
+                if code is not None:
+                    scores = np.where(self.row_domains[ids] == code, scores, -np.inf)
+            elif code is not None:
+                ids, scores = self.partitions[code].scores(q)
+            else:
+                ids = np.arange(n)
+                scores = self.vectors[:n] @ q
+            if ids.size == 0:
+                return []
+            k = min(k, scores.size)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [(float(scores[t]), self.meta[ids[t]]) for t in top if np.isfinite(scores[t])]
+
+    def recall(self, context, domain, threshold):
+        # The stored response of a near-identical past incident, or None
+        hits = self.search(context, domain=domain, k=1)
+        if hits and hits[0][0] >= threshold:
+            with self.lock:
+                self.recalled.add((domain, context))
+            return hits[0][1]["ai_response"]
+        return None
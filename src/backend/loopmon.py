@@ -0,0 +1,95 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+
+# --- EVENT-LOOP LAG MONITOR ---
+# A coroutine wakes every INTERVAL and records how late it was scheduled; the lag
+# goes into a fixed-bucket histogram. A watchdog thread checks the heartbeat, and
+# when the loop has been stuck longer than SLOW_THRESHOLD it captures the loop
+# thread's stack, i.e. the callback that is blocking it.
+
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 250, 500, 1000, 5000)
+
+
+class LoopLagMonitor:
+    def __init__(self, interval=0.05, slow_threshold=0.1, keep_slow=50):
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.samples = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.slow = deque(maxlen=keep_slow)
+        self.last_tick = time.perf_counter()
+        self.loop_thread_id = None
+        self._stall_reported = False
+
+    def start(self):
+        self.loop_thread_id = threading.get_ident()
+        self.last_tick = time.perf_counter()
+        asyncio.create_task(self._tick())
+        threading.Thread(target=self._watchdog, name="loop-lag-watchdog", daemon=True).start()
+
+    def record(self, lag_ms: float):
+        i = 0
+        while i < len(BUCKETS_MS) and lag_ms > BUCKETS_MS[i]:
+            i += 1
+        self.counts[i] += 1
+        self.samples += 1
+        self.total_ms += lag_ms
+        self.max_ms = max(self.max_ms, lag_ms)
+
+    async def _tick(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            self.last_tick = now
+            self._stall_reported = False
+            self.record(max(0.0, (now - expected) * 1000))
+
+    def _watchdog(self):
+        while True:
+            time.sleep(self.slow_threshold / 2)
+            stalled = time.perf_counter() - self.last_tick - self.interval
+            if stalled < self.slow_threshold or self._stall_reported:
+                continue
+            frame = sys._current_frames().get(self.loop_thread_id)
+            if frame is None or frame.f_code.co_filename.endswith("selectors.py"):
+                continue  # Gone, or idle in select(): nothing is blocking the loop
+            self._stall_reported = True
+            stack = "".join(traceback.format_stack(frame, limit=12))
+            self.slow.append({
+                "at": datetime.now().isoformat(),
+                "stalled_ms": round(stalled * 1000, 1),
+                "stack": stack
+            })
+            where = traceback.extract_stack(frame, limit=1)[-1]
+            print(f"[LOOP LAG] event loop blocked >{stalled * 1000:.0f}ms at {where.filename}:{where.lineno} ({where.name})", flush=True)
+
+    def percentile(self, p: float):
+        if not self.samples:
+            return 0
+        target = p * self.samples
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return BUCKETS_MS[i] if i < len(BUCKETS_MS) else round(self.max_ms, 3)
+        return round(self.max_ms, 3)  # Past the last bucket: the worst lag seen (JSON has no inf)
+
+    def stats(self) -> dict:
+        labels = [f"<={b}ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        return {
+            "samples": self.samples,
+            "mean_ms": round(self.total_ms / self.samples, 3) if self.samples else 0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(0.5),
+            "p99_ms": self.percentile(0.99),
+            "histogram": dict(zip(labels, self.counts)),
+            "slow_callbacks": list(self.slow)
+        }
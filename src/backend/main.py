@@ -1,20 +1,67 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, PlainTextResponse
 import asyncio
 import json
 import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from datetime import datetime
+from views import StateViews, SNAPSHOT_ENTITIES
+from assets import AssetStore
+from fileio import AppendLog, read_json, write_json, read_new_lines, run_io
+from loopmon import LoopLagMonitor
+from forensics import ForensicIndex, BATCH_LINES
+from domains import DOMAINS, resolve, domain_for_feed
+from feeds import FeedMux
+from profiler import profile, collapsed, stage, stage_stats, start_memtrace, memory_stats
 
 app = FastAPI()
 
+# Latest state per symbol / patient / service, fed by the tailer and manual triggers
+views = StateViews()
+
+# Disk writes from request handlers go through the I/O executor; concurrent triggers
+# on the same feed share one write + fsync
+CONFIG_PATH = os.path.join(os.getcwd(), "data", "sim_config.json")
+FEED_DIR = os.path.join(os.getcwd(), "data", "live_feed")
+feed_logs = {name: AppendLog(os.path.join(FEED_DIR, d.feed), fsync=True) for name, d in DOMAINS.items()}
+
+loop_monitor = LoopLagMonitor()
+
+# Full-text forensic index over agent decisions (SQLite FTS5). It gets its own worker
+# thread so a large catch-up on first start never delays feed writes.
+AGENT_FILE = os.path.join(os.getcwd(), "data", "agent_stream.jsonl")
+FORENSICS_DB = os.path.join(os.getcwd(), "data", "forensics.db")
+FORENSICS_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="synaptix-forensics")
+forensic_index = None
+
+def _forensics_call(method, *args):
+    global forensic_index
+    if forensic_index is None:
+        forensic_index = ForensicIndex(FORENSICS_DB)
+    return getattr(forensic_index, method)(*args)
+
+async def run_forensics(method, *args):
+    return await asyncio.get_running_loop().run_in_executor(FORENSICS_EXECUTOR, _forensics_call, method, *args)
+
 @app.api_route("/health", methods=["GET", "HEAD"])
 async def health_check():
     return {"status": "ok"}
 
-# Mount frontend
-app.mount("/static", StaticFiles(directory=os.path.join(os.getcwd(), "src", "frontend")), name="static")
+# Readiness (unlike /health) waits for the background tailers to catch up
+@app.api_route("/ready", methods=["GET", "HEAD"])
+async def readiness_check():
+    if all(readiness.values()):
+        return {"status": "ready", "tailers": readiness}
+    return JSONResponse({"status": "starting", "tailers": readiness}, status_code=503)
+
+# Frontend assets: loaded and precompressed once, served from memory with ETags
+assets = AssetStore(os.path.join(os.getcwd(), "src", "frontend"))
+
+@app.api_route("/static/{name}", methods=["GET", "HEAD"])
+async def get_static(name: str, request: Request):
+    return assets.response(name, request)
 
 # WebSocket Connection Manager
 class ConnectionManager:
@@ -23,17 +70,27 @@ class ConnectionManager:
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
+        # Snapshot and registration happen without yielding, so every delta broadcast
+        # after this point has a higher seq than the snapshot the client receives.
+        # Only the most recently updated entities are sent; the rest page via /state.
+        snapshot = json.dumps({"type": "snapshot", "limit": SNAPSHOT_ENTITIES,
+                               **views.snapshot(limit=SNAPSHOT_ENTITIES)})
         self.active_connections.append(websocket)
+        await websocket.send_text(snapshot)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except:
-                pass
+        with stage("broadcast"):
+            # Iterate over a copy: clients connect and disconnect while we await sends
+            for connection in list(self.active_connections):
+                try:
+                    await connection.send_text(message)
+                except:
+                    # Dead socket (client vanished without a close frame): stop sending to it
+                    self.disconnect(connection)
 
 manager = ConnectionManager()
 
@@ -50,10 +107,8 @@ class UpdateRulesRequest(BaseModel):
 
 @app.post("/update-rules")
 async def update_rules(req: UpdateRulesRequest):
-    config_path = os.path.join(os.getcwd(), "data", "sim_config.json")
     try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
+        config = await read_json(CONFIG_PATH)
     except:
         config = {"mode": "CHAOS", "onset": 0, "rules": {}}
 
@@ -65,123 +120,80 @@ async def update_rules(req: UpdateRulesRequest):
     elif req.type == "finance": config["rules"]["max_drawdown"] = req.max_drawdown
     elif req.type == "dev": config["rules"]["max_latency"] = req.max_latency
     
-    with open(config_path, "w") as f:
-        json.dump(config, f)
+    await write_json(CONFIG_PATH, config)
     
     return {"status": "updated", "config": config["rules"]}
 
-@app.get("/dashboard")
-async def get_dashboard():
-    return FileResponse(os.path.join(os.getcwd(), "src", "frontend", "dashboard.html"))
+# Current-state snapshot, a page of the most recently updated entities per domain
+# (the first page is what the WebSocket sends on connect)
+@app.get("/state")
+async def get_state(limit: int = SNAPSHOT_ENTITIES, offset: int = 0):
+    return views.snapshot(limit=max(0, limit), offset=max(0, offset))
+
+@app.get("/state/{domain}")
+async def get_domain_state(domain: str, limit: int = SNAPSHOT_ENTITIES, offset: int = 0):
+    if domain not in views.tables:
+        return {"status": "error", "message": "Invalid domain"}
+    return views.snapshot(domain, limit=max(0, limit), offset=max(0, offset))
+
+@app.api_route("/dashboard", methods=["GET", "HEAD"])
+async def get_dashboard(request: Request):
+    return assets.response("dashboard.html", request)
+
+@app.api_route("/network", methods=["GET", "HEAD"])
+async def get_network(request: Request):
+    return assets.response("network.html", request)
 
-@app.get("/network")
-async def get_network():
-    return FileResponse(os.path.join(os.getcwd(), "src", "frontend", "network.html"))
+@app.api_route("/forensics", methods=["GET", "HEAD"])
+async def get_forensics(request: Request):
+    return assets.response("forensics.html", request)
 
-@app.get("/forensics")
-async def get_forensics():
-    return FileResponse(os.path.join(os.getcwd(), "src", "frontend", "forensics.html"))
+# Paginated search over past decisions, newest first. `q` terms must all match
+# ("sepsis*" for a prefix); since/until take ISO timestamps or ages like "7d".
+@app.get("/forensics/search")
+async def forensics_search(q: str = "", domain: str = None, entity: str = None, since: str = None,
+                           until: str = None, limit: int = 50, cursor: str = None):
+    try:
+        return await run_forensics("search", q, domain, entity, since, until, limit, cursor)
+    except (ValueError, sqlite3.OperationalError) as e:
+        return {"status": "error", "message": str(e)}
 
 @app.post("/trigger-event")
 async def trigger_event(req: TriggerRequest):
     # Normalize domain names (Handle case sensitivity and aliases)
-    d = req.domain.lower()
-    if d == "health" or d == "healthcare": req.domain = "healthcare"
-    elif d == "finance": req.domain = "finance"
-    elif d == "dev" or "dev" in d: req.domain = "dev" # Handles 'DevTools', 'developer', etc.
-    
-    base_dir = os.getcwd()
-    config_path = os.path.join(base_dir, "data", "sim_config.json")
+    domain = resolve(req.domain)
+    if domain is None:
+        return {"status": "error", "message": "Invalid domain"}
+    req.domain = domain.name
     
     # 1. DO NOT ENABLE CHAOS LOOP
     # User requested: "dont makeit inject automatically only inject crisis when user taps the button"
     # So we just write the ONE event to the file, but keep config STABLE
-    with open(config_path, "w") as f:
-        json.dump({
-            "mode": "STABLE", 
-            "onset": 0
-        }, f)
+    await write_json(CONFIG_PATH, {
+        "mode": "STABLE", 
+        "onset": 0
+    })
 
     timestamp = datetime.now().isoformat()
-    data_dir = os.path.join(base_dir, "data", "live_feed")
-    files = {
-        "finance": os.path.join(data_dir, "finance.jsonl"),
-        "healthcare": os.path.join(data_dir, "healthcare.jsonl"),
-        "dev": os.path.join(data_dir, "developer.jsonl")
-    }
     
-    # 2. Varied Scenarios
+    # 2. Varied Scenarios (from the domain registry)
     import random
-    payload = {}
-
-    if req.domain == "finance":
-        scenarios = [
-            {"symbol": "CRASH", "price": 0.00, "delta": -99.99, "news": "MARKET CRASH DETECTED"},
-            {"symbol": "BTC-DUMP", "price": 12000.00, "delta": -40.00, "news": "Flash Sale on Crypto"},
-            {"symbol": "YOLO-SHORT", "price": 4.20, "delta": -69.00, "news": "Hedge Fund Liquidation"},
-            {"symbol": "FLASH-CRASH", "price": 1400.00, "delta": -35.00, "news": "High Frequency Trading Loop Detected"},
-            {"symbol": "SEC-FREEZE", "price": 0.00, "delta": 0.00, "news": "Regulatory Trading Halt - Investigation Pending"},
-            {"symbol": "FX-COLLAPSE", "price": 0.85, "delta": -15.00, "news": "Currency Peg Broken - Hyperinflation Risk"},
-            {"symbol": "DARK-POOL", "price": 450.20, "delta": -12.00, "news": "Suspicious Dark Pool Activity Detected"},
-            {"symbol": "QUANTUM", "price": 0.00, "delta": -100.00, "news": "Encryption Keys Compromised by Quantum Actor"}
-        ]
-        scen = random.choice(scenarios)
-        payload = {
-            "timestamp": timestamp, "type": "market_tick", "symbol": scen["symbol"],
-            "price": scen["price"], "delta": scen["delta"], "news": scen["news"], "sentiment": "bearish"
-        }
-
-    elif req.domain == "healthcare":
-        scenarios = [
-            {"pid": "EMERGENCY", "notes": "CARDIAC ARREST - CODE BLUE", "bpm": 0},
-            {"pid": "ICU-04", "notes": "SPO2 FAILURE - HYPOXIA", "bpm": 45},
-            {"pid": "TRAUMA-1", "notes": "HEMORRHAGE ALERT", "bpm": 160},
-            {"pid": "NEURO", "notes": "Seizure Activity Detected - Status Epilepticus", "bpm": 140},
-            {"pid": "ALLERGY", "notes": "Anaphylaxis - Airway Compromised", "bpm": 155},
-            {"pid": "SEPSIS", "notes": "Septic Shock - BP Critical", "bpm": 135},
-            {"pid": "DEVICE", "notes": "Pacemaker Signal Loss - Lead Failure", "bpm": 30},
-            {"pid": "ROBOT", "notes": "Surgical Robot Latency > 500ms - Safety Stop", "bpm": 90}
-        ]
-        scen = random.choice(scenarios)
-        payload = {
-            "timestamp": timestamp, "type": "vitals", "patient_id": scen["pid"],
-            "bpm": scen["bpm"], "spo2": 60, "status": "CRITICAL", "notes": scen["notes"]
-        }
-
-    elif req.domain == "dev":
-        scenarios = [
-            {"msg": "DATA CORRUPTION DETECTED - SYSTEM HALT", "svc": "CORE-DB"},
-            {"msg": "MEMORY LEAK - OOM KILLER INVOKED", "svc": "WORKER-NODE-9"},
-            {"msg": "UNAUTHORIZED ROOT ACCESS ATTEMPT", "svc": "AUTH-GATEWAY"},
-            {"msg": "DDOS ATTACK - 1M RPS DETECTED", "svc": "LOAD-BALANCER"},
-            {"msg": "RANSOMWARE SIGNATURE FOUND - ENCRYPTING", "svc": "FILE-SERVER"},
-            {"msg": "API KEY LEAKED IN PUBLIC REPO", "svc": "GIT-WATCHDOG"},
-            {"msg": "DEADLOCK DETECTED - TRANSACTION STUCK", "svc": "PAYMENT-ENGINE"},
-            {"msg": "RECURSIVE LAMBDA BOMB - COST SPIKE", "svc": "SERVERLESS-FUNC"}
-        ]
-        scen = random.choice(scenarios)
-        payload = {
-            "timestamp": timestamp, "type": "syslog", "service": scen["svc"],
-            "level": "FATAL", "message": scen["msg"], "action_required": True
-        }
-
-    else:
-        return {"status": "error", "message": "Invalid domain"}
+    payload = domain.event_payload(random.choice(domain.scenarios), timestamp)
 
     # 3. INSTANT FEEDBACK (Bypass File Reader Latency)
     # Broadcast directly to UI so the user sees it immediately
     payload["domain"] = req.domain
     payload["is_manual"] = True # Tag for loop filtering
+    seq = views.apply(req.domain, payload)
+    posted_manual.add((req.domain, timestamp))
     
     # Write to file (Pathway will pick this up instantly)
-    with open(files[req.domain], "a") as f:
-        f.write(json.dumps(payload) + "\n")
-        f.flush()
-        os.fsync(f.fileno())
+    await feed_logs[req.domain].append(json.dumps(payload) + "\n")
 
     await manager.broadcast(json.dumps({
         "type": "data_update",
-        "data": payload
+        "seq": seq,
+        "data": views.delta(req.domain, payload)
     }))
 
     return {"status": "success", "payload": payload}
@@ -189,45 +201,26 @@ async def trigger_event(req: TriggerRequest):
 @app.post("/stabilize")
 async def stabilize_system():
     # 1. Disable Chaos
-    base_dir = os.getcwd()
-    config_path = os.path.join(base_dir, "data", "sim_config.json")
-    with open(config_path, "w") as f:
-        json.dump({"mode": "STABLE"}, f)
+    await write_json(CONFIG_PATH, {"mode": "STABLE"})
 
     timestamp = datetime.now().isoformat()
-    data_dir = os.path.join(base_dir, "data", "live_feed")
-    files = {
-        "finance": os.path.join(data_dir, "finance.jsonl"),
-        "healthcare": os.path.join(data_dir, "healthcare.jsonl"),
-        "dev": os.path.join(data_dir, "developer.jsonl")
-    }
     
     # Inject Normalcy
-    payloads = [
-        {"file": files["finance"], "data": {"timestamp": timestamp, "type": "market_tick", "symbol": "RECOVERY", "price": 1000.0, "delta": 5.0, "news": "Market Stabilized", "sentiment": "bullish"}},
-        {"file": files["healthcare"], "data": {"timestamp": timestamp, "type": "vitals", "patient_id": "SYSTEM", "bpm": 72, "spo2": 99, "status": "NORMAL", "notes": "All Systems Normal"}},
-        {"file": files["dev"], "data": {"timestamp": timestamp, "type": "syslog", "service": "SYSTEM", "level": "INFO", "message": "Manual Override: Stability Restored", "action_required": False}}
-    ]
+    payloads = {name: d.event_payload(d.recovery, timestamp) for name, d in DOMAINS.items() if d.recovery}
 
-    for p in payloads:
-        with open(p["file"], "a") as f:
-            f.write(json.dumps(p["data"]) + "\n")
+    await asyncio.gather(*(feed_logs[name].append(json.dumps(p) + "\n") for name, p in payloads.items()))
 
     return {"status": "stabilized"}
 
 
-@app.get("/")
-async def read_root():
-    return FileResponse(os.path.join(os.getcwd(), "src", "frontend", "index.html"))
-
-@app.get("/dashboard")
-async def read_dashboard():
-    return FileResponse(os.path.join(os.getcwd(), "src", "frontend", "dashboard.html"))
+@app.api_route("/", methods=["GET", "HEAD"])
+async def read_root(request: Request):
+    return assets.response("index.html", request)
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    await manager.connect(websocket)
     try:
+        await manager.connect(websocket)
         while True:
             # We don't expect much *input* from the client in this demo, 
             # mostly pushing updates.
@@ -240,97 +233,181 @@ async def websocket_endpoint(websocket: WebSocket):
                     "content": "Analyzing latest stream... Detected 3 anomalies in the last minute. Engaging protection protocols."
                 }))
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
 
 # Background Task to stream data from the generated files to the UI
+# One FeedMux follows every feed in data/live_feed (any registered domain, including
+# shards like finance-07.jsonl) and wakes the loop through its inotify descriptor, so
+# an idle feed costs nothing per cycle.
+# On startup only the last WARMUP_BYTES of each feed are replayed, and only into the
+# state views (no clients are connected yet), so startup does not scale with history.
+WARMUP_BYTES = int(os.environ.get("SYNAPTIX_WARMUP_BYTES", 4 * 1024 * 1024))
+
+# Tailer name -> True once it has caught up with the data present at startup
+# (the agent stream tailer starts at the end of its file, so it has nothing to wait for)
+readiness = {"live_feed": False}
+
+# (domain, timestamp) of manual triggers this process has applied and broadcast,
+# until the feed reader comes across them
+posted_manual = set()
+
 async def stream_live_data():
-    base_dir = os.getcwd()
-    data_dir = os.path.join(base_dir, "data", "live_feed")
-    files = {
-        "finance": os.path.join(data_dir, "finance.jsonl"),
-        "healthcare": os.path.join(data_dir, "healthcare.jsonl"),
-        "dev": os.path.join(data_dir, "developer.jsonl")
-    }
-    file_pointers = {k: 0 for k in files}
+    loop = asyncio.get_running_loop()
+    mux = FeedMux(resolve=domain_for_feed, start=lambda path, size: max(0, size - WARMUP_BYTES))
+
+    def follow():
+        os.makedirs(FEED_DIR, exist_ok=True)
+        mux.follow(FEED_DIR)
+
+    await run_io(follow)
+
+    changed = asyncio.Event()
+    fd = mux.fileno()
+
+    def on_change():
+        loop.remove_reader(fd)
+        changed.set()
+
+    def poll():
+        with stage("read"):
+            return mux.poll()
 
     while True:
-        changes_found = False
-        for domain, filepath in files.items():
-            if not os.path.exists(filepath):
-                continue
-                
-            with open(filepath, 'r', encoding='utf-8') as f:
-                f.seek(file_pointers[domain])
-                new_lines = f.readlines()
-                file_pointers[domain] = f.tell()
-
-                if new_lines:
-                    changes_found = True
-                    for line in new_lines:
-                        try:
-                            payload = json.loads(line)
-                            
-                            # IDEMPOTENCY KEY: If this was a manual trigger (is_manual=True),
-                            # it was already broadcasted by the POST endpoint. Do not send again.
-                            if payload.get("is_manual"):
+        # Reads run on the I/O executor; the warm-up window may start mid-line
+        batches = await run_io(poll)
+
+        warming = not readiness["live_feed"]
+        updates = []
+        with stage("parse"):
+            for domain, _, new_lines in batches:
+                for line in new_lines:
+                    try:
+                        payload = json.loads(line)
+                        
+                        # IDEMPOTENCY KEY: If this was a manual trigger (is_manual=True)
+                        # from this process, it was already applied and broadcasted by the
+                        # POST endpoint. Do not send again. Older ones (e.g. from before a
+                        # restart) are replayed like any other event.
+                        if payload.get("is_manual"):
+                            key = (domain, payload.get("timestamp"))
+                            if key in posted_manual:
+                                posted_manual.discard(key)
                                 continue
-                                
-                            payload["domain"] = domain  # Tag with domain
-                            # Send to frontend
-                            await manager.broadcast(json.dumps({
+                            
+                        payload["domain"] = domain  # Tag with domain
+                        seq = views.apply(domain, payload)
+                        if not warming:
+                            updates.append(json.dumps({
                                 "type": "data_update",
-                                "data": payload
+                                "seq": seq,
+                                "data": views.delta(domain, payload)
                             }))
-                        except:
-                            continue
-        
-        await asyncio.sleep(0.5)
+                    except:
+                        continue
+
+        # Send to frontend. Sends to open sockets complete without yielding, so yield
+        # between updates: disconnects get processed (no writes into dead transports)
+        # and requests are not starved by a large batch.
+        for message in updates:
+            await manager.broadcast(message)
+            await asyncio.sleep(0)
+
+        if not readiness["live_feed"] and mux.caught_up():
+            readiness["live_feed"] = True
+
+        if mux.pending():
+            continue
+        if fd is None:
+            await asyncio.sleep(0.5)
+            continue
+        # Sleep until inotify reports a change (or 0.5 s for the periodic rescan)
+        changed.clear()
+        loop.add_reader(fd, on_change)
+        try:
+            await asyncio.wait_for(changed.wait(), 0.5)
+        except asyncio.TimeoutError:
+            loop.remove_reader(fd)
 
 # Real-Time Agent Streamer (Reads output from Pathway AI)
 async def agent_stream_listener():
-    base_dir = os.getcwd()
-    agent_file = os.path.join(base_dir, "data", "agent_stream.jsonl")
-    
-    # Ensure file exists
-    if not os.path.exists(agent_file):
-        with open(agent_file, "w") as f:
-            pass
-            
-    file_pointer = 0
-    
-    # Fast forward to end on startup to avoid re-playing old history
-    if os.path.exists(agent_file):
-        file_pointer = os.path.getsize(agent_file)
+    def prepare():
+        # Ensure file exists, then fast forward to end on startup to avoid re-playing old history
+        if not os.path.exists(AGENT_FILE):
+            open(AGENT_FILE, "w").close()
+        return os.path.getsize(AGENT_FILE)
+
+    file_pointer = await run_io(prepare)
 
     while True:
-        if os.path.exists(agent_file):
-            current_size = os.path.getsize(agent_file)
-            if current_size > file_pointer:
-                with open(agent_file, "r", encoding="utf-8") as f:
-                    f.seek(file_pointer)
-                    new_lines = f.readlines()
-                    file_pointer = f.tell()
-                
-                for line in new_lines:
-                    try:
-                        record = json.loads(line)
-                        # Broadcast to UI
-                        await manager.broadcast(json.dumps({
-                            "type": "agent_response",
-                            "content": record.get("ai_response", "Processing..."),
-                            "raw": record
-                        }))
-                    except:
-                        pass
+        new_lines, file_pointer = await read_new_lines(AGENT_FILE, file_pointer)
+        for line in new_lines:
+            try:
+                record = json.loads(line)
+                # Broadcast to UI
+                await manager.broadcast(json.dumps({
+                    "type": "agent_response",
+                    "content": record.get("ai_response", "Processing..."),
+                    "raw": record
+                }))
+            except:
+                pass
         
         await asyncio.sleep(0.5)
 
+# Keeps the forensic index in step with agent_stream.jsonl (resumes from its stored offset)
+async def forensics_indexer():
+    while True:
+        try:
+            consumed = await run_forensics("ingest", AGENT_FILE)
+        except sqlite3.Error as e:
+            print(f"Forensic index error: {e}")
+            consumed = 0
+        if consumed < BATCH_LINES:
+            await asyncio.sleep(1.0)
+
+# Event-loop lag histogram and recent slow-callback stacks
+@app.get("/debug/loop")
+async def get_loop_stats():
+    return loop_monitor.stats()
+
+# On-demand sampling profile of this process as collapsed stacks (flamegraph.pl,
+# speedscope). mode=cpu counts threads burning CPU, mode=wall also shows waits.
+@app.get("/debug/profile")
+async def get_profile(seconds: float = 5.0, mode: str = "cpu"):
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(None, lambda: profile(seconds, mode=mode))
+    except (ValueError, RuntimeError) as e:
+        return {"status": "error", "message": str(e)}
+    return PlainTextResponse(collapsed(result["stacks"]), headers={
+        "X-Profile-Samples": str(result["samples"]),
+        "X-Profile-Seconds": str(result["seconds"]),
+        "X-Profile-Mode": result["mode"]
+    })
+
+# Continuous wall/CPU time per pipeline stage (read, parse, broadcast) in this process
+@app.get("/debug/stages")
+async def get_stages():
+    return stage_stats()
+
+# RSS, open FDs, live WebSockets and (SYNAPTIX_TRACEMALLOC=<frames>) the allocation
+# sites that grew most since startup
+@app.get("/debug/memory")
+async def get_memory(top: int = 10):
+    stats = await run_io(memory_stats, top)
+    stats["websockets"] = len(manager.active_connections)
+    return stats
+
 @app.on_event("startup")
 async def startup_event():
+    start_memtrace()
+    loop_monitor.start()
     # Start the background streamer
     asyncio.create_task(stream_live_data())
     # Start the Agent Listener (Pathway Output)
     asyncio.create_task(agent_stream_listener())
+    asyncio.create_task(forensics_indexer())
 
 if __name__ == "__main__":
     import uvicorn
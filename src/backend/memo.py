@@ -0,0 +1,85 @@
+import os
+import sqlite3
+import threading
+import time
+
+from responses import SKIP_RESPONSES
+
+# --- DECISION MEMO ---
+# Persistent (domain, timestamp, source_event) -> (ai_response, answered_by) cache
+# in front of consult_llm. After a crash the engines re-read whatever was not yet checkpointed;
+# events that were already decided are answered from here instead of re-calling the
+# LLM, so recovery replays cost a lookup, not a round-trip. Only the replay window
+# (events after the last snapshot / checkpoint) needs it, so rows are pruned once
+# they are older than MAX_AGE seconds or beyond the newest MAX_ROWS.
+
+MAX_AGE = float(os.environ.get("SYNAPTIX_MEMO_MAX_AGE_S", 3600))
+MAX_ROWS = int(os.environ.get("SYNAPTIX_MEMO_MAX_ROWS", 100_000))
+PRUNE_EVERY = 1000  # Inserts between prunes
+
+
+class DecisionMemo:
+    def __init__(self, db_path, max_age=MAX_AGE, max_rows=MAX_ROWS):
+        self.db_path = db_path
+        self.max_age = max_age
+        self.max_rows = max_rows
+        self.lock = threading.Lock()  # Pathway may call UDFs from several threads
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS decisions (domain TEXT NOT NULL, timestamp TEXT NOT NULL, "
+            "source_event TEXT NOT NULL, ai_response TEXT NOT NULL, created REAL NOT NULL DEFAULT 0, "
+            "answered_by TEXT NOT NULL DEFAULT '', PRIMARY KEY (domain, timestamp, source_event)) WITHOUT ROWID")
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(decisions)")]
+        if "created" not in columns:  # Memo from before pruning: old rows go first
+            self.db.execute("ALTER TABLE decisions ADD COLUMN created REAL NOT NULL DEFAULT 0")
+        if "answered_by" not in columns:  # Memo from before provenance: source unknown
+            self.db.execute("ALTER TABLE decisions ADD COLUMN answered_by TEXT NOT NULL DEFAULT ''")
+        self.db.execute("CREATE INDEX IF NOT EXISTS decisions_created ON decisions (created)")
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+        self.prune()
+
+    def get(self, domain, timestamp, source_event):
+        # (ai_response, answered_by) of the original decision, or None
+        with self.lock:
+            row = self.db.execute(
+                "SELECT ai_response, answered_by FROM decisions WHERE domain = ? AND timestamp = ? AND source_event = ?",
+                (domain, timestamp, source_event)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row
+
+    def put(self, domain, timestamp, source_event, ai_response, answered_by=""):
+        if not ai_response or ai_response.startswith(SKIP_RESPONSES):
+            return
+        with self.lock, self.db:
+            self.db.execute("INSERT OR REPLACE INTO decisions VALUES (?, ?, ?, ?, ?, ?)",
+                            (domain, timestamp, source_event, ai_response, time.time(), answered_by))
+            self.puts += 1
+        if self.puts % PRUNE_EVERY == 0:
+            self.prune()
+
+    def prune(self):
+        # Drop decisions past the replay window; returns how many were removed
+        with self.lock, self.db:
+            removed = self.db.execute("DELETE FROM decisions WHERE created < ?",
+                                      (time.time() - self.max_age,)).rowcount
+            if self.max_rows:
+                removed += self.db.execute(
+                    "DELETE FROM decisions WHERE created < (SELECT created FROM decisions "
+                    "ORDER BY created DESC LIMIT 1 OFFSET ?)", (self.max_rows - 1,)).rowcount
+        return removed
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.db.close()
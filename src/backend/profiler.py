@@ -0,0 +1,312 @@
+import json
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+# --- SAMPLING PROFILER & STAGE COUNTERS ---
+# Two views of where a process spends its time:
+#   profile(seconds)   on demand: a background thread snapshots every thread's Python
+#                      stack every INTERVAL and counts identical stacks. collapsed()
+#                      turns the counts into flamegraph.pl / speedscope input.
+#   stage(name)        always on: wall and CPU time per pipeline stage (read, parse,
+#                      filter, consult, audit, broadcast), a few clock reads per batch.
+#   memory_stats()     RSS, open FDs and, with SYNAPTIX_TRACEMALLOC=<frames>, the
+#                      allocation sites that grew most since startup (leak hunting).
+# The API serves all three under /debug/; engines dump them to data/profiles/ on signals.
+#
+#   kill -USR1 <engine pid>     # -> data/profiles/pw_engine-<pid>-<time>.folded
+#   kill -USR2 <engine pid>     # -> data/profiles/pw_engine-<pid>.memory.json
+
+INTERVAL = 0.005      # 200 Hz
+MAX_SECONDS = 120
+MODES = ("cpu", "wall")
+PROFILE_DIR = os.path.join(os.getcwd(), "data", "profiles")
+PROFILE_SECONDS = float(os.environ.get("SYNAPTIX_PROFILE_SECONDS", 10))
+
+_profile_lock = threading.Lock()  # One profile at a time per process
+
+
+def _cpu_clock(ident):
+    # Per-thread CPU clock id (POSIX), or None where unsupported
+    try:
+        return time.pthread_getcpuclockid(ident)
+    except (AttributeError, OSError):
+        return None
+
+
+# Leaf frames that mean "blocked waiting for work": the event loop in select(),
+# executor workers on their queue, threads in Condition/Event.wait(), FeedMux.wait()
+IDLE_LEAVES = {("selectors.py", None), ("thread.py", "_worker"), ("threading.py", "wait"), ("queue.py", "get"),
+               ("feeds.py", "wait")}
+
+
+def _idle(frame):
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return (filename, None) in IDLE_LEAVES or (filename, code.co_name) in IDLE_LEAVES
+
+
+def profile(seconds: float, interval: float = INTERVAL, mode: str = "cpu") -> dict:
+    # Blocks for `seconds`. mode="cpu" weights each sample by the share of the interval
+    # the thread spent on CPU, so a thread that only wakes briefly barely registers
+    # (falls back to wall where per-thread clocks are missing); mode="wall" counts
+    # every non-idle thread, so LLM and disk waits show up too.
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {', '.join(MODES)}")
+    seconds = min(max(float(seconds), interval), MAX_SECONDS)
+    if not _profile_lock.acquire(blocking=False):
+        raise RuntimeError("A profile is already running")
+    try:
+        return _sample(seconds, interval, mode)
+    finally:
+        _profile_lock.release()
+
+
+def _sample(seconds, interval, mode):
+    me = threading.get_ident()
+    labels = {}       # code object -> "func (file.py:line)"
+    clocks = {}       # thread ident -> (clock id, CPU time, wall time) at the last sample
+    stacks = Counter()
+    samples = 0
+    t0 = time.perf_counter()
+    deadline = t0 + seconds
+    while True:
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == me or _idle(frame):
+                continue
+            weight = 1.0
+            if mode == "cpu":
+                clock, last_cpu, last_wall = clocks.get(ident) or (_cpu_clock(ident), None, None)
+                if clock is not None:
+                    try:
+                        cpu = time.clock_gettime(clock)
+                    except OSError:  # Thread exited
+                        continue
+                    wall = time.perf_counter()
+                    clocks[ident] = (clock, cpu, wall)
+                    if last_cpu is None:
+                        continue
+                    weight = min(1.0, (cpu - last_cpu) / max(wall - last_wall, 1e-9))
+                    if weight <= 0:
+                        continue
+            parts = []
+            while frame is not None:
+                code = frame.f_code
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
+                parts.append(label)
+                frame = frame.f_back
+            parts.append(names.get(ident, f"thread-{ident}").replace(";", ":"))
+            stacks[";".join(reversed(parts))] += weight
+        samples += 1
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+        time.sleep(min(interval, deadline - now))
+    return {
+        "mode": mode,
+        "seconds": round(time.perf_counter() - t0, 3),
+        "interval_ms": interval * 1000,
+        "samples": samples,
+        "stacks": Counter({stack: round(w) for stack, w in stacks.items() if round(w) > 0})
+    }
+
+
+def collapsed(stacks) -> str:
+    # "thread;outer (a.py:1);inner (b.py:9) 42" per line, heaviest first
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+# --- STAGE COUNTERS ---
+STAGE_NAMES = ("read", "parse", "filter", "consult", "audit", "broadcast")
+
+
+class StageStats:
+    __slots__ = ("calls", "wall", "cpu", "lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.lock = threading.Lock()  # Pathway may run UDFs on several threads
+
+
+STAGES = {name: StageStats() for name in STAGE_NAMES}
+_stages_since = time.time()
+
+
+class Stage:
+    # `with stage("parse"): ...` -- time one batch (or call) of a stage. CPU is the
+    # calling thread's; in a coroutine both clocks also include whatever other tasks
+    # ran while it awaited, so keep async stages around the sends themselves.
+    __slots__ = ("stats", "t0", "c0")
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        self.c0 = time.thread_time()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self.t0
+        cpu = time.thread_time() - self.c0
+        stats = self.stats
+        with stats.lock:
+            stats.calls += 1
+            stats.wall += wall
+            stats.cpu += cpu
+        return False
+
+
+def stage(name: str) -> Stage:
+    stats = STAGES.get(name)
+    if stats is None:
+        stats = STAGES.setdefault(name, StageStats())
+    return Stage(stats)
+
+
+def stage_stats() -> dict:
+    elapsed = max(time.time() - _stages_since, 1e-9)
+    out = {}
+    for name, s in STAGES.items():
+        out[name] = {
+            "calls": s.calls,
+            "wall_ms": round(s.wall * 1000, 3),
+            "cpu_ms": round(s.cpu * 1000, 3),
+            "mean_wall_us": round(s.wall / s.calls * 1e6, 1) if s.calls else 0,
+            "wall_pct": round(s.wall / elapsed * 100, 2),  # Share of uptime spent in the stage
+            "cpu_pct": round(s.cpu / elapsed * 100, 2)
+        }
+    return {"since": datetime.fromtimestamp(_stages_since).isoformat(), "stages": out}
+
+
+# --- MEMORY & RESOURCES ---
+MEMTRACE_FRAMES = int(os.environ.get("SYNAPTIX_TRACEMALLOC", 0))  # 0 = off (tracing costs CPU)
+_memtrace_baseline = None
+_memory_lock = threading.Lock()  # Snapshots are large; never let signals stack them up
+
+
+def start_memtrace(frames: int = None) -> bool:
+    # Start tracemalloc and remember the startup snapshot that growth is measured from
+    global _memtrace_baseline
+    frames = MEMTRACE_FRAMES if frames is None else frames
+    if frames <= 0 or tracemalloc.is_tracing():
+        return False
+    tracemalloc.start(frames)
+    _memtrace_baseline = tracemalloc.take_snapshot()
+    return True
+
+
+def process_stats() -> dict:
+    # RSS and open descriptors from /proc (None where unavailable)
+    rss_kb = fds = None
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    rss_kb = int(line.split()[1])
+                    break
+        fds = len(os.listdir("/proc/self/fd"))
+    except OSError:
+        pass
+    return {"pid": os.getpid(), "rss_kb": rss_kb, "fds": fds, "threads": threading.active_count()}
+
+
+def memory_stats(top: int = 10) -> dict:
+    out = process_stats()
+    if not tracemalloc.is_tracing():
+        out["tracemalloc"] = None
+        return out
+    current, peak = tracemalloc.get_traced_memory()
+    out["tracemalloc"] = {"traced_kb": current // 1024, "peak_kb": peak // 1024, "top_growth": []}
+    if top <= 0:
+        return out  # Totals only: skip the (slow) snapshot
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+    snapshot = tracemalloc.take_snapshot().filter_traces(ignore)
+    key = "traceback" if tracemalloc.get_traceback_limit() > 1 else "lineno"
+    growth = sorted(snapshot.compare_to(_memtrace_baseline.filter_traces(ignore), key),
+                    key=lambda st: st.size_diff, reverse=True)
+    out["tracemalloc"]["top_growth"] = [{
+        "where": [f"{frame.filename}:{frame.lineno}" for frame in st.traceback],
+        "size_kb": round(st.size / 1024, 1),
+        "growth_kb": round(st.size_diff / 1024, 1),
+        "count": st.count,
+        "count_growth": st.count_diff
+    } for st in growth[:top] if st.size_diff > 0]
+    return out
+
+
+# --- SIGNAL TRIGGERS (engine processes) ---
+def dump_profile(process: str, seconds: float = PROFILE_SECONDS, mode: str = "cpu"):
+    # Profile this process for `seconds`, then write the collapsed stacks and the stage
+    # counters next to each other under data/profiles/
+    try:
+        result = profile(seconds, mode=mode)
+    except RuntimeError as e:
+        print(f"[PROFILE] {e}", flush=True)
+        return None
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    base = os.path.join(PROFILE_DIR, f"{process}-{os.getpid()}-{datetime.now():%Y%m%d-%H%M%S}")
+    with open(f"{base}.folded", "w", encoding="utf-8") as f:
+        f.write(collapsed(result["stacks"]))
+    stats = stage_stats()
+    with open(f"{base}.stages.txt", "w", encoding="utf-8") as f:
+        f.write(format_stages(stats))
+    print(f"[PROFILE] {result['samples']} samples over {result['seconds']}s -> {base}.folded", flush=True)
+    return base
+
+
+def format_stages(stats: dict) -> str:
+    lines = [f"stage counters since {stats['since']}",
+             f"{'stage':<10} {'calls':>10} {'wall ms':>12} {'cpu ms':>12} {'mean wall us':>13}"]
+    for name, s in stats["stages"].items():
+        lines.append(f"{name:<10} {s['calls']:>10,} {s['wall_ms']:>12,.1f} {s['cpu_ms']:>12,.1f} {s['mean_wall_us']:>13,.1f}")
+    return "\n".join(lines) + "\n"
+
+
+def dump_memory(process: str):
+    # Overwrites <process>-<pid>.memory.json, so a watcher always finds the latest
+    if not _memory_lock.acquire(blocking=False):
+        print("[MEMORY] A memory dump is already running", flush=True)
+        return None
+    try:
+        stats = {"at": datetime.now().isoformat(), **memory_stats()}
+    finally:
+        _memory_lock.release()
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    path = os.path.join(PROFILE_DIR, f"{process}-{os.getpid()}.memory.json")
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(stats, f)
+    os.replace(f"{path}.tmp", path)
+    return path
+
+
+def install_signal_handler(process: str):
+    # SIGUSR1 -> profile for SYNAPTIX_PROFILE_SECONDS, SIGUSR2 -> memory snapshot, each
+    # in a background thread. Also starts tracemalloc if SYNAPTIX_TRACEMALLOC is set.
+    # Signals are skipped where they do not exist (Windows) or off the main thread.
+    start_memtrace()
+    installed = False
+    for name, target in (("SIGUSR1", dump_profile), ("SIGUSR2", dump_memory)):
+        signum = getattr(signal, name, None)
+        if signum is None:
+            continue
+
+        def handler(*_, target=target):
+            threading.Thread(target=target, args=(process,), name="profile-dump", daemon=True).start()
+
+        try:
+            signal.signal(signum, handler)
+        except ValueError:
+            return False
+        installed = True
+    return installed
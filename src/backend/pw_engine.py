@@ -1,57 +1,161 @@
 import os
 import json
-import time
+import threading
+import importlib.util
 from datetime import datetime
-from dotenv import load_dotenv
-from openai import OpenAI
+from functools import reduce
+from domains import DOMAINS, domain_for_feed
+from feeds import FeedMux
+from profiler import stage, install_signal_handler
+from responses import AI_OFFLINE, OFFLINE_PROTOCOL, AUTO_PROTOCOL, LLM, RECALL, REFLEX, RULES
 
-load_dotenv()
+# Heavy dependencies (openai, pathway) are imported lazily so the engine is up and
+# tailing its feeds in milliseconds; only the backend that actually runs pays for them.
+try:
+    from dotenv import load_dotenv
+    load_dotenv()
+except ImportError:
+    pass
 
 # Simulation Data Paths
 DATA_DIR = os.path.join(os.getcwd(), "data", "live_feed")
 # Output for the Agent to write to (which Main.py will read)
 AGENT_OUTPUT = os.path.join(os.getcwd(), "data", "agent_stream.jsonl")
 
-# Try to import Pathway (Windows compatibility check)
-try:
-    import pathway as pw
-    PATHWAY_AVAILABLE = True
-except (ImportError, ModuleNotFoundError):
-    PATHWAY_AVAILABLE = False
-    pw = None
+# Pathway availability is probed without importing it (Windows compatibility check);
+# run_pathway_engine() falls back to the mock engine if the import itself fails.
+PATHWAY_AVAILABLE = importlib.util.find_spec("pathway") is not None
+pw = None
+
+# --- LLM CLIENT (lazy, shared) ---
+# One client (and connection pool) per process; the base URL can point at any
+# OpenAI-compatible endpoint (e.g. the soak test's stub LLM)
+LLM_BASE_URL = os.environ.get("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+_llm_client = None
+_llm_client_lock = threading.Lock()
+
+def get_llm_client(api_key: str):
+    global _llm_client
+    with _llm_client_lock:
+        if _llm_client is None or _llm_client.api_key != api_key:
+            from openai import OpenAI
+            _llm_client = OpenAI(
+                base_url=LLM_BASE_URL,
+                api_key=api_key,
+                max_retries=1, # Fail fast to avoid backlog
+                timeout=5.0    # Fast timeout
+            )
+        return _llm_client
+
+def prewarm_llm_client():
+    # Import openai and build the HTTP client off the hot path, so the first
+    # critical event doesn't pay for it
+    api_key = os.environ.get("OPENROUTER_API_KEY")
+    if api_key and "sk-or" in api_key:
+        threading.Thread(target=get_llm_client, args=(api_key,), daemon=True).start()
+
+# --- INCIDENT MEMORY ---
+# Nearest-neighbour lookup over past decisions (incidents.py); a near-identical
+# incident is answered from memory instead of another remote LLM call.
+INCIDENT_INDEX_DIR = os.path.join(os.getcwd(), "data", "incident_index")
+RECALL_THRESHOLD = float(os.environ.get("SYNAPTIX_RECALL_THRESHOLD", 0.95))
+_incident_index = None
+_incident_index_lock = threading.Lock()
+
+def get_incident_index():
+    global _incident_index
+    with _incident_index_lock:
+        if _incident_index is None:
+            try:
+                from incidents import IncidentIndex
+            except ImportError:  # NumPy not installed
+                _incident_index = False
+                return None
+            _incident_index = IncidentIndex(INCIDENT_INDEX_DIR, mode=os.environ.get("SYNAPTIX_INDEX_MODE", "flat"))
+        return _incident_index or None
+
+def start_incident_index():
+    # Load the index and keep it in step with agent_stream.jsonl from a background
+    # thread; consults only search it, and skip recall until it is loaded
+    def run():
+        index = get_incident_index()
+        if index is not None:
+            index.follow(AGENT_OUTPUT)
+    api_key = os.environ.get("OPENROUTER_API_KEY")
+    if api_key and "sk-or" in api_key:
+        threading.Thread(target=run, name="incident-index", daemon=True).start()
+
+def recall_incident(context: str, domain: str):
+    index = _incident_index
+    if not index:
+        return None
+    return index.recall(context, domain, RECALL_THRESHOLD)
+
+# --- LEARNED REFLEXES ---
+# Classifier trained offline on past decisions (reflex.py train); used instead of the
+# LLM when at least SYNAPTIX_REFLEX_THRESHOLD confident. No model published -> no-op.
+REFLEX_THRESHOLD = float(os.environ.get("SYNAPTIX_REFLEX_THRESHOLD", 0.9))
+_reflex_runtime = None
+
+def predict_reflex(context: str, domain: str):
+    global _reflex_runtime
+    if _reflex_runtime is None:
+        try:
+            from reflex import ReflexRuntime
+            _reflex_runtime = ReflexRuntime()
+        except ImportError:  # NumPy not installed
+            _reflex_runtime = False
+    if not _reflex_runtime:
+        return None
+    return _reflex_runtime.predict(domain, context, REFLEX_THRESHOLD)
 
 # --- CUSTOM LLM FUNCTION ---
 # We define a standard Python function and use pw.apply to call it distributedly when running on Pathway
+
+def protocol_response(context: str, fallback: str) -> str:
+    # Local deterministic reflex protocol (no key configured, or the LLM is rate-limited)
+    # Finance
+    if "CRASH" in context: return "ACTION: Circuit Breaker Tripped (Halt Trading)"
+    if "QUANTUM" in context: return "ACTION: Rotating Encryption Keys (Quantum Def)"
+    if "Flash" in context: return "ACTION: Injecting Liquidity (Stabilize)"
+    if "Dark Pool" in context: return "ACTION: Securing Order Book (Audit)"
+
+    # Health
+    if "CARDIAC" in context: return "ACTION: Administering Epinephrine (Code Blue)"
+    if "SEPSIS" in context: return "ACTION: Starting IV Antibiotics (Sepsis)"
+    if "Robot" in context: return "ACTION: Emergency Stop (Manual Override)"
+
+    # Dev
+    if "DDOS" in context: return "ACTION: Rerouting Traffic (Scrubbing Center)"
+    if "Ransomware" in context: return "ACTION: Isolating Network Segment (Containment)"
+    if "Leak" in context: return "ACTION: Revoking API Keys (Security Rotation)"
+
+    return f"{fallback}: Threat Contained ({context.split('|')[0]})"
+
 def consult_llm(context: str, domain: str) -> str:
+    return decide(context, domain)[0]
+
+def decide(context: str, domain: str):
+    # (response, source): source says who answered (responses.py), recorded with the
+    # decision as "answered_by" so only real LLM decisions are learned from
     api_key = os.environ.get("OPENROUTER_API_KEY")
     model = os.environ.get("OPENROUTER_MODEL", "google/gemini-2.0-flash-exp:free")
     
     if not api_key or "sk-or" not in api_key:
         # Local deterministic reflex protocol fallback (for immediate zero-config testing)
-        # Finance
-        if "CRASH" in context: return "ACTION: Circuit Breaker Tripped (Halt Trading)"
-        if "QUANTUM" in context: return "ACTION: Rotating Encryption Keys (Quantum Def)"
-        if "Flash" in context: return "ACTION: Injecting Liquidity (Stabilize)"
-        if "Dark Pool" in context: return "ACTION: Securing Order Book (Audit)"
-        
-        # Health
-        if "CARDIAC" in context: return "ACTION: Administering Epinephrine (Code Blue)"
-        if "SEPSIS" in context: return "ACTION: Starting IV Antibiotics (Sepsis)"
-        if "Robot" in context: return "ACTION: Emergency Stop (Manual Override)"
-        
-        # Dev
-        if "DDOS" in context: return "ACTION: Rerouting Traffic (Scrubbing Center)"
-        if "Ransomware" in context: return "ACTION: Isolating Network Segment (Containment)"
-        if "Leak" in context: return "ACTION: Revoking API Keys (Security Rotation)"
-
-        return f"⚠️ OFFLINE PROTOCOL: Threat Contained ({context.split('|')[0]})"
-
-    client = OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
-        max_retries=1, # Fail fast to avoid backlog
-        timeout=5.0    # Fast timeout
-    )
+        return protocol_response(context, OFFLINE_PROTOCOL), RULES
+
+    # Answer from memory when a near-identical incident was already resolved
+    recalled = recall_incident(context, domain)
+    if recalled:
+        return recalled, RECALL
+
+    # Confident learned reflex: no LLM round-trip
+    reflex = predict_reflex(context, domain)
+    if reflex:
+        return reflex, REFLEX
+
+    client = get_llm_client(api_key)
     
     # Personas
     system_prompt = "You are Synaptix AI."
@@ -87,164 +191,308 @@ def consult_llm(context: str, domain: str) -> str:
                 {"role": "user", "content": f"CRITICAL INCIDENT: {context}"}
             ]
         )
-        return response.choices[0].message.content.strip()
+        return response.choices[0].message.content.strip(), LLM
     except Exception as e:
         err_str = str(e)
         if "429" in err_str:
             # SAFETY FALLBACK: If API is overloaded, use a deterministic but SMART response
             # This ensures every scenario gets a unique, relevant action even if AI is busy.
-            
-            # Finance
-            if "CRASH" in context: return "ACTION: Circuit Breaker Tripped (Halt Trading)"
-            if "QUANTUM" in context: return "ACTION: Rotating Encryption Keys (Quantum Def)"
-            if "Flash" in context: return "ACTION: Injecting Liquidity (Stabilize)"
-            if "Dark Pool" in context: return "ACTION: Securing Order Book (Audit)"
-            
-            # Health
-            if "CARDIAC" in context: return "ACTION: Administering Epinephrine (Code Blue)"
-            if "SEPSIS" in context: return "ACTION: Starting IV Antibiotics (Sepsis)"
-            if "Robot" in context: return "ACTION: Emergency Stop (Manual Override)"
-            
-            # Dev
-            if "DDOS" in context: return "ACTION: Rerouting Traffic (Scrubbing Center)"
-            if "Ransomware" in context: return "ACTION: Isolating Network Segment (Containment)"
-            if "Leak" in context: return "ACTION: Revoking API Keys (Security Rotation)"
-
-            return f"⚠️ AUTO-PROTOCOL: Threat Contained ({context.split('|')[0]})"
-        return f"AI OFFLINE: {err_str[:15]}..."
-
-# --- SCHEMAS (Only defined if Pathway is installed) ---
-if PATHWAY_AVAILABLE:
-    class FinanceSchema(pw.Schema):
-        timestamp: str
-        symbol: str
-        price: float
-        news: str
-        sentiment: str
-
-    class HealthSchema(pw.Schema):
-        timestamp: str
-        patient_id: str
-        bpm: int
-        spo2: int
-        status: str
-        notes: str
-
-    class LogSchema(pw.Schema):
-        timestamp: str
-        service: str
-        level: str
-        message: str
-        action_required: bool
-
-# Helper for Throttling
-def is_lucky_10_percent(ts: str) -> bool:
-    return int(hash(ts)) % 100 == 0
+            return protocol_response(context, AUTO_PROTOCOL), RULES
+        return f"{AI_OFFLINE}: {err_str[:15]}...", RULES
 
-# Typed helpers for domain columns (required for Pathway < 0.28 strict typing)
-def get_domain_finance(ts: str) -> str:
-    return "finance"
+# --- PERSISTENCE & RECOVERY ---
+# Engine state survives restarts under data/engine_state/:
+#   pathway/            Pathway snapshots (input offsets + operator state)
+#   mock_offsets.json   byte offset per feed for the mock engine
+#   decision_memo.db    consult_llm results per event (memo.py)
+# Delete the directory to make the engines start from scratch.
+STATE_DIR = os.path.join(os.getcwd(), "data", "engine_state")
+PATHWAY_STATE_DIR = os.path.join(STATE_DIR, "pathway")
+MOCK_OFFSETS = os.path.join(STATE_DIR, "mock_offsets.json")
+DECISION_MEMO = os.path.join(STATE_DIR, "decision_memo.db")
+SNAPSHOT_INTERVAL_MS = int(os.environ.get("SYNAPTIX_SNAPSHOT_INTERVAL_MS", 1000))
+_decision_memo = None
+_decision_memo_lock = threading.Lock()
 
-def get_domain_healthcare(ts: str) -> str:
-    return "healthcare"
+def get_decision_memo():
+    global _decision_memo
+    with _decision_memo_lock:
+        if _decision_memo is None:
+            from memo import DecisionMemo
+            _decision_memo = DecisionMemo(DECISION_MEMO)
+        return _decision_memo
 
-def get_domain_dev(ts: str) -> str:
-    return "dev"
+def decide_memo(context: str, domain: str, timestamp: str):
+    # decide(), memoized per event: events re-read after a crash (anything newer than
+    # the last snapshot) get their original decision and its source back without an
+    # LLM call
+    with stage("consult"):
+        memo = get_decision_memo()
+        cached = memo.get(domain, timestamp, context)
+        if cached is not None:
+            return cached
+        response, source = decide(context, domain)
+        memo.put(domain, timestamp, context, response, source)
+        return response, source
 
-# --- REAL PATHWAY STREAMING ENGINE ---
-def run_real_pathway_engine():
-    print("🚀 Starting Pathway Streaming Engine in Linux environment...")
-    
-    # 1. READ (Input Streams)
-    fin_raw = pw.io.jsonlines.read(
-        os.path.join(DATA_DIR, "finance.jsonl"),
-        schema=FinanceSchema,
-        mode="streaming"
-    )
-    hlth_raw = pw.io.jsonlines.read(
-        os.path.join(DATA_DIR, "healthcare.jsonl"),
-        schema=HealthSchema,
-        mode="streaming"
-    )
-    dev_raw = pw.io.jsonlines.read(
-        os.path.join(DATA_DIR, "developer.jsonl"),
-        schema=LogSchema,
-        mode="streaming"
+def pathway_persistence_config():
+    os.makedirs(PATHWAY_STATE_DIR, exist_ok=True)
+    return pw.persistence.Config(
+        pw.persistence.Backend.filesystem(PATHWAY_STATE_DIR),
+        snapshot_interval_ms=SNAPSHOT_INTERVAL_MS
     )
 
-    # 2. FILTER (Critical Events Only)
-    fin_crit = fin_raw.filter(pw.this.news != "Regular Trading")  
-    hlth_crit = hlth_raw.filter(pw.this.status == "CRITICAL")
-    dev_crit = dev_raw.filter((pw.this.level == "FATAL") | (pw.this.level == "ERROR"))
+def import_pathway():
+    global pw
+    if pw is not None:
+        return pw
+    import pathway as pw
+    return pw
 
-    # 3. UNIFY & FORMAT for AI
-    fin_context = fin_crit.select(
-        domain=pw.apply(get_domain_finance, pw.this.timestamp),
-        context=pw.apply(lambda s, p, n: f"Symbol: {s} | Price: {p} | News: {n}", pw.this.symbol, pw.this.price, pw.this.news),
-        timestamp=pw.this.timestamp
+# Helper for Throttling
+def is_lucky_10_percent(ts: str) -> bool:
+    return int(hash(ts)) % 100 == 0
+
+# --- REAL PATHWAY STREAMING ENGINE ---
+def domain_alerts(domain):
+    # Critical events of one registered domain as (domain, context, timestamp) rows.
+    # Built-in domains filter and format with native column expressions; plugin
+    # domains without them run their Python predicate/formatter per row.
+    fields = list(domain.schema)
+    raw = pw.io.jsonlines.read(
+        os.path.join(DATA_DIR, domain.feed),
+        name=f"{domain.feed_stem}_feed",  # Stable id: persisted offsets are keyed by it
+        schema=pw.schema_from_types(**domain.schema),
+        mode="streaming"
     )
-    
-    hlth_context = hlth_crit.select(
-        domain=pw.apply(get_domain_healthcare, pw.this.timestamp),
-        context=pw.apply(lambda p, s, n: f"Patient: {p} | Status: {s} | Notes: {n}", pw.this.patient_id, pw.this.status, pw.this.notes),
+    if domain.critical_expr is not None:
+        crit = raw.filter(domain.critical_expr(pw.this))
+    else:
+        crit = raw.filter(pw.apply_with_type(lambda *v: domain.critical(dict(zip(fields, v))), bool,
+                                             *[raw[f] for f in fields]))
+    if domain.context_expr is not None:
+        context = domain.context_expr(pw.this)
+    else:
+        context = pw.apply_with_type(lambda *v: domain.context(dict(zip(fields, v))), str,
+                                     *[crit[f] for f in fields])
+    return crit.select(
+        domain=domain.name,  # Constant str column (typed literals need Pathway >= 0.28)
+        context=context,
         timestamp=pw.this.timestamp
     )
 
-    dev_context = dev_crit.select(
-        domain=pw.apply(get_domain_dev, pw.this.timestamp),
-        context=pw.apply(lambda s, l, m: f"Service: {s} | Level: {l} | Msg: {m}", pw.this.service, pw.this.level, pw.this.message),
-        timestamp=pw.this.timestamp
-    )
+def run_real_pathway_engine():
+    print("🚀 Starting Pathway Streaming Engine in Linux environment...")
+    import_pathway()
+    prewarm_llm_client()
+    start_incident_index()
+    
+    # 1-3. READ, FILTER (Critical Events Only) & FORMAT for AI, one graph per registered domain
+    alerts = [domain_alerts(d) for d in DOMAINS.values()]
 
     # Merge streams
-    unified_alerts = fin_context.promise_universes_are_disjoint(hlth_context).concat(hlth_context).promise_universes_are_disjoint(dev_context).concat(dev_context)
+    unified_alerts = reduce(lambda a, b: a.promise_universes_are_disjoint(b).concat(b), alerts)
     
     # 5. THINK (AI Processing)
-    agent_thoughts = unified_alerts.select(
+    decisions = unified_alerts.select(
+        pw.this.timestamp,
+        pw.this.domain,
+        pw.this.context,
+        decision=pw.apply_with_type(decide_memo, tuple[str, str], pw.this.context, pw.this.domain, pw.this.timestamp)
+    )
+    agent_thoughts = decisions.select(
         pw.this.timestamp,
         pw.this.domain,
         source_event=pw.this.context,
-        ai_response=pw.apply(consult_llm, pw.this.context, pw.this.domain),
-        type=pw.apply(lambda _: "agent_log", pw.this.timestamp)
+        ai_response=pw.this.decision[0],
+        answered_by=pw.this.decision[1],
+        type="agent_log"
     )
     
-    # 6. AUDIT TRAIL (Proof of Work)
-    finance_audit = agent_thoughts.filter(pw.this.domain == "finance").select(
-        timestamp=pw.this.timestamp,
-        action=pw.this.ai_response
-    )
-    pw.io.csv.write(finance_audit, os.path.join(DATA_DIR, "audit_trades.csv"))
+    # 6. AUDIT TRAIL + WRITE (Output for Main.py to consume). Appended rather than
+    # written with pw.io.jsonlines/csv.write, which truncate their files on start and
+    # would wipe the history every time the engine resumes from a snapshot.
+    on_change, on_time_end = decision_appender(recent_emitted())
+    pw.io.subscribe(agent_thoughts, on_change=on_change, on_time_end=on_time_end)
 
-    health_audit = agent_thoughts.filter(pw.this.domain == "healthcare").select(
-        timestamp=pw.this.timestamp,
-        decision=pw.this.ai_response
-    )
-    pw.io.csv.write(health_audit, os.path.join(DATA_DIR, "audit_medical_logs.csv"))
+    # 6. RUN (resumes from the last snapshot in PATHWAY_STATE_DIR, if any)
+    pw.run(persistence_config=pathway_persistence_config())
 
-    dev_audit = agent_thoughts.filter(pw.this.domain == "dev").select(
-        timestamp=pw.this.timestamp,
-        command=pw.this.ai_response
-    )
-    pw.io.csv.write(dev_audit, os.path.join(DATA_DIR, "audit_ops_actions.csv"))
+REPLAY_TAIL_BYTES = 1 << 20  # End of agent_stream.jsonl checked for replayed decisions
 
-    # 5. WRITE (Output for Main.py to consume)
-    pw.io.jsonlines.write(
-        agent_thoughts,
-        AGENT_OUTPUT,
-    )
+def recent_emitted():
+    # Decisions at the end of agent_stream.jsonl. A restore re-runs the events read
+    # after the last snapshot (well under a second of output); these are skipped.
+    size = os.path.getsize(AGENT_OUTPUT) if os.path.exists(AGENT_OUTPUT) else 0
+    return load_emitted({"agent_stream_size": max(0, size - REPLAY_TAIL_BYTES)})
+
+AGENT_FIELDS = ("timestamp", "domain", "source_event", "ai_response", "answered_by", "type")
 
-    # 6. RUN
-    pw.run()
+def decision_appender(emitted):
+    # pw.io.subscribe callbacks: collect a minibatch of decisions, then append it to
+    # the audit CSVs and agent_stream.jsonl (last, like the mock engine)
+    pending = []
+
+    def on_change(key, row, time, is_addition):
+        if is_addition:
+            pending.append(row)
+
+    def on_time_end(time):
+        rows = []
+        for row in pending:
+            replay = (row["domain"], row["timestamp"], row["source_event"])
+            if replay in emitted:
+                emitted.discard(replay)
+                continue
+            rows.append(row)
+        pending.clear()
+        if not rows:
+            return
+        for d in DOMAINS.values():
+            audit = [[r["timestamp"], r["ai_response"]] for r in rows if r["domain"] == d.name]
+            if audit:
+                write_csv_rows(os.path.join(DATA_DIR, d.audit_file), ["timestamp", d.audit_column], audit)
+        with open(AGENT_OUTPUT, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps({k: r[k] for k in AGENT_FIELDS}) + "\n"
+                         for r in rows)
+
+    return on_change, on_time_end
 
 # --- MOCK WINDOWS COMPATIBLE STREAMING ENGINE ---
-def write_csv_audit(filepath, headers, row_data):
+def write_csv_rows(filepath, headers, rows):
     import csv
     file_exists = os.path.exists(filepath)
     with open(filepath, "a", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         if not file_exists:
             writer.writerow(headers)
-        writer.writerow(row_data)
+        writer.writerows(rows)
+
+def write_csv_audit(filepath, headers, row_data):
+    write_csv_rows(filepath, headers, [row_data])
+
+def critical_context(domain: str, data: dict):
+    # Same filter + formatting as the Pathway graph; None for non-critical events
+    d = DOMAINS[domain]
+    return d.context(data) if d.critical(data) else None
+
+def load_mock_offsets():
+    # Checkpointed [inode, byte offset] per feed file name, plus the size of
+    # agent_stream.jsonl at that point (empty on first run)
+    if not os.path.exists(MOCK_OFFSETS):
+        return {}
+    with open(MOCK_OFFSETS, "r") as f:
+        return json.load(f)
+
+def mock_start(saved):
+    # FeedMux start offsets: resume from the checkpoint; feeds without one (first run)
+    # start at their current end so old history is not replayed
+    def start(path, size):
+        position = saved.get(os.path.basename(path))
+        if position is None:
+            return size
+        if isinstance(position, int):  # Checkpoint from before rotation support
+            return min(position, size)
+        return tuple(position)  # FeedMux resumes in <feed>.1 if it was rotated meanwhile
+    return start
+
+def save_mock_offsets(positions):
+    # positions: FeedMux.positions(), {path: (inode, offset)}
+    os.makedirs(STATE_DIR, exist_ok=True)
+    state = {os.path.basename(path): list(position) for path, position in positions.items()}
+    state["agent_stream_size"] = os.path.getsize(AGENT_OUTPUT) if os.path.exists(AGENT_OUTPUT) else 0
+    tmp = f"{MOCK_OFFSETS}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, MOCK_OFFSETS)
+
+def load_emitted(saved):
+    # Decisions written after the last checkpoint. A crash before the checkpoint
+    # replays their events; poll_feeds skips these so nothing is written twice.
+    size = saved.get("agent_stream_size")
+    emitted = set()
+    if size is None or not os.path.exists(AGENT_OUTPUT):
+        return emitted
+    with open(AGENT_OUTPUT, "rb") as f:
+        f.seek(size)
+        for line in f:
+            try:
+                rec = json.loads(line)
+                emitted.add((rec["domain"], rec["timestamp"], rec["source_event"]))
+            except (ValueError, KeyError, TypeError):
+                continue
+    return emitted
+
+def poll_feeds(mux, verbose=True, emitted=None):
+    # One pass over every feed that changed: decide on new critical events, write the
+    # outputs, then checkpoint the offsets. A crash between the two re-reads that batch
+    # on restart: the decision memo answers it without the LLM, and decisions already
+    # in agent_stream.jsonl (`emitted`, see load_emitted) are not written again.
+    # Returns lines consumed.
+    if verbose:
+        from termcolor import colored
+    consumed = 0
+    with stage("read"):
+        batches = mux.poll()
+    for domain, _, lines in batches:
+        d = DOMAINS[domain]
+        consumed += len(lines)
+
+        with stage("parse"):
+            events = []
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except ValueError as ex:
+                    if verbose:
+                        print(colored(f"Error parsing log line: {ex}", "red"))
+
+        with stage("filter"):
+            alerts = []
+            for data in events:
+                try:
+                    context = critical_context(domain, data)
+                    if context:
+                        alerts.append((data.get("timestamp", datetime.now().isoformat()), context))
+                except Exception as ex:
+                    if verbose:
+                        print(colored(f"Error filtering event: {ex}", "red"))
+
+        for timestamp, context in alerts:
+            if emitted and (domain, timestamp, context) in emitted:
+                emitted.discard((domain, timestamp, context))
+                continue
+            if verbose:
+                print(colored(f"\n⚡ [CRITICAL EVENT] {domain.upper()} Alert: {context}", "magenta", attrs=["bold"]))
+                print(colored("🧠 [AI COGNITIVE SHIFT] Consulting Synaptix safety protocols...", "cyan"))
+            
+            # Call LLM (memoized per event across restarts)
+            ai_response, answered_by = decide_memo(context, domain, timestamp)
+            if verbose:
+                print(colored(f"🛡️ [REFLEX RESPONSE] Action Engaged: {ai_response}", "green", attrs=["bold"]))
+            
+            with stage("audit"):
+                # 1. Write to the domain's CSV audit log (Proof of Work)
+                audit_path = os.path.join(DATA_DIR, d.audit_file)
+                write_csv_audit(audit_path, ["timestamp", d.audit_column], [timestamp, ai_response])
+
+                # 2. Write to agent_stream.jsonl, last: replays are deduplicated against it
+                agent_thought = {
+                    "timestamp": timestamp,
+                    "domain": domain,
+                    "source_event": context,
+                    "ai_response": ai_response,
+                    "answered_by": answered_by,
+                    "type": "agent_log"
+                }
+                with open(AGENT_OUTPUT, "a", encoding="utf-8") as out_f:
+                    out_f.write(json.dumps(agent_thought) + "\n")
+    if consumed:
+        save_mock_offsets(mux.positions())
+    return consumed
 
 def run_mock_pathway_engine():
     from termcolor import colored
@@ -256,115 +504,41 @@ def run_mock_pathway_engine():
     
     os.makedirs(DATA_DIR, exist_ok=True)
     
-    # Setup files
-    files = {
-        "finance": os.path.join(DATA_DIR, "finance.jsonl"),
-        "healthcare": os.path.join(DATA_DIR, "healthcare.jsonl"),
-        "dev": os.path.join(DATA_DIR, "developer.jsonl")
-    }
-    
-    # Ensure files exist
-    for fpath in files.values():
+    # Ensure every registered feed exists
+    for d in DOMAINS.values():
+        fpath = os.path.join(DATA_DIR, d.feed)
         if not os.path.exists(fpath):
             with open(fpath, "w") as f:
                 pass
                 
-    # Start pointers at current end of file to prevent reprocessing historical records
-    pointers = {domain: os.path.getsize(fpath) for domain, fpath in files.items()}
+    # One multiplexed reader for every feed in DATA_DIR (shards included). Resume from
+    # the last checkpoint (first run: start at the current end of file and checkpoint
+    # right away, so events written while the engine is down are not lost)
+    saved = load_mock_offsets()
+    emitted = load_emitted(saved)
+    mux = FeedMux(resolve=domain_for_feed, start=mock_start(saved))
+    mux.follow(DATA_DIR)
+    save_mock_offsets(mux.positions())
     
+    prewarm_llm_client()
+    start_incident_index()
     print(colored(f"Monitoring live streams in: {DATA_DIR}", "cyan"))
     print(colored(f"Writing agent decisions to: {AGENT_OUTPUT}\n", "cyan"))
     
     while True:
-        for domain, filepath in files.items():
-            if not os.path.exists(filepath):
-                continue
-            
-            current_size = os.path.getsize(filepath)
-            if current_size < pointers[domain]:
-                # File was truncated/cleared (e.g. simulation reset)
-                pointers[domain] = 0
-                
-            if current_size > pointers[domain]:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    f.seek(pointers[domain])
-                    lines = f.readlines()
-                    pointers[domain] = f.tell()
-                    
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        data = json.loads(line)
-                        
-                        # Apply Filtering Logic
-                        is_critical = False
-                        context = ""
-                        timestamp = data.get("timestamp", datetime.now().isoformat())
-                        
-                        if domain == "finance":
-                            news = data.get("news", "Regular Trading")
-                            if news != "Regular Trading":
-                                is_critical = True
-                                symbol = data.get("symbol", "N/A")
-                                price = data.get("price", 0.0)
-                                context = f"Symbol: {symbol} | Price: {price} | News: {news}"
-                                
-                        elif domain == "healthcare":
-                            status = data.get("status", "NORMAL")
-                            if status == "CRITICAL":
-                                is_critical = True
-                                patient_id = data.get("patient_id", "N/A")
-                                notes = data.get("notes", "")
-                                context = f"Patient: {patient_id} | Status: {status} | Notes: {notes}"
-                                
-                        elif domain == "dev":
-                            level = data.get("level", "INFO")
-                            if level in ["ERROR", "FATAL"]:
-                                is_critical = True
-                                service = data.get("service", "N/A")
-                                message = data.get("message", "")
-                                context = f"Service: {service} | Level: {level} | Msg: {message}"
-                                
-                        if is_critical and context:
-                            print(colored(f"\n⚡ [CRITICAL EVENT] {domain.upper()} Alert: {context}", "magenta", attrs=["bold"]))
-                            print(colored("🧠 [AI COGNITIVE SHIFT] Consulting Synaptix safety protocols...", "cyan"))
-                            
-                            # Call LLM
-                            ai_response = consult_llm(context, domain)
-                            print(colored(f"🛡️ [REFLEX RESPONSE] Action Engaged: {ai_response}", "green", attrs=["bold"]))
-                            
-                            # 1. Write to agent_stream.jsonl
-                            agent_thought = {
-                                "timestamp": timestamp,
-                                "domain": domain,
-                                "source_event": context,
-                                "ai_response": ai_response,
-                                "type": "agent_log"
-                            }
-                            with open(AGENT_OUTPUT, "a", encoding="utf-8") as out_f:
-                                out_f.write(json.dumps(agent_thought) + "\n")
-                                
-                            # 2. Write to domain CSV audit logs (Proof of Work)
-                            if domain == "finance":
-                                audit_path = os.path.join(DATA_DIR, "audit_trades.csv")
-                                write_csv_audit(audit_path, ["timestamp", "action"], [timestamp, ai_response])
-                            elif domain == "healthcare":
-                                audit_path = os.path.join(DATA_DIR, "audit_medical_logs.csv")
-                                write_csv_audit(audit_path, ["timestamp", "decision"], [timestamp, ai_response])
-                            elif domain == "dev":
-                                audit_path = os.path.join(DATA_DIR, "audit_ops_actions.csv")
-                                write_csv_audit(audit_path, ["timestamp", "command"], [timestamp, ai_response])
-                                
-                    except Exception as ex:
-                        print(colored(f"Error parsing log line: {ex}", "red"))
-                        
-        time.sleep(0.5)
+        poll_feeds(mux, emitted=emitted)
+        mux.wait(0.5)
 
 # --- RUN ENGINE CONFIG ---
 def run_pathway_engine():
+    # kill -USR1 <pid>: profile for SYNAPTIX_PROFILE_SECONDS, kill -USR2: memory -> data/profiles/
+    install_signal_handler("pw_engine")
     if PATHWAY_AVAILABLE:
+        try:
+            import_pathway()
+        except ImportError:
+            run_mock_pathway_engine()
+            return
         run_real_pathway_engine()
     else:
         run_mock_pathway_engine()
@@ -0,0 +1,290 @@
+import argparse
+import csv
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+from domains import DOMAINS
+from embed import hashed
+from responses import SKIP_RESPONSES, FALLBACK_RESPONSES, LEARNABLE_SOURCES
+
+# --- LEARNED REFLEX CLASSIFIER ---
+# A linear softmax model over hashed n-gram features (embed.py), trained offline on
+# past agent decisions and scored in-process in microseconds. consult_llm uses its
+# answer when the model is confident and escalates to the LLM otherwise.
+#
+#   python src/backend/reflex.py train      # fit + publish a new model version
+#   python src/backend/reflex.py list       # show published versions
+#
+# Every training run writes data/reflex_models/reflex-<version>.npz and then points
+# CURRENT at it (atomic rename); running engines pick the new version up on their
+# next reload check without a restart. Only the last KEEP_VERSIONS are kept.
+#
+# Labels are LLM responses normalised to a bounded action vocabulary: entity ids and
+# numbers are stripped, fallback/offline responses dropped, and only the MAX_CLASSES
+# most frequent actions get a (FEATURE_DIM-wide) weight column.
+
+DATA_DIR = os.path.join(os.getcwd(), "data", "live_feed")
+AGENT_OUTPUT = os.path.join(os.getcwd(), "data", "agent_stream.jsonl")
+MODEL_DIR = os.path.join(os.getcwd(), "data", "reflex_models")
+FEATURE_DIM = 2 ** 15
+
+# Audit trail file -> (domain, action column)
+AUDIT_FILES = {d.audit_file: (name, d.audit_column) for name, d in DOMAINS.items()}
+MAX_CLASSES = 64
+MAX_ACTION_WORDS = 12  # The LLM is asked for at most 12 words
+KEEP_VERSIONS = 5
+
+_ENTITY_PARENS = re.compile(r"\([^()]*\d[^()]*\)")  # "(CRITICAL INCIDENT: Patient: P-000218)"
+_ENTITY_TOKEN = re.compile(r"\S*\d\S*")              # Ids, prices, counts
+
+
+def model_text(domain: str, source_event: str) -> str:
+    return f"{domain} | {source_event}"
+
+
+def normalise_action(response):
+    # Action label for a response, or None for responses that are not decisions
+    if not response or response.startswith(SKIP_RESPONSES + FALLBACK_RESPONSES):
+        return None
+    text = _ENTITY_TOKEN.sub("", _ENTITY_PARENS.sub("", response))
+    text = re.sub(r"\(\s*\)", "", text)
+    words = text.split()[:MAX_ACTION_WORDS]
+    return " ".join(words).strip(" .,;:-") or None
+
+
+# --- TRAINING DATA ---
+def load_examples(agent_stream=AGENT_OUTPUT, data_dir=DATA_DIR, include_untagged=False):
+    # (text, label) pairs. agent_stream.jsonl carries source_event + ai_response; the
+    # audit CSVs only carry the action, so their rows are joined back to the source
+    # event by (domain, timestamp) and de-duplicated against the stream. Only
+    # decisions answered_by the LLM or an operator count: the model's own answers
+    # (and recalled ones) would reinforce themselves. Records written before
+    # answered_by existed are skipped unless include_untagged.
+    sources = {}
+    pairs = {}
+    if os.path.exists(agent_stream):
+        with open(agent_stream, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                domain, ts = rec.get("domain", ""), rec.get("timestamp", "")
+                event, response = rec.get("source_event"), rec.get("ai_response")
+                if not event:
+                    continue
+                source = rec.get("answered_by")
+                if source not in LEARNABLE_SOURCES and not (source is None and include_untagged):
+                    continue
+                sources[(domain, ts)] = event
+                action = normalise_action(response)
+                if action:
+                    pairs[(domain, ts, action)] = model_text(domain, event)
+
+    for name, (domain, column) in AUDIT_FILES.items():
+        path = os.path.join(data_dir, name)
+        if not os.path.exists(path):
+            continue
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                ts, action = row.get("timestamp", ""), normalise_action(row.get(column))
+                event = sources.get((domain, ts))
+                if event and action:
+                    pairs.setdefault((domain, ts, action), model_text(domain, event))
+
+    return [(text, action) for (_, _, action), text in pairs.items()]
+
+
+# --- MODEL ---
+class ReflexModel:
+    __slots__ = ("weights", "bias", "classes", "dim", "version", "meta")
+
+    def __init__(self, weights, bias, classes, dim=FEATURE_DIM, version="", meta=None):
+        self.weights = weights
+        self.bias = bias
+        self.classes = classes
+        self.dim = dim
+        self.version = version
+        self.meta = meta or {}
+
+    def _logits(self, text):
+        hashes, signs = hashed(text)
+        rows = (hashes % self.dim).astype(np.int64)
+        return signs.astype(np.float32) @ self.weights[rows] + self.bias
+
+    def predict(self, text):
+        # (label, confidence)
+        logits = self._logits(text)
+        logits -= logits.max()
+        probs = np.exp(logits)
+        probs /= probs.sum()
+        best = int(np.argmax(probs))
+        return self.classes[best], float(probs[best])
+
+    def save(self, path):
+        np.savez(path, weights=self.weights, bias=self.bias, dim=self.dim,
+                 classes=json.dumps(self.classes), meta=json.dumps(self.meta))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            version = os.path.splitext(os.path.basename(path))[0].replace("reflex-", "")
+            return cls(data["weights"], data["bias"], json.loads(str(data["classes"])), int(data["dim"]),
+                       version, json.loads(str(data["meta"])))
+
+
+def train(examples, min_count=2, epochs=8, lr=0.5, l2=1e-6, dim=FEATURE_DIM, seed=0, max_classes=MAX_CLASSES):
+    # Softmax regression with per-example AdaGrad updates on the sparse rows touched.
+    # Only the max_classes most frequent labels are learned; the rest escalate.
+    counts = {}
+    for _, label in examples:
+        counts[label] = counts.get(label, 0) + 1
+    frequent = sorted(counts.items(), key=lambda lc: (-lc[1], lc[0]))[:max_classes]
+    classes = sorted(label for label, c in frequent if c >= min_count)
+    if not classes:
+        raise ValueError("Not enough labelled decisions to train (need min_count per action)")
+    class_ids = {label: i for i, label in enumerate(classes)}
+    data = []
+    for text, label in examples:
+        if label in class_ids:
+            hashes, signs = hashed(text)
+            data.append(((hashes % dim).astype(np.int64), signs.astype(np.float32), class_ids[label]))
+
+    n_classes = len(classes)
+    weights = np.zeros((dim, n_classes), dtype=np.float32)
+    bias = np.zeros(n_classes, dtype=np.float32)
+    g2_w = np.full((dim, n_classes), 1e-8, dtype=np.float32)
+    g2_b = np.full(n_classes, 1e-8, dtype=np.float32)
+    rng = np.random.default_rng(seed)
+
+    for _ in range(epochs):
+        for i in rng.permutation(len(data)):
+            rows, signs, y = data[i]
+            logits = signs @ weights[rows] + bias
+            logits -= logits.max()
+            probs = np.exp(logits)
+            probs /= probs.sum()
+            probs[y] -= 1.0
+            grad_w = signs[:, None] * probs[None, :] + l2 * weights[rows]
+            g2_w[rows] += grad_w ** 2
+            np.subtract.at(weights, rows, lr * grad_w / np.sqrt(g2_w[rows]))
+            g2_b += probs ** 2
+            bias -= lr * probs / np.sqrt(g2_b)
+
+    return ReflexModel(weights, bias, classes, dim)
+
+
+def evaluate(model, examples):
+    classes = set(model.classes)
+    known = [(t, l) for t, l in examples if l in classes]
+    if not known:
+        return 0.0
+    return sum(model.predict(t)[0] == l for t, l in known) / len(known)
+
+
+# --- VERSIONED ARTIFACTS ---
+def publish(model, model_dir=MODEL_DIR, keep=KEEP_VERSIONS):
+    os.makedirs(model_dir, exist_ok=True)
+    model.version = datetime.now().strftime("%Y%m%d%H%M%S%f")
+    path = os.path.join(model_dir, f"reflex-{model.version}.npz")
+    model.save(path)
+    tmp = os.path.join(model_dir, "CURRENT.tmp")
+    with open(tmp, "w") as f:
+        f.write(os.path.basename(path))
+    os.replace(tmp, os.path.join(model_dir, "CURRENT"))
+    # Engines hold their model in memory, so older files can go once CURRENT moved
+    versions = sorted(n for n in os.listdir(model_dir) if n.startswith("reflex-") and n.endswith(".npz"))
+    for name in versions[:-keep]:
+        os.remove(os.path.join(model_dir, name))
+    return path
+
+
+class ReflexRuntime:
+    # Holds the CURRENT model and hot-swaps it when a new version is published
+    def __init__(self, model_dir=MODEL_DIR, check_every=5.0):
+        self.model_dir = model_dir
+        self.check_every = check_every
+        self.model = None
+        self.current = None
+        self.last_check = 0.0
+        self.lock = threading.Lock()
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if now - self.last_check < self.check_every:
+            return
+        self.last_check = now
+        try:
+            with open(os.path.join(self.model_dir, "CURRENT")) as f:
+                name = f.read().strip()
+        except OSError:
+            return
+        if name and name != self.current:
+            # A bad artifact (truncated / corrupt .npz, missing keys) must not reach
+            # consult_llm: keep serving the previous model and skip this name until
+            # CURRENT points somewhere else
+            self.current = name
+            try:
+                self.model = ReflexModel.load(os.path.join(self.model_dir, name))
+            except Exception as e:
+                print(f"[REFLEX] Cannot load {name}, keeping "
+                      f"{self.model.version if self.model else 'no model'}: {e!r}", flush=True)
+
+    def predict(self, domain, source_event, threshold):
+        # The model's action if it is at least `threshold` confident, else None
+        with self.lock:
+            self._maybe_reload()
+            model = self.model
+        if model is None:
+            return None
+        label, confidence = model.predict(model_text(domain, source_event))
+        return label if confidence >= threshold else None
+
+
+# --- CLI ---
+def main():
+    parser = argparse.ArgumentParser(description="Synaptix reflex classifier")
+    sub = parser.add_subparsers(dest="command", required=True)
+    t = sub.add_parser("train", help="Fit on the audit trail and publish a new version")
+    t.add_argument("--min-count", type=int, default=2, help="Minimum examples per action label")
+    t.add_argument("--epochs", type=int, default=8)
+    t.add_argument("--holdout", type=float, default=0.2, help="Fraction held out for accuracy")
+    t.add_argument("--include-untagged", action="store_true",
+                   help="Also learn from decisions recorded before answered_by existed")
+    sub.add_parser("list", help="List published model versions")
+    args = parser.parse_args()
+
+    if args.command == "list":
+        current = None
+        if os.path.exists(os.path.join(MODEL_DIR, "CURRENT")):
+            with open(os.path.join(MODEL_DIR, "CURRENT")) as f:
+                current = f.read().strip()
+        for name in sorted(os.listdir(MODEL_DIR)) if os.path.isdir(MODEL_DIR) else []:
+            if name.endswith(".npz"):
+                meta = ReflexModel.load(os.path.join(MODEL_DIR, name)).meta
+                print(f"{'*' if name == current else ' '} {name}  {meta}")
+        return
+
+    examples = load_examples(include_untagged=args.include_untagged)
+    rng = np.random.default_rng(0)
+    order = rng.permutation(len(examples))
+    cut = int(len(examples) * (1 - args.holdout))
+    train_set = [examples[i] for i in order[:cut]]
+    test_set = [examples[i] for i in order[cut:]]
+    print(f"Training on {len(train_set)} decisions ({len(test_set)} held out)...")
+    model = train(train_set, min_count=args.min_count, epochs=args.epochs)
+    accuracy = evaluate(model, test_set)
+    model.meta = {"trained_at": datetime.now().isoformat(), "examples": len(train_set),
+                  "classes": len(model.classes), "holdout_accuracy": round(accuracy, 4)}
+    path = publish(model)
+    print(f"Published {path} ({len(model.classes)} actions, holdout accuracy {accuracy:.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+# --- STAND-IN RESPONSES ---
+# Prefixes of the answers consult_llm (pw_engine.py) returns when the LLM cannot be
+# used. Kept in this leaf module so the memo, the incident index and the reflex
+# trainer can recognise them without importing the engine.
+#
+# SKIP_RESPONSES are transient errors: retried, never memoized, indexed or learned.
+# FALLBACK_RESPONSES are canned entity-specific protocols, not decisions worth
+# learning from.
+
+AI_OFFLINE = "AI OFFLINE"                 # LLM call failed
+OFFLINE_PROTOCOL = "⚠️ OFFLINE PROTOCOL"  # No API key configured
+AUTO_PROTOCOL = "⚠️ AUTO-PROTOCOL"        # LLM rate-limited (429)
+
+SKIP_RESPONSES = (AI_OFFLINE,)
+FALLBACK_RESPONSES = (OFFLINE_PROTOCOL, AUTO_PROTOCOL)
+
+# Who answered, stored with every decision in agent_stream.jsonl as "answered_by".
+# The reflex model and incident recall answer from past decisions, so learning from
+# their answers would only reinforce earlier mistakes: only LEARNABLE_SOURCES are
+# trained on (HUMAN: decisions entered or reviewed by an operator).
+LLM = "llm"
+REFLEX = "reflex"
+RECALL = "recall"
+RULES = "rules"    # Deterministic protocol / offline stand-in
+HUMAN = "human"
+LEARNABLE_SOURCES = (LLM, HUMAN)
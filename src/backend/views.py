@@ -0,0 +1,114 @@
+import os
+from collections import deque
+from itertools import islice
+
+from domains import DOMAINS
+
+# --- MATERIALIZED "CURRENT STATE" VIEWS ---
+# Incrementally maintained latest-state per entity, so a freshly connected client
+# can be served the current picture at once instead of replaying history:
+#   finance    -> symbol:     last price / delta / news / sentiment
+#   healthcare -> patient_id: latest vitals
+#   dev        -> service:    last level / message + rolling error rate
+# Entries are stored as compact event records (see events.py) and only turned into
+# dicts when a snapshot is requested. What is tracked per domain (entity field,
+# rolling rates) comes from its registry entry in domains.py.
+#
+# Tables are kept in update order (an update moves the entity to the end), so the
+# least recently updated entity is evicted first once a table is full, and a
+# snapshot can return the most recently updated entities without sorting.
+
+# One table per registered domain (domains.py), keyed by its entity field
+ENTITY_KEYS = {name: d.entity_key for name, d in DOMAINS.items()}
+
+RATE_WINDOW = 50  # Last N events per entity used for a domain's rolling rate
+MAX_ENTITIES = int(os.environ.get("SYNAPTIX_VIEW_MAX_ENTITIES", 10_000))  # Per domain
+SNAPSHOT_ENTITIES = int(os.environ.get("SYNAPTIX_SNAPSHOT_ENTITIES", 500))  # Per domain, on connect
+
+
+class RateState:
+    # Latest event plus the share of the last RATE_WINDOW events matching `flag`
+    __slots__ = ("event", "window", "hits", "name", "flag")
+
+    def __init__(self, name, flag):
+        self.event = None
+        self.window = deque(maxlen=RATE_WINDOW)
+        self.hits = 0
+        self.name = name
+        self.flag = flag
+
+    def update(self, event):
+        hit = bool(self.flag(event))
+        if len(self.window) == self.window.maxlen and self.window[0]:
+            self.hits -= 1
+        self.window.append(hit)
+        self.hits += hit
+        self.event = event
+
+    def rate(self) -> float:
+        return round(self.hits / len(self.window), 4)
+
+    def to_dict(self) -> dict:
+        out = self.event.to_dict()
+        out[self.name] = self.rate()
+        return out
+
+
+class StateViews:
+    def __init__(self, max_entities=MAX_ENTITIES):
+        self.seq = 0
+        self.max_entities = max_entities
+        self.tables = {domain: {} for domain in ENTITY_KEYS}
+
+    def apply(self, domain: str, payload: dict) -> int:
+        # Returns the view sequence number after this event (0 if it was ignored)
+        table = self.tables.get(domain)
+        if table is None:
+            return 0
+        key = payload.get(ENTITY_KEYS[domain])
+        if key is None or "timestamp" not in payload:
+            return 0
+        definition = DOMAINS[domain]
+        try:
+            event = definition.event.from_dict(payload)
+        except (TypeError, ValueError):
+            return 0
+
+        entry = table.pop(key, None)
+        if definition.rate is not None:
+            if entry is None:
+                entry = RateState(*definition.rate)
+            entry.update(event)
+        else:
+            entry = event
+        table[key] = entry
+        if len(table) > self.max_entities:
+            del table[next(iter(table))]
+
+        self.seq += 1
+        return self.seq
+
+    def delta(self, domain: str, payload: dict) -> dict:
+        # payload as a client delta: with the entity's rolling rate after apply(),
+        # so clients folding deltas into a snapshot keep it current
+        entry = self.tables.get(domain, {}).get(payload.get(ENTITY_KEYS.get(domain)))
+        if isinstance(entry, RateState):
+            return {**payload, entry.name: entry.rate()}
+        return payload
+
+    def page(self, domain: str, limit, offset) -> dict:
+        # Entities ranked offset .. offset+limit by recency (all when limit is None),
+        # returned in update order (oldest first), like the table itself
+        end = None if limit is None else offset + limit
+        rows = list(islice(reversed(self.tables[domain].items()), offset, end))
+        return {key: entry.to_dict() for key, entry in reversed(rows)}
+
+    def snapshot(self, domain: str = None, limit: int = None, offset: int = 0) -> dict:
+        # A page of the most recently updated entities per domain; "total" has the
+        # full table sizes so clients can fetch the following pages
+        domains = [domain] if domain else list(self.tables)
+        return {
+            "seq": self.seq,
+            "views": {d: self.page(d, limit, offset) for d in domains},
+            "total": {d: len(self.tables[d]) for d in domains},
+        }
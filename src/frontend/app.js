@@ -7,6 +7,9 @@ const agentLog = document.getElementById('agent-log');
 // State
 let currentDomain = 'finance';
 let stats = { count: 0, anomalies: 0 };
+let stateSeq = 0;       // Sequence of the last applied server state
+let latestState = null; // Materialized views from the server snapshot
+let stateLimit = Infinity; // Entities kept per domain (the snapshot size)
 
 // Configuration for Polymorphism
 const DOMAIN_CONFIG = {
@@ -39,7 +42,16 @@ document.addEventListener('DOMContentLoaded', () => {
 ws.onmessage = (event) => {
     const message = JSON.parse(event.data);
 
-    if (message.type === 'data_update') {
+    if (message.type === 'snapshot') {
+        stateSeq = message.seq;
+        latestState = message.views;
+        stateLimit = message.limit || Infinity;
+        renderSnapshot();
+    } else if (message.type === 'data_update') {
+        // Deltas already folded into the snapshot are skipped
+        if (message.seq && message.seq <= stateSeq) return;
+        if (message.seq) stateSeq = message.seq;
+        foldIntoState(message.data);
         processPacket(message.data);
     } else if (message.type === 'agent_response') {
         logAgent(message.content);
@@ -99,6 +111,41 @@ function processPacket(data) {
         updateChart(0);
     }
 
+    renderFeedItem(data, isCritical);
+}
+
+// Keep the local copy of the views current so theme switches re-render fresh state
+const ENTITY_KEYS = { finance: 'symbol', healthcare: 'patient_id', dev: 'service' };
+
+function foldIntoState(data) {
+    if (!latestState || !latestState[data.domain]) return;
+    const key = data[ENTITY_KEYS[data.domain]];
+    if (key === undefined) return;
+    const table = latestState[data.domain];
+    // Re-insert so the table stays in update order, and drop the stalest entity past
+    // the snapshot size (the server keeps the full picture)
+    delete table[key];
+    // Deltas carry the server's recomputed rolling rate (e.g. error_rate) when the
+    // domain keeps one, so the new record replaces the old one as a whole
+    table[key] = data;
+    const keys = Object.keys(table);
+    if (keys.length > stateLimit) delete table[keys[0]];
+}
+
+// Render the current state of every entity in the active domain (no agent replay)
+function renderSnapshot() {
+    if (!latestState) return;
+    const backendDomain = currentDomain === 'health' ? 'healthcare' : currentDomain;
+    const rows = Object.values(latestState[backendDomain] || {});
+    rows.sort((a, b) => a.timestamp.localeCompare(b.timestamp));
+    rows.forEach(row => {
+        row.domain = backendDomain;
+        const isCritical = row.status === 'CRITICAL' || row.level === 'ERROR' || row.level === 'FATAL';
+        renderFeedItem(row, isCritical);
+    });
+}
+
+function renderFeedItem(data, isCritical) {
     // Render Feed Item
     const item = document.createElement('div');
     item.className = `feed-item ${isCritical ? 'critical' : ''}`;
@@ -288,6 +335,7 @@ window.switchTheme = (domain) => {
 
     stats.anomalies = savedAnoms; // Sync local var
     document.getElementById('stat-3-value').innerText = savedAnoms;
+    renderSnapshot();
 
 
 
@@ -2,32 +2,51 @@ import time
 import json
 import random
 import os
+import sys
 from datetime import datetime
 from termcolor import colored
 
+# NumPy is only needed for the vectorized batch generators
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except (ImportError, ModuleNotFoundError):
+    NUMPY_AVAILABLE = False
+    np = None
+
 # Configuration
 BASE_DIR = os.getcwd() # Run from project root
 DATA_DIR = os.path.join(BASE_DIR, "data", "live_feed")
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# Feed file names come from the backend's domain registry
+sys.path.insert(0, os.path.join(BASE_DIR, "src", "backend"))
+from domains import DOMAINS as REGISTRY  # noqa: E402
+
 DOMAINS = {
     "finance": {
-        "file": os.path.join(DATA_DIR, "finance.jsonl"),
+        "file": os.path.join(DATA_DIR, REGISTRY["finance"].feed),
         "symbols": ["PATH", "GOOGL", "NVDA", "MSFT", "TSLA"],
         "events": ["Earnings Beat", "FDA Approval", "CEO Scandal", "Product Launch"]
     },
     "healthcare": {
-        "file": os.path.join(DATA_DIR, "healthcare.jsonl"),
+        "file": os.path.join(DATA_DIR, REGISTRY["healthcare"].feed),
         "patients": ["P-101", "P-102", "P-205", "P-999"],
         "alerts": ["Tachycardia", "Bradycardia", "Stable", "O2 Saturation Drop"]
     },
     "developer": {
-        "file": os.path.join(DATA_DIR, "developer.jsonl"),
+        "file": os.path.join(DATA_DIR, REGISTRY["dev"].feed),
         "services": ["Auth-Service", "Payment-Gateway", "Frontend-X", "DB-Shard-01"],
         "errors": ["ConnectionRefused", "Timeout", "SegFault", "DeploySuccess"]
     }
 }
 
+# Feeds are rotated once they pass this size (0 = grow without bound, the default):
+# the full file becomes <feed>.1 (replacing the previous one) and writing continues
+# in a new file. The API tailer and the mock engine follow the rotation by inode;
+# the Pathway reader has not been verified against it, so leave this off there.
+FEED_MAX_BYTES = int(float(os.environ.get("SYNAPTIX_FEED_MAX_MB", 0)) * 1024 * 1024)
+
 # Default Rules
 RULES = {
     "max_bpm": 140,
@@ -35,6 +54,40 @@ RULES = {
     "max_latency": 2000 # 2000ms
 }
 
+# Crisis Scenarios (shared by the per-event and batch generators)
+FINANCE_CRISES = [
+    ("CRASH", "Market Halted: Algorithms Cascading", "bearish"),
+    ("LIQUIDITY", "Flash Crash: 0-Day Liquidity Dried Up", "bearish"),
+    ("REG-HALT", "SEC Probe: Trading Suspended indefinitely", "neutral"),
+    ("FOREX", "Currency Devaluation: Hyperinflation Alert", "bearish"),
+    ("CRYPTO", "Exchange Hack: 50k BTC Stolen", "bearish"),
+    ("LATENCY", "Arbitrage Attack: Latency Spike Detected", "bearish"),
+    ("DARK-POOL", "Dark Pool Leak: Insider Trading Suspected", "bearish"),
+    ("QUANTUM", "Quantum Decryption Risk: Keys Compromised", "bearish")
+]
+
+MEDICAL_EMERGENCIES = [
+    ("V-FIB", "Ventricular Fibrillation - Code Blue", 0, 60),
+    ("SEPSIS", "Septic Shock - BP Critical", 145, 88),
+    ("ANAPHYLAXIS", "Allergic Reaction - Airway Closing", 160, 85),
+    ("STROKE", "CVA Detected - Left Side Paralysis", 90, 92),
+    ("HEMORRHAGE", "Internal Bleeding - Hypovolemic Shock", 170, 80),
+    ("PACEMAKER", "Pacemaker Malfunction - Signal Lost", 40, 90),
+    ("ROBOTICS", "Remote Surgery Latency - Connection Unstable", 100, 98),
+    ("AI-ERROR", "AI Misdiagnosis Alert - Override Required", 80, 99)
+]
+
+TECH_DISASTERS = [
+    ("DB-MASTER", "Database Corruption: WAL Log Mismatch"),
+    ("K8S-CLUSTER", "CrashLoopBackOff: Control Plane Down"),
+    ("SECURITY", "DDoS Detected: 50M RPS /packet-flood"),
+    ("PAYMENTS", "Double Spending Detected: Race Condition"),
+    ("STORAGE", "S3 Bucket Deleted: Production Assets Missing"),
+    ("RANSOMWARE", "Ransomware Encrypting Pods - Immediate Isolation"),
+    ("LEAK", "API Key Leak in Public Repo - Revocation Needed"),
+    ("LAMBDA", "Recursive Lambda Bomb - Cost Spike")
+]
+
 def generate_finance(force_critical=False, is_chaos=False):
     symbol = random.choice(DOMAINS["finance"]["symbols"])
     
@@ -51,17 +104,7 @@ def generate_finance(force_critical=False, is_chaos=False):
 
         if force_critical or rule_break:
             # Variety of Financial Crises
-            crises = [
-                ("CRASH", "Market Halted: Algorithms Cascading", "bearish"),
-                ("LIQUIDITY", "Flash Crash: 0-Day Liquidity Dried Up", "bearish"),
-                ("REG-HALT", "SEC Probe: Trading Suspended indefinitely", "neutral"),
-                ("FOREX", "Currency Devaluation: Hyperinflation Alert", "bearish"),
-                ("CRYPTO", "Exchange Hack: 50k BTC Stolen", "bearish"),
-                ("LATENCY", "Arbitrage Attack: Latency Spike Detected", "bearish"),
-                ("DARK-POOL", "Dark Pool Leak: Insider Trading Suspected", "bearish"),
-                ("QUANTUM", "Quantum Decryption Risk: Keys Compromised", "bearish")
-            ]
-            c_sym, c_news, c_sent = random.choice(crises)
+            c_sym, c_news, c_sent = random.choice(FINANCE_CRISES)
             symbol = c_sym
             change = -round(random.uniform(20, 50), 2)
             event = c_news
@@ -95,17 +138,7 @@ def generate_health(force_critical=False, is_chaos=False):
         if force_critical:
             status = "CRITICAL"
             # Randomize Medical Emergencies
-            emergencies = [
-                ("V-FIB", "Ventricular Fibrillation - Code Blue", 0, 60),
-                ("SEPSIS", "Septic Shock - BP Critical", 145, 88),
-                ("ANAPHYLAXIS", "Allergic Reaction - Airway Closing", 160, 85),
-                ("STROKE", "CVA Detected - Left Side Paralysis", 90, 92),
-                ("HEMORRHAGE", "Internal Bleeding - Hypovolemic Shock", 170, 80),
-                ("PACEMAKER", "Pacemaker Malfunction - Signal Lost", 40, 90),
-                ("ROBOTICS", "Remote Surgery Latency - Connection Unstable", 100, 98),
-                ("AI-ERROR", "AI Misdiagnosis Alert - Override Required", 80, 99)
-            ]
-            e_code, e_note, e_bpm, e_spo2 = random.choice(emergencies)
+            e_code, e_note, e_bpm, e_spo2 = random.choice(MEDICAL_EMERGENCIES)
             
             bpm = e_bpm if e_bpm != 0 else 0
             notes = e_note
@@ -138,17 +171,7 @@ def generate_dev(force_critical=False, is_chaos=False):
         if force_critical:
             level = "FATAL"
             # Randomized Tech Disasters
-            disasters = [
-                ("DB-MASTER", "Database Corruption: WAL Log Mismatch"),
-                ("K8S-CLUSTER", "CrashLoopBackOff: Control Plane Down"),
-                ("SECURITY", "DDoS Detected: 50M RPS /packet-flood"),
-                ("PAYMENTS", "Double Spending Detected: Race Condition"),
-                ("STORAGE", "S3 Bucket Deleted: Production Assets Missing"),
-                ("RANSOMWARE", "Ransomware Encrypting Pods - Immediate Isolation"),
-                ("LEAK", "API Key Leak in Public Repo - Revocation Needed"),
-                ("LAMBDA", "Recursive Lambda Bomb - Cost Spike")
-            ]
-            c_svc, c_msg = random.choice(disasters)
+            c_svc, c_msg = random.choice(TECH_DISASTERS)
             service = c_svc
             msg = c_msg
             action = True
@@ -166,6 +189,496 @@ def generate_dev(force_critical=False, is_chaos=False):
         "action_required": action
     }
 
+# --- VECTORIZED BATCH GENERATORS ---
+# Same distributions, rule checks and crisis injection as the per-event generators
+# above, but N events at a time. A batch is columnar: a dict of NumPy arrays keyed
+# by wire field name ("type" is a scalar). `force_critical` may be a bool or a bool
+# array of length n; `crisis_rate` additionally forces that fraction of rows in chaos.
+
+def _crisis_mask(n, force_critical, crisis_rate, rng):
+    mask = np.broadcast_to(np.asarray(force_critical, dtype=bool), (n,)).copy()
+    if crisis_rate > 0:
+        mask |= rng.random(n) < crisis_rate
+    return mask
+
+def _column(rows, col, dtype=object):
+    return np.array([r[col] for r in rows], dtype=dtype)
+
+def _batch_timestamps(n, spacing_us=1):
+    start = np.datetime64(datetime.now(), "us")
+    return start + np.arange(n, dtype=np.int64) * np.timedelta64(spacing_us, "us")
+
+def generate_finance_batch(n, force_critical=False, is_chaos=False, crisis_rate=0.0, rng=None):
+    rng = rng or np.random.default_rng()
+    symbols = np.array(DOMAINS["finance"]["symbols"], dtype=object)
+
+    symbol = symbols[rng.integers(0, len(symbols), n)]
+    price = np.round(rng.uniform(100, 1500, n), 2)
+    change = np.round(rng.uniform(-5, 5, n), 2)
+    sentiment = np.where(change > 0, "bullish", "bearish").astype(object)
+    news = np.full(n, "Regular Trading", dtype=object)
+
+    if is_chaos:
+        droppct = np.abs(change / price * 100)
+        rule_break = (change < 0) & (droppct > RULES["max_drawdown"])
+        crit = _crisis_mask(n, force_critical, crisis_rate, rng) | rule_break
+        k = int(crit.sum())
+        if k:
+            pick = rng.integers(0, len(FINANCE_CRISES), k)
+            symbol[crit] = _column(FINANCE_CRISES, 0)[pick]
+            news[crit] = _column(FINANCE_CRISES, 1)[pick]
+            sentiment[crit] = _column(FINANCE_CRISES, 2)[pick]
+            change[crit] = -np.round(rng.uniform(20, 50, k), 2)
+
+    return {
+        "timestamp": _batch_timestamps(n),
+        "type": "market_tick",
+        "symbol": symbol,
+        "price": price,
+        "delta": change,
+        "news": news,
+        "sentiment": sentiment
+    }
+
+def generate_health_batch(n, force_critical=False, is_chaos=False, crisis_rate=0.0, rng=None):
+    rng = rng or np.random.default_rng()
+    patients = np.array(DOMAINS["healthcare"]["patients"], dtype=object)
+
+    patient = patients[rng.integers(0, len(patients), n)]
+    bpm = rng.integers(60, 101, n)
+    spo2 = rng.integers(95, 101, n)
+    status = np.full(n, "NORMAL", dtype=object)
+    notes = np.full(n, "Vitals Stable", dtype=object)
+
+    if is_chaos:
+        bpm = rng.integers(60, 161, n)
+        rule_break = bpm > RULES["max_bpm"]
+        forced = _crisis_mask(n, force_critical, crisis_rate, rng)
+        k = int(forced.sum())
+        if k:
+            pick = rng.integers(0, len(MEDICAL_EMERGENCIES), k)
+            status[forced] = "CRITICAL"
+            notes[forced] = _column(MEDICAL_EMERGENCIES, 1)[pick]
+            bpm[forced] = _column(MEDICAL_EMERGENCIES, 2, np.int64)[pick]
+            spo2[forced] = _column(MEDICAL_EMERGENCIES, 3, np.int64)[pick]
+        breach = rule_break & ~forced
+        if breach.any():
+            status[breach] = "CRITICAL"
+            notes[breach] = [f"Rule Breach: BPM {b} > {RULES['max_bpm']}" for b in bpm[breach].tolist()]
+            spo2[breach] = 85
+
+    return {
+        "timestamp": _batch_timestamps(n),
+        "type": "vitals",
+        "patient_id": patient,
+        "bpm": bpm,
+        "spo2": spo2,
+        "status": status,
+        "notes": notes
+    }
+
+def generate_dev_batch(n, force_critical=False, is_chaos=False, crisis_rate=0.0, rng=None):
+    rng = rng or np.random.default_rng()
+    services = np.array(DOMAINS["developer"]["services"], dtype=object)
+
+    service = services[rng.integers(0, len(services), n)]
+    level = np.full(n, "INFO", dtype=object)
+    msg = np.full(n, "Health Check OK", dtype=object)
+    action = np.zeros(n, dtype=bool)
+
+    if is_chaos:
+        latency = rng.integers(10, 3001, n)
+        rule_break = latency > RULES["max_latency"]
+        forced = _crisis_mask(n, force_critical, crisis_rate, rng)
+        k = int(forced.sum())
+        if k:
+            pick = rng.integers(0, len(TECH_DISASTERS), k)
+            level[forced] = "FATAL"
+            service[forced] = _column(TECH_DISASTERS, 0)[pick]
+            msg[forced] = _column(TECH_DISASTERS, 1)[pick]
+        breach = rule_break & ~forced
+        if breach.any():
+            level[breach] = "ERROR"
+            msg[breach] = [f"SLA Breach: {l}ms" for l in latency[breach].tolist()]
+        action = forced | breach
+
+    return {
+        "timestamp": _batch_timestamps(n),
+        "type": "syslog",
+        "service": service,
+        "level": level,
+        "message": msg,
+        "action_required": action
+    }
+
+BATCH_GENERATORS = {
+    "finance": generate_finance_batch,
+    "healthcare": generate_health_batch,
+    "developer": generate_dev_batch
+}
+
+# NDJSON encoding is vectorized too: every field is rendered into a fixed-width
+# byte column (strings from a per-batch vocabulary, numbers digit-by-digit), padded
+# with NUL bytes, and the columns are stitched into one buffer. JSON text never
+# contains a raw NUL, so a single mask pass then drops the padding and the lines
+# come out as compact as json.dumps writes them.
+# Floats are 2-decimal fixed point ("1.70"), which round-trips the rounded prices
+# exactly.
+_NDJSON_FIELDS = {
+    "market_tick": (("symbol", "str"), ("price", "fixed2"), ("delta", "fixed2"), ("news", "str"), ("sentiment", "str")),
+    "vitals": (("patient_id", "str"), ("bpm", "int"), ("spo2", "int"), ("status", "str"), ("notes", "str")),
+    "syslog": (("service", "str"), ("level", "str"), ("message", "str"), ("action_required", "bool"))
+}
+
+class Coded:
+    # Pre-encoded string column for large fixed vocabularies (e.g. 100k entity names):
+    # row codes into a table built once with coded_table(), instead of re-encoding
+    # every distinct value in every batch
+    __slots__ = ("codes", "table")
+
+    def __init__(self, codes, table):
+        self.codes = codes
+        self.table = table
+
+    def __len__(self):
+        return self.codes.size
+
+def coded_table(values):
+    # NumPy pads the fixed-width entries with NULs (stripped by encode_ndjson)
+    encoded = [json.dumps(v).encode("utf-8") for v in values]
+    width = max(len(e) for e in encoded)
+    return np.array(encoded, dtype=f"S{width}")
+
+def _literal(n, text):
+    raw = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+    return np.broadcast_to(raw, (n, raw.size))
+
+def _table_block(codes, encoded):
+    width = max(len(e) for e in encoded)
+    table = np.array(encoded, dtype=f"S{width}")
+    return table[codes].view(np.uint8).reshape(codes.size, width)
+
+def _vocab_block(values, encode=json.dumps):
+    index = dict.fromkeys(values)
+    for i, key in enumerate(index):
+        index[key] = i
+    codes = np.fromiter(map(index.__getitem__, values), dtype=np.int64, count=len(values))
+    return _table_block(codes, [encode(v).encode("utf-8") for v in index])
+
+def _digits_block(magnitude, negative, min_digits=1):
+    # Right-aligned decimal digits of non-negative ints, NUL padded, '-' in front
+    n = magnitude.size
+    top = int(magnitude.max(initial=0))
+    powers = 10 ** np.arange(1, len(str(top)) + 1, dtype=np.int64)
+    ndig = np.maximum(min_digits, np.searchsorted(powers, magnitude, side="right") + 1)
+    width = int(ndig.max(initial=min_digits)) + int(negative.any())
+    out = np.zeros((n, width), dtype=np.uint8)
+    rest = magnitude.astype(np.int64 if top >= 2**31 else np.int32)
+    for i in range(width - 1, -1, -1):
+        place = width - 1 - i
+        rest, digit = np.divmod(rest, 10)
+        np.copyto(out[:, i], digit + ord("0"), where=place < ndig, casting="unsafe")
+    rows = np.nonzero(negative)[0]
+    out[rows, width - 1 - ndig[rows]] = ord("-")
+    return out
+
+def _number_block(col, kind):
+    if kind == "int":
+        return _digits_block(np.abs(col).astype(np.int64), col < 0)
+    cents = np.rint(np.abs(col) * 100).astype(np.int64)
+    whole = _digits_block(cents // 100, np.signbit(col))
+    frac = _digits_block(cents % 100, np.zeros(col.size, dtype=bool), min_digits=2)
+    return np.concatenate([whole, _literal(col.size, "."), frac], axis=1)
+
+def _timestamp_block(ts):
+    # "YYYY-MM-DDTHH:MM:SS" (fixed width) from the few distinct seconds, then ".ffffff"
+    us = ts.astype("datetime64[us]").astype(np.int64)
+    seconds, micros = np.divmod(us, 1_000_000)
+    # Batch timestamps usually span a few seconds: index into that range directly
+    lo, hi = int(seconds.min()), int(seconds.max())
+    if hi - lo <= seconds.size:
+        span, codes = np.arange(lo, hi + 1), seconds - lo
+    else:
+        span, codes = np.unique(seconds, return_inverse=True)
+    stamps = np.datetime_as_string(span.astype("datetime64[s]")).tolist()
+    return np.concatenate([
+        _literal(ts.size, '"'),
+        _table_block(codes.reshape(-1), [t.encode("ascii") for t in stamps]),
+        _literal(ts.size, "."),
+        _digits_block(micros, np.zeros(ts.size, dtype=bool), min_digits=6),
+        _literal(ts.size, '"')
+    ], axis=1)
+
+def encode_ndjson(batch) -> bytes:
+    kind = batch["type"]
+    n = batch["timestamp"].size
+    if n == 0:
+        return b""
+    blocks = [
+        _literal(n, '{"timestamp": '),
+        _timestamp_block(batch["timestamp"]),
+        _literal(n, f', "type": "{kind}"')
+    ]
+    for name, enc in _NDJSON_FIELDS[kind]:
+        col = batch[name]
+        blocks.append(_literal(n, f', "{name}": '))
+        if isinstance(col, Coded):
+            blocks.append(col.table[col.codes].view(np.uint8).reshape(len(col), -1))
+        elif enc in ("str", "bool"):
+            blocks.append(_vocab_block(col.tolist()))
+        else:
+            blocks.append(_number_block(col, enc))
+    blocks.append(_literal(n, "}\n"))
+    buf = np.concatenate(blocks, axis=1).reshape(-1)
+    return buf[buf != 0].tobytes()
+
+def rotate_feed(path):
+    # Never truncate in place: a reader that fell behind would resume mid-line in
+    # the regrown file. Readers finish <feed>.1 before switching (feeds.py).
+    os.replace(path, path + ".1")
+
+def append_batch(domain, batch):
+    path = DOMAINS[domain]["file"]
+    f = open(path, "ab")
+    if FEED_MAX_BYTES and f.tell() > FEED_MAX_BYTES:
+        f.close()
+        rotate_feed(path)
+        f = open(path, "ab")
+    with f:
+        f.write(encode_ndjson(batch))
+
+def cap_feeds():
+    # Keep long runs from filling the disk: rotate every feed past FEED_MAX_BYTES
+    if not FEED_MAX_BYTES:
+        return
+    for d in DOMAINS.values():
+        if os.path.exists(d["file"]) and os.path.getsize(d["file"]) > FEED_MAX_BYTES:
+            rotate_feed(d["file"])
+
+# --- LARGE-POPULATION SIMULATION ---
+# `python src/generators/sim_engine.py fleet` simulates whole fleets instead of the
+# demo's handful of entities: every patient / symbol / service emits at its own
+# (lognormal) rate and runs a NORMAL -> CRISIS -> NORMAL state machine with
+# exponentially distributed onsets and durations. A hashed timer wheel fires the
+# entities in event-time order; each frame of fired entities is generated and
+# NDJSON-encoded as one columnar batch per domain.
+#
+#   --speed 1   wall clock (default): frames are released in real time
+#   --speed 60  virtual clock, 60x faster than real time
+#   --speed 0   virtual clock, as fast as the machine allows (stress mode)
+
+NORMAL, CRISIS = 0, 1
+CRISIS_RATE_BOOST = 5.0  # Entities in crisis emit this many times faster
+
+class TimerWheel:
+    # Hashed timing wheel: `slots` buckets of `tick` seconds. Entities due more than
+    # one revolution ahead wait in their bucket until their round comes up, so
+    # scheduling and expiry are O(1) per entity and work on whole id arrays.
+    def __init__(self, n, tick=0.01, slots=4096):
+        self.tick = tick
+        self.slots = slots
+        self.due = np.zeros(n, dtype=np.int64)  # Absolute due tick per entity
+        self.buckets = [[] for _ in range(slots)]
+        self.now = 0  # Next tick to expire
+
+    def schedule(self, ids, at):
+        # Fire `ids` at virtual times `at` (seconds), no earlier than the next tick
+        if ids.size == 0:
+            return
+        due = np.maximum((at / self.tick).astype(np.int64), self.now)
+        self.due[ids] = due
+        slot = due % self.slots
+        order = np.argsort(slot, kind="stable")
+        slot, ids = slot[order], ids[order]
+        starts = np.r_[0, np.flatnonzero(np.diff(slot)) + 1]
+        ends = np.r_[starts[1:], slot.size]
+        for s, a, b in zip(slot[starts].tolist(), starts.tolist(), ends.tolist()):
+            self.buckets[s].append(ids[a:b])
+
+    def expire(self):
+        # Ids due at the current tick; advances the wheel by one tick
+        index = self.now % self.slots
+        bucket = self.buckets[index]
+        self.now += 1
+        if not bucket:
+            return np.empty(0, dtype=np.int64)
+        ids = np.concatenate(bucket) if len(bucket) > 1 else bucket[0]
+        later = self.due[ids] >= self.now
+        if later.any():
+            self.buckets[index] = [ids[later]]
+            return ids[~later]
+        self.buckets[index] = []
+        return ids
+
+class Population:
+    # One domain's fleet: entity names, emission rates and crisis state machines.
+    # Times are virtual seconds since the start of the run.
+    def __init__(self, domain, names, rate, crisis_every, crisis_duration, rng, tick=0.01):
+        n = len(names)
+        self.domain = domain
+        self.names = coded_table(names)
+        self.rng = rng
+        self.crisis_every = crisis_every
+        self.crisis_duration = crisis_duration
+        self.rate = rng.lognormal(np.log(rate), 0.5, n)
+        self.state = np.full(n, NORMAL, dtype=np.int8)
+        self.crisis_at = rng.exponential(crisis_every, n)
+        self.crisis_end = np.full(n, np.inf)
+        self.scenario = np.zeros(n, dtype=np.int64)
+        self.next_at = rng.exponential(1.0 / self.rate)
+        self.base_price = np.round(rng.uniform(10, 1500, n), 2)
+        self.price = self.base_price.copy()
+        self.wheel = TimerWheel(n, tick)
+        self.wheel.schedule(np.arange(n), self.next_at)
+
+    def fire(self, ids):
+        # Advance the state machines of `ids` to their event time and reschedule
+        # them; returns (event times, in-crisis mask)
+        t = self.next_at[ids]
+        normal = self.state[ids] == NORMAL
+        onset = normal & (self.crisis_at[ids] <= t)
+        starting = ids[onset]
+        self.state[starting] = CRISIS
+        self.crisis_end[starting] = t[onset] + self.rng.exponential(self.crisis_duration, starting.size)
+        self.scenario[starting] = self.rng.integers(0, 1 << 30, starting.size)
+        recover = ~normal & (self.crisis_end[ids] <= t)
+        ending = ids[recover]
+        self.state[ending] = NORMAL
+        self.crisis_at[ending] = t[recover] + self.rng.exponential(self.crisis_every, ending.size)
+        self.crisis_end[ending] = np.inf
+
+        crisis = self.state[ids] == CRISIS
+        rate = self.rate[ids] * np.where(crisis, CRISIS_RATE_BOOST, 1.0)
+        self.next_at[ids] = t + self.rng.exponential(1.0 / rate)
+        self.wheel.schedule(ids, self.next_at[ids])
+        return t, crisis
+
+    def in_crisis(self):
+        return int(np.count_nonzero(self.state == CRISIS))
+
+# Fleet event generators: (population, ids, timestamps, in-crisis mask) -> batch
+def fleet_finance_batch(pop, ids, ts, crisis):
+    n = ids.size
+    rng = pop.rng
+    price = pop.price[ids]
+    # Mean-reverting random walk; crises knock 2-8% off per tick
+    delta = (pop.base_price[ids] - price) * 0.01 + price * rng.normal(0, 0.002, n)
+    delta[crisis] = -price[crisis] * rng.uniform(0.02, 0.08, int(crisis.sum()))
+    delta = np.round(delta, 2)
+    price = np.maximum(np.round(price + delta, 2), 0.01)
+    pop.price[ids] = price
+    news = np.full(n, "Regular Trading", dtype=object)
+    sentiment = np.where(delta > 0, "bullish", "bearish").astype(object)
+    pick = pop.scenario[ids[crisis]] % len(FINANCE_CRISES)
+    news[crisis] = _column(FINANCE_CRISES, 1)[pick]
+    sentiment[crisis] = _column(FINANCE_CRISES, 2)[pick]
+    return {"timestamp": ts, "type": "market_tick", "symbol": Coded(ids, pop.names), "price": price,
+            "delta": delta, "news": news, "sentiment": sentiment}
+
+def fleet_health_batch(pop, ids, ts, crisis):
+    n = ids.size
+    rng = pop.rng
+    bpm = rng.integers(60, 101, n)
+    spo2 = rng.integers(95, 101, n)
+    status = np.full(n, "NORMAL", dtype=object)
+    notes = np.full(n, "Vitals Stable", dtype=object)
+    pick = pop.scenario[ids[crisis]] % len(MEDICAL_EMERGENCIES)
+    status[crisis] = "CRITICAL"
+    notes[crisis] = _column(MEDICAL_EMERGENCIES, 1)[pick]
+    bpm[crisis] = _column(MEDICAL_EMERGENCIES, 2, np.int64)[pick]
+    spo2[crisis] = _column(MEDICAL_EMERGENCIES, 3, np.int64)[pick]
+    return {"timestamp": ts, "type": "vitals", "patient_id": Coded(ids, pop.names), "bpm": bpm,
+            "spo2": spo2, "status": status, "notes": notes}
+
+def fleet_dev_batch(pop, ids, ts, crisis):
+    n = ids.size
+    level = np.full(n, "INFO", dtype=object)
+    msg = np.full(n, "Health Check OK", dtype=object)
+    pick = pop.scenario[ids[crisis]] % len(TECH_DISASTERS)
+    level[crisis] = "FATAL"
+    msg[crisis] = _column(TECH_DISASTERS, 1)[pick]
+    return {"timestamp": ts, "type": "syslog", "service": Coded(ids, pop.names), "level": level,
+            "message": msg, "action_required": crisis.copy()}
+
+FLEET_GENERATORS = {
+    "finance": fleet_finance_batch,
+    "healthcare": fleet_health_batch,
+    "developer": fleet_dev_batch
+}
+
+def build_fleet(patients=100_000, symbols=10_000, services=2_000, rates=(1.0, 0.2, 0.5),
+                crisis_every=3600.0, crisis_duration=30.0, tick=0.01, seed=None):
+    rng = np.random.default_rng(seed)
+    sizes = {"finance": symbols, "healthcare": patients, "developer": services}
+    names = {
+        "finance": [f"TKR{i:05d}" for i in range(symbols)],
+        "healthcare": [f"P-{i:06d}" for i in range(patients)],
+        "developer": [f"svc-{i:04d}" for i in range(services)]
+    }
+    return [Population(domain, names[domain], rate, crisis_every, crisis_duration, rng, tick)
+            for domain, rate in zip(sizes, rates) if sizes[domain]]
+
+def step_fleet(populations, frame_ticks, start_us):
+    # Expire `frame_ticks` ticks of every population; returns {domain: batch}
+    batches = {}
+    for pop in populations:
+        fired_ids, fired_t, fired_crisis = [], [], []
+        for _ in range(frame_ticks):
+            ids = pop.wheel.expire()
+            if ids.size:
+                t, crisis = pop.fire(ids)
+                fired_ids.append(ids)
+                fired_t.append(t)
+                fired_crisis.append(crisis)
+        if not fired_ids:
+            continue
+        ids, t, crisis = np.concatenate(fired_ids), np.concatenate(fired_t), np.concatenate(fired_crisis)
+        order = np.argsort(t, kind="stable")
+        ids, t, crisis = ids[order], t[order], crisis[order]
+        ts = start_us + (t * 1e6).astype(np.int64).astype("timedelta64[us]")
+        batches[pop.domain] = FLEET_GENERATORS[pop.domain](pop, ids, ts, crisis)
+    return batches
+
+def run_fleet(patients=100_000, symbols=10_000, services=2_000, speed=1.0, duration=0.0,
+              crisis_every=3600.0, crisis_duration=30.0, tick=0.01, frame=0.1, seed=None):
+    if not NUMPY_AVAILABLE:
+        raise SystemExit("Fleet simulation requires NumPy (pip install numpy)")
+    print(colored("Starting Synaptix Fleet Simulation...", "green", attrs=["bold"]))
+    print(f"{symbols:,} symbols, {patients:,} patients, {services:,} services -> {DATA_DIR}")
+    clock = "wall clock" if speed == 1 else ("virtual clock, unthrottled" if speed <= 0 else f"virtual clock x{speed:g}")
+    print(colored(f"--- {clock} ---", "cyan"))
+
+    populations = build_fleet(patients, symbols, services, crisis_every=crisis_every,
+                              crisis_duration=crisis_duration, tick=tick, seed=seed)
+    for d in DOMAINS.values():
+        open(d["file"], 'w').close()
+
+    frame_ticks = max(1, round(frame / tick))
+    start_us = np.datetime64(datetime.now(), "us")
+    wall_start = last_report = time.perf_counter()
+    virtual = 0.0
+    emitted = reported = 0
+    while not duration or virtual < duration:
+        batches = step_fleet(populations, frame_ticks, start_us)
+        virtual += frame_ticks * tick
+        for domain, batch in batches.items():
+            append_batch(domain, batch)
+            emitted += batch["timestamp"].size
+
+        now = time.perf_counter()
+        if speed > 0:
+            ahead = wall_start + virtual / speed - now
+            if ahead > 0:
+                time.sleep(ahead)
+        if now - last_report >= 5.0:
+            rate = (emitted - reported) / (now - last_report)
+            crises = sum(pop.in_crisis() for pop in populations)
+            lag = max(0.0, now - wall_start - virtual / speed) if speed > 0 else 0.0
+            print(f"[FLEET] t={virtual:,.0f}s  {rate:,.0f} events/s  {crises:,} entities in crisis  lag {lag:.2f}s",
+                  flush=True)
+            last_report, reported = now, emitted
+    return emitted
+
 def run_simulation():
     print(colored("Starting Synaptix Data Simulation Engine...", "green", attrs=["bold"]))
     print(f"Feeding data to {DATA_DIR}")
@@ -267,9 +780,33 @@ def run_simulation():
         if should_trigger_critical:
             events_triggered += 1
 
+        cap_feeds()
+
         # Slower Tick Rate to Prevent API Flood
         time.sleep(random.uniform(1.5, 3.0))
         domain_cycle += 1
 
 if __name__ == "__main__":
-    run_simulation()
+    import argparse
+    parser = argparse.ArgumentParser(description="Synaptix data simulator")
+    sub = parser.add_subparsers(dest="command")
+    f = sub.add_parser("fleet", help="Large-population simulation (timer-wheel scheduler)")
+    f.add_argument("--patients", type=int, default=100_000)
+    f.add_argument("--symbols", type=int, default=10_000)
+    f.add_argument("--services", type=int, default=2_000)
+    f.add_argument("--speed", type=float, default=1.0, help="Virtual seconds per wall second (0 = unthrottled)")
+    f.add_argument("--duration", type=float, default=0.0, help="Stop after this many virtual seconds (0 = run forever)")
+    f.add_argument("--crisis-every", type=float, default=3600.0, help="Mean seconds between crises per entity")
+    f.add_argument("--crisis-duration", type=float, default=30.0, help="Mean crisis length in seconds")
+    f.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    # kill -USR1 <pid>: sampling profile, kill -USR2: memory snapshot -> data/profiles/ (profiler.py)
+    from profiler import install_signal_handler
+    install_signal_handler("sim_engine")
+
+    if args.command == "fleet":
+        run_fleet(args.patients, args.symbols, args.services, speed=args.speed, duration=args.duration,
+                  crisis_every=args.crisis_every, crisis_duration=args.crisis_duration, seed=args.seed)
+    else:
+        run_simulation()